@@ -0,0 +1,29 @@
+"""블로그 목록 커서 인덱스 추가
+
+Revision ID: 3c1f9a7d2b64
+Revises: ef5762bcf479
+Create Date: 2025-09-22 10:12:41.503218
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f9a7d2b64"
+down_revision: str | Sequence[str] | None = "ef5762bcf479"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_blog_modified_dt_id", "blog", ["modified_dt", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_blog_modified_dt_id", table_name="blog")
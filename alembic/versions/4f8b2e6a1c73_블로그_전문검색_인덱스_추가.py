@@ -0,0 +1,35 @@
+"""블로그 전문검색 인덱스 추가
+
+Revision ID: 4f8b2e6a1c73
+Revises: d7a3f91c2e48
+Create Date: 2025-09-27 15:22:08.734219
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f8b2e6a1c73"
+down_revision: str | Sequence[str] | None = "d7a3f91c2e48"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 한국어 검색을 위해 MySQL 내장 ngram 파서(기본 토큰 크기 2)를 사용합니다.
+    op.create_index(
+        "ft_blog_title_content",
+        "blog",
+        ["title", "content"],
+        unique=False,
+        mysql_prefix="FULLTEXT",
+        mysql_with_parser="ngram",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ft_blog_title_content", table_name="blog")
@@ -0,0 +1,46 @@
+"""댓글수 태그사용수 카운터 추가
+
+Revision ID: 5a7c0e3f1d92
+Revises: 8e2d4b1a9f37
+Create Date: 2025-09-24 09:41:27.662051
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a7c0e3f1d92"
+down_revision: str | Sequence[str] | None = "8e2d4b1a9f37"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "blog",
+        sa.Column("comment_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "tag",
+        sa.Column("usage_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    # 기존 데이터 기준으로 카운터를 채웁니다.
+    op.execute(
+        "UPDATE blog SET comment_count = "
+        "(SELECT COUNT(comment.id) FROM comment WHERE comment.blog_id = blog.id)"
+    )
+    op.execute(
+        "UPDATE tag SET usage_count = "
+        "(SELECT COUNT(*) FROM post_tags WHERE post_tags.tag_id = tag.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tag", "usage_count")
+    op.drop_column("blog", "comment_count")
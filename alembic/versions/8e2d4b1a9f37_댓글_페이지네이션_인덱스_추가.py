@@ -0,0 +1,32 @@
+"""댓글 페이지네이션 인덱스 추가
+
+Revision ID: 8e2d4b1a9f37
+Revises: 3c1f9a7d2b64
+Create Date: 2025-09-23 14:05:12.118730
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e2d4b1a9f37"
+down_revision: str | Sequence[str] | None = "3c1f9a7d2b64"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_comment_blog_id_parent_id_created_at",
+        "comment",
+        ["blog_id", "parent_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_comment_blog_id_parent_id_created_at", table_name="comment")
@@ -0,0 +1,53 @@
+"""업로드 이미지 참조 테이블 생성
+
+Revision ID: b41e6d2c8a05
+Revises: 5a7c0e3f1d92
+Create Date: 2025-09-25 10:12:43.905117
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b41e6d2c8a05"
+down_revision: str | Sequence[str] | None = "5a7c0e3f1d92"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "stored_image",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("path", sa.String(length=255), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("ref_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("released_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("path"),
+    )
+    op.create_index(op.f("ix_stored_image_id"), "stored_image", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_stored_image_content_hash"),
+        "stored_image",
+        ["content_hash"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_stored_image_content_hash"), table_name="stored_image")
+    op.drop_index(op.f("ix_stored_image_id"), table_name="stored_image")
+    op.drop_table("stored_image")
@@ -0,0 +1,46 @@
+"""블로그 본문 html 요약문 컬럼 추가
+
+Revision ID: d7a3f91c2e48
+Revises: b41e6d2c8a05
+Create Date: 2025-09-26 11:03:52.417630
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a3f91c2e48"
+down_revision: str | Sequence[str] | None = "b41e6d2c8a05"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("blog", sa.Column("content_html", sa.Text(), nullable=True))
+    op.add_column("blog", sa.Column("excerpt", sa.String(length=255), nullable=True))
+
+    # 기존 글은 text_helper.render_content_html / make_excerpt와 같은 규칙으로 채웁니다.
+    # (줄바꿈을 <br>로 바꾸고, 요약문은 150자를 넘으면 잘라서 '...'을 붙임)
+    op.execute("UPDATE blog SET content_html = REPLACE(content, '\\n', '<br>')")
+    op.execute(
+        "UPDATE blog SET excerpt = CASE "
+        "WHEN CHAR_LENGTH(content_html) > 150 "
+        "THEN CONCAT(LEFT(content_html, 150), '...') "
+        "ELSE content_html END"
+    )
+
+    op.alter_column("blog", "content_html", existing_type=sa.Text(), nullable=False)
+    op.alter_column(
+        "blog", "excerpt", existing_type=sa.String(length=255), nullable=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("blog", "excerpt")
+    op.drop_column("blog", "content_html")
@@ -0,0 +1,79 @@
+"""
+댓글 트리 조립과 JSON 직렬화 시간을 측정하는 관리 명령입니다.
+
+DB 없이 메모리에 만든 댓글 10,000개(기본값)로 세 가지 모양의 스레드를 조립하고 응답 본문으로 직렬화합니다.
+- flat: 모두 최상위 댓글
+- chain: 바로 앞 댓글에 계속 답글을 다는 깊은 스레드 (깊이 제한이 없으면 직렬화에서 실패)
+- random: 앞선 댓글 중 하나에 무작위로 답글
+
+실행 방법:
+    docker compose exec app python -m src.commands.bench_comment_tree 10000
+"""
+
+import datetime
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+from src.model.comment.orm import Comment
+from src.model.user.orm import User
+from src.service.comment_svc import CommentService
+from src.utils import serializer
+
+ROUNDS = 20
+DEFAULT_COUNT = 10_000
+
+
+def _make_comments(count: int, parent_of: Callable[[int], int | None]) -> list[Comment]:
+    author = User(id=1, name="bench", email="bench@example.com", hashed_password="x")
+    started_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    return [
+        Comment(
+            id=i,
+            content=f"댓글 {i}",
+            blog_id=1,
+            author_id=author.id,
+            author=author,
+            parent_id=parent_of(i),
+            created_at=started_at + datetime.timedelta(seconds=i),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def _report(label: str, samples: list[float]) -> None:
+    print(
+        f"{label:<16} median {statistics.median(samples):8.2f}ms"
+        f"  min {min(samples):8.2f}ms  max {max(samples):8.2f}ms"
+    )
+
+
+def main(count: int) -> None:
+    rng = random.Random(42)
+    shapes = {
+        "flat": lambda i: None,
+        "chain": lambda i: i - 1 if i > 1 else None,
+        "random": lambda i: (
+            rng.randint(1, i - 1) if i > 1 and rng.random() < 0.7 else None
+        ),
+    }
+    print(f"Building comment trees from {count} comment(s)")
+    for label, parent_of in shapes.items():
+        comments = _make_comments(count, parent_of)
+        build_samples = []
+        dump_samples = []
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            tree = CommentService._build_comment_tree(comments)
+            built = time.perf_counter()
+            serializer.dumps(tree)
+            build_samples.append((built - started) * 1000)
+            dump_samples.append((time.perf_counter() - built) * 1000)
+        _report(f"{label} build", build_samples)
+        _report(f"{label} dumps", dump_samples)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,58 @@
+"""
+MySQL FULLTEXT 검색과 프로세스 내 역색인 검색의 응답 시간을 비교하는 관리 명령입니다.
+
+실행 방법:
+    docker compose exec app python -m src.commands.bench_search 프로그래밍 비동기 FastAPI
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from src.manager.search_index_manager import SearchIndexManager
+from src.service.search_svc import SearchService
+from src.utils.db.db import db
+
+ROUNDS = 50
+DEFAULT_QUERIES = ["프로그래밍", "비동기", "FastAPI"]
+
+
+def _report(label: str, samples: list[float]) -> None:
+    print(
+        f"  {label:<10} median {statistics.median(samples):8.3f}ms"
+        f"  p95 {statistics.quantiles(samples, n=20)[-1]:8.3f}ms"
+    )
+
+
+async def main(queries: list[str]) -> None:
+    service = SearchService()
+    index = SearchIndexManager()
+    async with db.async_session_maker() as session:
+        started = time.perf_counter()
+        docs = await service.load_index_documents(session)
+        index.replace_all(docs)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"Indexed {len(docs)} blog(s) in {elapsed_ms:.1f}ms")
+
+        for query in queries:
+            sql_samples = []
+            for _ in range(ROUNDS):
+                started = time.perf_counter()
+                await service.search_fulltext(query, session)
+                sql_samples.append((time.perf_counter() - started) * 1000)
+
+            memory_samples = []
+            for _ in range(ROUNDS):
+                started = time.perf_counter()
+                index.search(query)
+                memory_samples.append((time.perf_counter() - started) * 1000)
+
+            print(f"'{query}'")
+            _report("mysql", sql_samples)
+            _report("memory", memory_samples)
+    await db.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1:] or DEFAULT_QUERIES))
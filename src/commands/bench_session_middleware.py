@@ -0,0 +1,82 @@
+"""
+세션 미들웨어가 요청마다 더하는 시간을 측정하는 관리 명령입니다.
+
+HTTP 서버나 클라이언트 없이 ASGI 앱을 직접 호출해, 같은 엔드포인트를 세 가지 경우로 비교합니다.
+- bare: 미들웨어 없음
+- untouched: 세션 쿠키가 있지만 엔드포인트가 세션을 쓰지 않음 (Redis 접근 없어야 함)
+- loaded: 엔드포인트가 세션을 읽음 (REDIS_URL의 Redis로 한 번 왕복)
+
+실행 방법:
+    docker compose exec app python -m src.commands.bench_session_middleware 5000
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.manager.session_redis_manager import SessionRedisManager
+from src.utils.middewares.session import SessionMiddleware
+
+DEFAULT_REQUESTS = 5_000
+
+
+async def _endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+    if scope["path"] == "/loaded":
+        await scope["state"]["session"].load()
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _scope(path: str, session_id: str) -> Scope:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [(b"cookie", f"session_id={session_id}".encode())],
+    }
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message: Message) -> None:
+    pass
+
+
+async def _measure(app: ASGIApp, path: str, session_id: str, count: int) -> list[float]:
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await app(_scope(path, session_id), _receive, _send)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> None:
+    print(
+        f"{label:<10} median {statistics.median(samples):8.1f}us"
+        f"  p99 {statistics.quantiles(samples, n=100)[-1]:8.1f}us"
+    )
+
+
+async def main(count: int) -> None:
+    session_id = str(uuid.uuid4())
+    manager = SessionRedisManager()
+    await manager._set_redis_session(session_id, {"user_id": 1, "name": "bench"})
+    app = SessionMiddleware(_endpoint)
+    try:
+        print(f"{count} request(s) per case")
+        _report("bare", await _measure(_endpoint, "/untouched", session_id, count))
+        _report("untouched", await _measure(app, "/untouched", session_id, count))
+        _report("loaded", await _measure(app, "/loaded", session_id, count))
+    finally:
+        await manager._delete_redis_session(session_id)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REQUESTS))
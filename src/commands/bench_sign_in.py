@@ -0,0 +1,84 @@
+"""
+로그인이 몰릴 때 bcrypt 검증이 이벤트 루프를 얼마나 막는지 측정하는 관리 명령입니다.
+
+동시 로그인 N건(기본값 50)의 비밀번호 검증을 두 가지 방식으로 실행하면서,
+10ms마다 깨어나는 태스크로 이벤트 루프 지연(lag)을 함께 기록합니다.
+- inline: 이벤트 루프에서 verify()를 바로 호출 (변경 전 방식)
+- executor: verify_async()로 크기가 제한된 스레드 풀에서 실행
+
+실행 방법:
+    docker compose exec app python -m src.commands.bench_sign_in 50
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+from src.manager.password_manager import PasswordManager
+
+DEFAULT_CONCURRENCY = 50
+TICK_SECONDS = 0.01
+PASSWORD = "bench-password"
+
+
+async def _watch_loop_lag(samples: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        samples.append((time.perf_counter() - started - TICK_SECONDS) * 1000)
+
+
+async def _storm(
+    concurrency: int, verify: Callable[[], Awaitable[bool]]
+) -> tuple[list[float], list[float]]:
+    lag: list[float] = []
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(_watch_loop_lag(lag, stop))
+    # 감시 태스크가 먼저 한 번 돌도록 양보합니다.
+    await asyncio.sleep(0)
+
+    # 응답 시간은 요청이 한꺼번에 들어온 시점부터 잽니다. (inline은 앞 요청이 끝나길 기다린 시간 포함)
+    started = time.perf_counter()
+
+    async def sign_in() -> float:
+        assert await verify()
+        return (time.perf_counter() - started) * 1000
+
+    latencies = await asyncio.gather(*(sign_in() for _ in range(concurrency)))
+    stop.set()
+    await watcher
+    return list(latencies), lag or [0.0]
+
+
+def _report(label: str, latencies: list[float], lag: list[float]) -> None:
+    print(
+        f"{label:<9} sign-in p50 {statistics.median(latencies):8.1f}ms"
+        f"  p99 {statistics.quantiles(latencies, n=100)[-1]:8.1f}ms"
+        f"  | loop lag max {max(lag):8.1f}ms"
+    )
+
+
+async def main(concurrency: int) -> None:
+    bcrypt_rounds = os.getenv("BCRYPT_ROUNDS")
+    manager = PasswordManager(
+        bcrypt_rounds=int(bcrypt_rounds) if bcrypt_rounds else None,
+        max_concurrency=int(os.getenv("PASSWORD_HASH_CONCURRENCY", "4")),
+    )
+    hashed_password = manager.hash(PASSWORD)
+
+    async def inline() -> bool:
+        return manager.verify(PASSWORD, hashed_password)
+
+    async def executor() -> bool:
+        return await manager.verify_async(PASSWORD, hashed_password)
+
+    print(f"{concurrency} concurrent sign-in(s)")
+    _report("inline", *await _storm(concurrency, inline))
+    _report("executor", *await _storm(concurrency, executor))
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CONCURRENCY))
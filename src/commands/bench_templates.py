@@ -0,0 +1,59 @@
+"""
+템플릿 콜드 스타트 비용을 측정하는 관리 명령입니다.
+
+새 Environment로 모든 템플릿을 처음 불러오는 시간을 세 가지 경우로 비교합니다.
+- 바이트코드 캐시 없음 (매번 파싱/컴파일)
+- 빈 바이트코드 캐시 (컴파일 후 캐시에 기록)
+- 채워진 바이트코드 캐시 (재시작/다른 워커 상황)
+
+실행 방법:
+    docker compose exec app python -m src.commands.bench_templates
+"""
+
+import statistics
+import tempfile
+import time
+
+from jinja2 import BytecodeCache, FileSystemBytecodeCache, FileSystemLoader
+
+from src.utils.jinja_template import TEMPLATE_DIR, TemplateEnvironment
+
+ROUNDS = 20
+
+
+def _load_all(bytecode_cache: BytecodeCache | None) -> float:
+    env = TemplateEnvironment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=True,
+        bytecode_cache=bytecode_cache,
+    )
+    started = time.perf_counter()
+    for name in env.list_templates():
+        env.get_template(name)
+    return (time.perf_counter() - started) * 1000
+
+
+def _report(label: str, samples: list[float]) -> None:
+    print(
+        f"{label:<24} median {statistics.median(samples):7.2f}ms"
+        f"  min {min(samples):7.2f}ms  max {max(samples):7.2f}ms"
+    )
+
+
+def main() -> None:
+    _report("no bytecode cache", [_load_all(None) for _ in range(ROUNDS)])
+
+    cold: list[float] = []
+    for _ in range(ROUNDS):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold.append(_load_all(FileSystemBytecodeCache(cache_dir)))
+    _report("empty bytecode cache", cold)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        _load_all(FileSystemBytecodeCache(cache_dir))
+        warm = [_load_all(FileSystemBytecodeCache(cache_dir)) for _ in range(ROUNDS)]
+    _report("warm bytecode cache", warm)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+정적 파일(css/js/svg 등) 옆에 미리 압축한 '.gz'(와 '.br') 파일을 만드는 관리 명령입니다.
+CachedStaticFiles는 요청 시 압축하지 않고 여기서 만든 파일을 그대로 보냅니다.
+
+brotli 패키지가 설치되어 있으면 '.br' 파일도 함께 만듭니다.
+
+실행 방법:
+    docker compose exec app python -m src.commands.compress_static
+"""
+
+import gzip
+import os
+
+from src.utils.static_files import STATIC_DIR
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 이미 압축된 형식(이미지 등)은 다시 압축해도 이득이 없으므로 대상에서 제외합니다.
+COMPRESSIBLE_EXTENSIONS = {
+    ".css",
+    ".js",
+    ".mjs",
+    ".svg",
+    ".html",
+    ".json",
+    ".txt",
+    ".map",
+}
+# 이보다 작은 파일은 압축 헤더 비용이 더 커서 건너뜁니다.
+MIN_SIZE = 1024
+
+
+def _write_if_smaller(path: str, original_size: int, data: bytes) -> bool:
+    if len(data) >= original_size:
+        if os.path.exists(path):
+            os.remove(path)
+        return False
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def main() -> None:
+    written = 0
+    for root, _, files in os.walk(STATIC_DIR):
+        for name in files:
+            if os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+                continue
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                content = f.read()
+            if len(content) < MIN_SIZE:
+                continue
+
+            # mtime=0으로 고정해 같은 내용이면 항상 같은 .gz가 나오도록 합니다.
+            gz = gzip.compress(content, compresslevel=9, mtime=0)
+            written += _write_if_smaller(f"{path}.gz", len(content), gz)
+            if brotli is not None:
+                br = brotli.compress(content, quality=11)
+                written += _write_if_smaller(f"{path}.br", len(content), br)
+
+    if brotli is None:
+        print("brotli 패키지가 없어 .br 파일은 만들지 않았습니다.")
+    print(f"Precompressed {written} file(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+비정규화 카운터(댓글 수, 태그 사용 수)를 일괄 재계산하는 관리 명령입니다.
+
+실행 방법:
+    docker compose exec app python -m src.commands.reconcile_counters
+"""
+
+import asyncio
+
+from src.manager.page_cache_manager import page_cache_manager
+from src.service.counter_svc import CounterService
+from src.utils.db.db import db
+
+
+async def main() -> None:
+    async with db.async_session_maker() as session:
+        await CounterService().reconcile(session)
+        await session.commit()
+    # 목록 페이지에 카운트가 노출되므로 캐시된 페이지도 함께 무효화합니다.
+    await page_cache_manager.invalidate()
+    await db.dispose()
+    print("Counters reconciled.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""
+리사이즈 폭 목록 파일이 없는 기존 이미지에 목록 파일을 만들어 주는 관리 명령입니다.
+
+목록 파일은 Celery 워커가 이미지를 처리할 때 기록합니다. 이 방식을 도입하기 전에 처리된 이미지는
+목록 파일이 없어 원본만 노출되므로, 배포 후 한 번 실행해 디스크에 있는 리사이즈 버전을 기록합니다.
+
+실행 방법:
+    docker compose exec app python -m src.commands.write_image_manifests
+"""
+
+import asyncio
+import os
+
+from sqlalchemy import select
+
+from src.manager.image_manager import ImageManager
+from src.model.blog.orm import Blog
+from src.utils.db.db import db
+from src.utils.image_variants import (
+    IMAGE_VARIANT_FORMATS,
+    IMAGE_VARIANT_WIDTHS,
+    image_variant_path,
+    read_variant_manifest,
+    write_variant_manifest,
+)
+
+
+def _write_missing_manifests(image_paths: list[str]) -> int:
+    written = 0
+    for image_path in image_paths:
+        if (
+            not os.path.exists(image_path)
+            or read_variant_manifest(image_path) is not None
+        ):
+            continue
+        # 모든 포맷이 만들어진 폭만 기록합니다.
+        widths = [
+            width
+            for width in IMAGE_VARIANT_WIDTHS
+            if all(
+                os.path.exists(image_variant_path(image_path, width, ext))
+                for ext in IMAGE_VARIANT_FORMATS
+            )
+        ]
+        # 리사이즈 버전이 하나도 없으면 워커가 아직 처리 중일 수 있으므로 기록하지 않습니다.
+        if widths:
+            write_variant_manifest(image_path, widths)
+            written += 1
+    return written
+
+
+async def main() -> None:
+    image_manager = ImageManager()
+    async with db.async_session_maker() as session:
+        result = await session.execute(
+            select(Blog.image_loc).where(Blog.image_loc.is_not(None)).distinct()
+        )
+        image_paths = [image_manager.to_file_path(url) for url in result.scalars()]
+    await db.dispose()
+
+    written = _write_missing_manifests(image_paths)
+    print(f"Wrote {written} manifest(s) for {len(image_paths)} image(s).")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,24 +2,27 @@ from fastapi import Depends, status
 from fastapi.exceptions import HTTPException
 from fastapi.requests import Request
 
-from src.model.user.orm import User
+from src.model.user.session import SessionUser
 
 
 # 로그인 여부와 상관없이 호출
-def get_current_user_or_none(request: Request) -> User | None:
-    session_data = request.state.session
-    if session_data:
-        try:
-            return User(**session_data)
-        except Exception:
-            return None
-    return None
+async def get_current_user_or_none(request: Request) -> SessionUser | None:
+    # 요청당 한 번만 만들어 request.state에 보관하고, 이후에는 그대로 재사용합니다.
+    if hasattr(request.state, "session_user"):
+        cached_user: SessionUser | None = request.state.session_user
+        return cached_user
+
+    # 세션은 이 시점에 처음 Redis에서 읽어옵니다(세션 쿠키가 있는 경우에만).
+    session_data = await request.state.session.load()
+    user = SessionUser.from_session(session_data) if session_data else None
+    request.state.session_user = user
+    return user
 
 
 # 로그인이 필요한 API를 위한 의존성 주입
 def get_current_user(
-    user: User | None = Depends(get_current_user_or_none),
-) -> User:
+    user: SessionUser | None = Depends(get_current_user_or_none),
+) -> SessionUser:
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized"
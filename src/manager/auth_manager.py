@@ -1,21 +1,26 @@
 from fastapi import Request
 
 from src.model.user.database import UserDataPass
+from src.model.user.session import SessionUser
 
 
 def login(request: Request, user: UserDataPass) -> None:
     """
     사용자를 로그인 처리합니다.
 
-    request.state.session에 사용자 정보를 할당하여,
+    request.state.session의 내용을 사용자 정보로 교체하여,
     미들웨어가 이 변경을 감지하고 세션을 생성/갱신하도록 합니다.
     """
-    request.state.session = {
-        "id": user.id,
-        "name": user.name,
-        "email": user.email,
-        "is_email_verified": user.is_email_verified,
-    }
+    request.state.session.replace(
+        {
+            "id": user.id,
+            "name": user.name,
+            "email": user.email,
+            "is_email_verified": user.is_email_verified,
+        }
+    )
+    # 같은 요청 안에서 이후에 조회되는 로그인 사용자 정보도 갱신합니다.
+    request.state.session_user = SessionUser.from_session(request.state.session)
 
 
 def logout(request: Request) -> None:
@@ -26,3 +31,4 @@ def logout(request: Request) -> None:
     미들웨어가 이 변경을 감지하고 세션을 삭제하도록 합니다.
     """
     request.state.session.clear()
+    request.state.session_user = None
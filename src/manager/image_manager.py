@@ -1,13 +1,43 @@
+import hashlib
 import os
-import time
+import uuid
+from dataclasses import dataclass
+from functools import cached_property
 
 import aiofiles
 from dotenv import load_dotenv
 from fastapi import HTTPException
 from fastapi.datastructures import UploadFile
 
+from src.utils.image_variants import (
+    IMAGE_VARIANT_FORMATS,
+    IMAGE_VARIANT_WIDTHS,
+    image_variant_manifest_path,
+    image_variant_path,
+    read_variant_manifest,
+)
+from src.utils.static_files import STATIC_DIR, static_url
+
 load_dotenv()
 
+# 업로드 파일을 읽고 쓸 때 사용하는 청크 크기(1MiB)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# 프로세스 메모리에 보관하는 리사이즈 폭 목록 수
+VARIANT_CACHE_SIZE = 4096
+
+# 이미지 URL -> 워커가 만든 리사이즈 버전의 폭 목록.
+# 이미지는 내용 해시로 저장되어 한 번 처리되면 바뀌지 않으므로, 목록 파일은 이미지마다 처음 한 번만 읽습니다.
+# (BlogService가 요청마다 ImageManager를 만들기 때문에 모듈 수준에 둡니다.)
+_variant_widths_cache: dict[str, tuple[int, ...]] = {}
+
+
+@dataclass
+class SavedImage:
+    url: str
+    content_hash: str
+    # 업로드 내용을 담은 임시 파일. place_image가 최종 경로로 옮기고, discard_image가 남은 것을 지웁니다.
+    tmp_path: str
+
 
 class ImageManager:
     def __init__(self) -> None:
@@ -21,37 +51,147 @@ class ImageManager:
         if not os.path.exists(self.image_upload_path):
             os.makedirs(self.image_upload_path)
 
-    async def save_image(self, author: str, image: UploadFile) -> str:
-        """파일 저장을 실제로 담당하는 '동기' 함수"""
+    async def save_image(self, image: UploadFile) -> SavedImage:
+        """
+        업로드 파일을 큰 청크 단위로 읽으면서 내용 해시(SHA-256)를 계산해 임시 파일에 씁니다.
+
+        최종 경로(해시 기반)로 옮기는 일은 place_image가 합니다. 호출하는 쪽은 그 사이에
+        ImageService.acquire로 참조(행 잠금)를 먼저 잡아, 정리 작업이 같은 파일을 지우는 중에
+        파일을 놓지 않도록 해야 합니다.
+        """
         filename = image.filename or "upload_error.svg"
-        filename_only, ext = os.path.splitext(filename)
-        upload_filename = f"{filename_only}_{(int)(time.time())}{ext}"
-        author_dir = os.path.join(self.image_upload_path, author)
-        if not os.path.exists(author_dir):
-            os.makedirs(author_dir)
-
-        full_path = os.path.join(author_dir, upload_filename)
-        # FIXME upload error시 error raise가 안되고 저장이됨
+        ext = os.path.splitext(filename)[1].lower()
+
+        tmp_dir = os.path.join(self.image_upload_path, ".tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        tmp_path = os.path.join(tmp_dir, uuid.uuid4().hex)
+
+        hasher = hashlib.sha256()
         try:
-            async with aiofiles.open(full_path, "wb") as outfile:
-                while content := await image.read(1024):
-                    await outfile.write(content)
-                print("upload succeeded:", full_path)
+            async with aiofiles.open(tmp_path, "wb") as outfile:
+                while chunk := await image.read(UPLOAD_CHUNK_SIZE):
+                    hasher.update(chunk)
+                    await outfile.write(chunk)
         except Exception as e:
             print(f"File save error: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             raise HTTPException(
                 status_code=500, detail="파일 저장 중 오류가 발생했습니다."
             ) from e
 
-        return self.trim_volume_path(full_path)
+        content_hash = hasher.hexdigest()
+        # 한 디렉터리에 파일이 몰리지 않도록 해시 앞 두 글자로 디렉터리를 나눕니다.
+        full_path = os.path.join(
+            self.image_upload_path, content_hash[:2], f"{content_hash}{ext}"
+        )
+        return SavedImage(
+            url=self.trim_volume_path(full_path),
+            content_hash=content_hash,
+            tmp_path=tmp_path,
+        )
+
+    def place_image(self, saved_image: SavedImage) -> bool:
+        """
+        임시 파일을 최종 경로로 옮깁니다. 같은 내용의 파일이 이미 있으면 옮기지 않고 False를 반환합니다.
+        """
+        full_path = self.to_file_path(saved_image.url)
+        if os.path.exists(full_path):
+            self.discard_image(saved_image)
+            return False
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        # 같은 파일 시스템 안에서의 rename은 원자적이므로 반쯤 쓰인 파일이 노출되지 않습니다.
+        os.replace(saved_image.tmp_path, full_path)
+        print("upload succeeded:", full_path)
+        return True
+
+    def discard_image(self, saved_image: SavedImage) -> None:
+        """place_image로 옮겨지지 않고 남은 임시 파일을 지웁니다."""
+        try:
+            os.remove(saved_image.tmp_path)
+        except FileNotFoundError:
+            pass
 
     # 절대경로로 저장해야하는걸 주의 해야함.
-    def resolve_image_url(self, image_url: str | None) -> str:
+    def resolve_image_url(self, image_url: str | None, width: int | None = None) -> str:
+        """
+        이미지 URL을 반환합니다. width를 주면 워커가 만든 해당 폭의 JPEG 버전이 있을 때 그 URL을 반환합니다.
+        """
         if not image_url:
-            return self.trim_volume_path(self.default_image_path)
+            return self.default_image_url
+
+        if width and width in self.variant_widths(image_url):
+            return self.trim_volume_path(image_variant_path(image_url, width, "jpg"))
 
         return self.trim_volume_path(image_url)
 
+    def resolve_image_srcset(self, image_url: str | None, ext: str) -> str | None:
+        """
+        <img>/<source>의 srcset 값을 만듭니다. 아직 처리되지 않은 이미지면 None을 반환합니다.
+        """
+        if not image_url:
+            return None
+
+        entries = [
+            f"{self.trim_volume_path(image_variant_path(image_url, width, ext))} {width}w"
+            for width in self.variant_widths(image_url)
+        ]
+        return ", ".join(entries) or None
+
+    @cached_property
+    def default_image_url(self) -> str:
+        """
+        이미지가 없는 글에 쓰는 기본 이미지 URL입니다.
+        정적 파일 디렉터리 아래에 있으면 내용 지문(?v=...)을 붙여 브라우저가 오래 캐시할 수 있게 합니다.
+        """
+        url = self.trim_volume_path(self.default_image_path)
+        relative = url.lstrip("/")
+        if relative.startswith(f"{STATIC_DIR}/"):
+            return static_url(relative.removeprefix(f"{STATIC_DIR}/"))
+        return url
+
+    def variant_widths(self, image_url: str) -> tuple[int, ...]:
+        """
+        워커가 만든 리사이즈 버전의 폭 목록을 반환합니다.
+        워커가 작업을 끝내며 남긴 목록 파일을 읽어 캐시하고, 아직 처리 전이면 빈 튜플을 반환합니다.
+        """
+        widths = _variant_widths_cache.get(image_url)
+        if widths is not None:
+            return widths
+
+        widths = read_variant_manifest(self.to_file_path(image_url))
+        if widths is None:
+            # 처리 전인 이미지는 캐시하지 않고 다음 렌더링에서 다시 확인합니다.
+            return ()
+        while len(_variant_widths_cache) >= VARIANT_CACHE_SIZE:
+            # 가장 먼저 들어온 항목부터 제거합니다.
+            _variant_widths_cache.pop(next(iter(_variant_widths_cache)))
+        _variant_widths_cache[image_url] = widths
+        return widths
+
+    def remove_image_files(self, image_url: str) -> None:
+        """원본 이미지와 워커가 만든 리사이즈 버전 파일, 폭 목록 파일을 모두 삭제합니다."""
+        _variant_widths_cache.pop(image_url, None)
+        paths = [image_url, image_variant_manifest_path(image_url)] + [
+            image_variant_path(image_url, width, ext)
+            for width in IMAGE_VARIANT_WIDTHS
+            for ext in IMAGE_VARIANT_FORMATS
+        ]
+        for path in paths:
+            try:
+                os.remove(self.to_file_path(path))
+            except FileNotFoundError:
+                # 리사이즈 버전이 없거나 이미 지워진 파일은 건너뜁니다.
+                pass
+
+    def to_file_path(self, image_url: str) -> str:
+        """
+        웹 URL로 저장된 이미지 경로를 실제 파일 시스템 경로로 되돌립니다(trim_volume_path의 역).
+        """
+        if self.volume_path and not image_url.startswith(self.volume_path):
+            return f"{self.volume_path}{image_url}"
+        return image_url
+
     def trim_volume_path(self, image_url: str) -> str:
         """
         전체 파일 경로에서 웹 URL로 사용하기 위해 볼륨 경로(prefix)를 제거합니다.
@@ -0,0 +1,149 @@
+import hashlib
+import os
+import time
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+from fastapi.responses import HTMLResponse
+from redis.exceptions import RedisError
+
+from src.utils.db.redis import redis_db
+
+# 로그인 여부에 따라 같은 URL의 내용이 달라지므로 공유 캐시에는 저장하지 않고, 브라우저는 매번 재검증하도록 합니다.
+# 캐시를 쓰지 않는 로그인 사용자 응답에도 같은 헤더를 붙입니다.
+PAGE_CACHE_HEADERS = {"Cache-Control": "private, no-cache", "Vary": "Cookie"}
+
+
+@dataclass
+class CachedPage:
+    body: str
+    etag: str
+    last_modified: float
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "ETag": self.etag,
+            "Last-Modified": formatdate(self.last_modified, usegmt=True),
+            **PAGE_CACHE_HEADERS,
+        }
+
+    def to_response(self, request: Request) -> Response:
+        """
+        캐시된 페이지를 응답으로 변환합니다.
+        클라이언트가 보낸 If-None-Match / If-Modified-Since가 일치하면 본문 없이 304를 반환합니다.
+        """
+        headers = self.headers
+        if self._is_not_modified(request):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return HTMLResponse(content=self.body, headers=headers)
+
+    def _is_not_modified(self, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            etags = {tag.strip() for tag in if_none_match.split(",")}
+            return "*" in etags or self.etag in etags
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(self.last_modified) <= since
+        return False
+
+
+class PageCacheManager:
+    """
+    비로그인 사용자에게 보여주는 렌더링된 HTML 페이지를 Redis에 캐시합니다.
+
+    블로그/댓글/태그가 변경되어 커밋되면 invalidate()로 버전을 올려
+    그 이전에 저장된 모든 캐시 항목을 한 번에 무효화합니다.
+    """
+
+    PREFIX = "page_cache"
+    VERSION_KEY = f"{PREFIX}:version"
+
+    def __init__(self) -> None:
+        self._redis = redis_db.get_client()
+        self.ttl = int(os.getenv("PAGE_CACHE_TTL", "300"))
+
+    def build_key(self, route: str, **params: object) -> str:
+        parts = [f"{k}={v}" for k, v in sorted(params.items()) if v is not None]
+        return ":".join([self.PREFIX, route, *parts])
+
+    async def get_page(self, key: str) -> tuple[CachedPage | None, str]:
+        """
+        캐시된 페이지와 현재 캐시 버전을 반환합니다.
+        버전은 DB 조회 전에 읽어 두었다가 set_page에 그대로 넘겨야,
+        렌더링 도중 들어온 변경으로 오래된 페이지가 저장되는 것을 막을 수 있습니다.
+        """
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.get(self.VERSION_KEY)
+                pipe.hgetall(key)
+                version, entry = await pipe.execute()
+        except RedisError as e:
+            print(f"Page cache read error: {e}")
+            return None, ""
+
+        version = version or "0"
+        if not entry or entry.get("version") != version:
+            return None, version
+        return (
+            CachedPage(
+                body=entry["body"],
+                etag=entry["etag"],
+                last_modified=float(entry["last_modified"]),
+            ),
+            version,
+        )
+
+    def begin_page(self, key: str, version: str) -> CachedPage:
+        """
+        렌더링을 시작하기 전에 페이지의 ETag/Last-Modified를 정합니다. 본문은 set_page가 채웁니다.
+
+        스트리밍 응답은 본문보다 헤더가 먼저 나가므로 본문 해시를 ETag로 쓸 수 없습니다.
+        대신 이번 렌더링(키, 캐시 버전, 시각)을 식별하는 약한 ETag를 만들고, 캐시 항목에도 같은 값을
+        저장해 첫 응답(캐시 미스)과 이후 캐시 응답의 검증 헤더가 같도록 합니다.
+        """
+        last_modified = time.time()
+        render_id = f"{key}:{version}:{last_modified}".encode()
+        return CachedPage(
+            body="",
+            etag=f'W/"{hashlib.sha1(render_id).hexdigest()}"',
+            last_modified=last_modified,
+        )
+
+    async def set_page(
+        self, key: str, body: bytes, version: str, page: CachedPage
+    ) -> CachedPage:
+        """begin_page로 만든 페이지에 렌더링된 본문을 채워 캐시에 저장합니다."""
+        page.body = body.decode()
+        if not version:
+            # 버전을 읽지 못했다면(Redis 장애) 저장하지 않습니다.
+            return page
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hset(
+                    key,
+                    mapping={
+                        "version": version,
+                        "body": page.body,
+                        "etag": page.etag,
+                        "last_modified": str(page.last_modified),
+                    },
+                )
+                pipe.expire(key, self.ttl)
+                await pipe.execute()
+        except RedisError as e:
+            print(f"Page cache write error: {e}")
+        return page
+
+    async def invalidate(self) -> None:
+        await self._redis.incr(self.VERSION_KEY)
+
+
+page_cache_manager = PageCacheManager()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast
 
 from passlib.context import CryptContext
@@ -12,6 +14,8 @@ class PasswordManager:
     - 기본 알고리즘은 bcrypt
     - deprecated 정책 및 라운드 수를 옵션으로 조정 가능
     - 해싱, 검증, 재해싱 필요 여부 확인 메서드 제공
+    - bcrypt는 의도적으로 느린 연산이므로, async 코드에서는 hash_async/verify_async를 사용해
+      크기가 제한된 스레드 풀에서 실행합니다(이벤트 루프를 막지 않음).
     """
 
     def __init__(
@@ -19,6 +23,7 @@ class PasswordManager:
         schemes: Iterable[str] | None = None,
         deprecated: str = "auto",
         bcrypt_rounds: int | None = None,
+        max_concurrency: int = 4,
     ) -> None:
         context_kwargs: dict[str, Any] = {
             "schemes": list(schemes) if schemes else ["bcrypt"],
@@ -26,8 +31,15 @@ class PasswordManager:
         }
         if bcrypt_rounds is not None:
             context_kwargs["bcrypt__rounds"] = bcrypt_rounds
+            # 라운드 수를 올렸을 때 기존 해시가 needs_rehash로 감지되도록 최소 기준으로도 사용합니다.
+            context_kwargs["bcrypt__min_rounds"] = bcrypt_rounds
 
         self._context: CryptContext = CryptContext(**context_kwargs)
+        # 동시에 실행되는 해싱/검증 수를 max_concurrency개로 제한합니다.
+        # 초과한 요청은 이벤트 루프를 막지 않고 풀의 대기열에서 기다립니다.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="password-hash"
+        )
 
     def hash(self, plain_password: str) -> str:
         """평문 비밀번호를 안전하게 해싱합니다."""
@@ -37,6 +49,18 @@ class PasswordManager:
         """평문 비밀번호가 해시와 일치하는지 검증합니다."""
         return cast(bool, self._context.verify(plain_password, hashed_password))
 
+    async def hash_async(self, plain_password: str) -> str:
+        """hash()를 스레드 풀에서 실행합니다."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.hash, plain_password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """verify()를 스레드 풀에서 실행합니다."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.verify, plain_password, hashed_password
+        )
+
     def needs_rehash(self, hashed_password: str) -> bool:
         """현재 정책 기준으로 재해싱이 필요한지 확인합니다.
         로그인 등으로 “평문 비밀번호를 받은 순간”에 최신 정책으로 다시 해싱해서 DB에 저장합니다.
@@ -0,0 +1,212 @@
+import heapq
+import math
+import os
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+
+# 제목/태그에 나온 단어가 본문보다 관련도에 크게 반영되도록 주는 가중치
+TITLE_WEIGHT = 3
+TAG_WEIGHT = 2
+# 가중치는 unsigned short 배열에 저장하므로 이 값을 넘지 않도록 자릅니다.
+MAX_TERM_WEIGHT = 0xFFFF
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    텍스트를 소문자 단어로 나눈 뒤 글자 2개씩 겹치게 자른 바이그램 목록을 반환합니다.
+    한국어는 조사/어미가 붙어 띄어쓰기 단위로는 찾기 어려우므로 MySQL ngram 파서와 같은 방식을 씁니다.
+    ('프로그래밍' -> '프로', '로그', '그래', '래밍') 한 글자 단어는 그대로 사용합니다.
+    """
+    grams: list[str] = []
+    for word in _WORD.findall(text.lower()):
+        if len(word) == 1:
+            grams.append(word)
+        else:
+            grams.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+# 인덱스에 올리는 블로그 한 건. 검색 결과 화면을 그릴 때 DB를 다시 조회하지 않도록 표시용 값도 함께 보관합니다.
+@dataclass(slots=True)
+class IndexedBlog:
+    id: int
+    title: str
+    content: str
+    author_name: str
+    modified_dt: datetime
+    comment_count: int = 0
+    tag_names: list[str] = field(default_factory=list)
+
+
+# 인덱스를 이루는 세 자료 구조입니다. 재구축할 때는 새 묶음을 만들어 한 번의 대입으로 교체하므로,
+# 검색이 서로 다른 시점의 포스팅과 문서를 섞어 보는 일이 없습니다.
+@dataclass(slots=True)
+class IndexState:
+    # 바이그램 -> (블로그 id 배열, 가중치 배열)
+    postings: dict[str, tuple[array, array]] = field(default_factory=dict)
+    docs: dict[int, IndexedBlog] = field(default_factory=dict)
+    # 블로그 id -> 해당 글이 들어 있는 바이그램 목록 (삭제/갱신 시 사용)
+    doc_terms: dict[int, tuple[str, ...]] = field(default_factory=dict)
+
+    def add(self, doc: IndexedBlog) -> None:
+        counts: Counter[str] = Counter(tokenize(doc.content))
+        for term in tokenize(doc.title):
+            counts[term] += TITLE_WEIGHT
+        for tag_name in doc.tag_names:
+            for term in tokenize(tag_name):
+                counts[term] += TAG_WEIGHT
+
+        for term, weight in counts.items():
+            ids, weights = self.postings.setdefault(term, (array("I"), array("H")))
+            i = bisect_left(ids, doc.id)
+            ids.insert(i, doc.id)
+            weights.insert(i, min(weight, MAX_TERM_WEIGHT))
+        self.docs[doc.id] = doc
+        self.doc_terms[doc.id] = tuple(counts)
+
+    def remove(self, blog_id: int) -> None:
+        for term in self.doc_terms.pop(blog_id, ()):
+            ids, weights = self.postings[term]
+            i = bisect_left(ids, blog_id)
+            if i < len(ids) and ids[i] == blog_id:
+                del ids[i]
+                del weights[i]
+            if not ids:
+                del self.postings[term]
+        self.docs.pop(blog_id, None)
+
+    def upsert(self, doc: IndexedBlog) -> None:
+        self.remove(doc.id)
+        self.add(doc)
+
+
+class SearchIndexManager:
+    """
+    블로그 제목/본문/태그에 대한 프로세스 내 역색인(inverted index)입니다.
+    MySQL FULLTEXT를 쓸 수 없는 환경(SQLite, 읽기 전용 복제본 등)에서 SEARCH_BACKEND=memory로 사용합니다.
+
+    바이그램마다 (블로그 id 배열, 가중치 배열) 두 개의 array로 된 포스팅 리스트를 가지며,
+    id는 오름차순으로 유지해 갱신/삭제 위치를 이진 탐색으로 찾습니다.
+    인덱스는 프로세스마다 따로 있으므로 다른 워커의 변경은 주기적인 재구축으로 반영됩니다.
+
+    검색과 갱신(upsert/remove)은 이벤트 루프에서만 실행합니다. 재구축은 새 IndexState를
+    스레드에서 만들고(build_state), 교체는 이벤트 루프에서 합니다(finish_rebuild).
+    """
+
+    def __init__(self) -> None:
+        self.enabled = os.getenv("SEARCH_BACKEND", "mysql") == "memory"
+        self._state = IndexState()
+        # 재구축 중에 들어온 변경 (IndexedBlog = upsert, int = remove). 재구축 중이 아니면 None
+        self._pending: list[IndexedBlog | int] | None = None
+
+    def __len__(self) -> int:
+        return len(self._state.docs)
+
+    @staticmethod
+    def build_state(docs: list[IndexedBlog]) -> IndexState:
+        """전체 문서로 새 인덱스를 만듭니다. 공유 상태를 건드리지 않으므로 스레드에서 실행해도 됩니다."""
+        state = IndexState()
+        for doc in sorted(docs, key=lambda d: d.id):
+            state.add(doc)
+        return state
+
+    def replace_all(self, docs: list[IndexedBlog]) -> None:
+        """새 인덱스를 만들어 바로 교체합니다. 동시에 갱신이 없는 곳(벤치마크 등)에서 사용합니다."""
+        self._state = self.build_state(docs)
+
+    def begin_rebuild(self) -> None:
+        """
+        재구축할 문서를 DB에서 읽기 전에 호출합니다.
+        이후의 갱신은 기록해 두었다가 새 인덱스에 다시 적용하므로, 읽은 뒤 커밋된 글이 빠지지 않습니다.
+        """
+        self._pending = []
+
+    def finish_rebuild(self, state: IndexState) -> None:
+        """재구축 중에 들어온 갱신을 새 인덱스에 다시 적용한 뒤 한 번에 교체합니다."""
+        pending, self._pending = self._pending or [], None
+        for change in pending:
+            if isinstance(change, IndexedBlog):
+                state.upsert(change)
+            else:
+                state.remove(change)
+        self._state = state
+
+    def abort_rebuild(self) -> None:
+        self._pending = None
+
+    async def upsert(self, doc: IndexedBlog) -> None:
+        """블로그 글이 생성/수정되어 커밋된 뒤 호출됩니다."""
+        self._state.upsert(doc)
+        if self._pending is not None:
+            self._pending.append(doc)
+
+    async def remove(self, blog_id: int) -> None:
+        """블로그 글이 삭제되어 커밋된 뒤 호출됩니다."""
+        self._state.remove(blog_id)
+        if self._pending is not None:
+            self._pending.append(blog_id)
+
+    def search(
+        self, query: str, offset: int = 0, limit: int = 10
+    ) -> tuple[list[tuple[IndexedBlog, float]], bool]:
+        """
+        질의의 모든 바이그램을 포함하는 글을 TF-IDF 점수 순으로 반환합니다.
+        (결과 목록, 다음 페이지 존재 여부)를 반환합니다.
+        """
+        state = self._state
+        terms = set(tokenize(query))
+        if not terms or not state.docs:
+            return [], False
+
+        postings = []
+        for term in terms:
+            posting = state.postings.get(term)
+            if posting is None:
+                return [], False
+            postings.append(posting)
+        # 가장 짧은 포스팅 리스트부터 교집합을 구해 후보 수를 빠르게 줄입니다.
+        postings.sort(key=lambda p: len(p[0]))
+
+        total = len(state.docs)
+        ids, weights = postings[0]
+        idf = math.log(1 + total / len(ids))
+        scores = {
+            doc_id: weight * idf for doc_id, weight in zip(ids, weights, strict=True)
+        }
+        for ids, weights in postings[1:]:
+            idf = math.log(1 + total / len(ids))
+            if len(scores) * 8 < len(ids):
+                # 후보가 포스팅 리스트보다 훨씬 적으면 전체를 훑지 않고 후보마다 이진 탐색합니다.
+                next_scores = {}
+                for doc_id, score in scores.items():
+                    i = bisect_left(ids, doc_id)
+                    if i < len(ids) and ids[i] == doc_id:
+                        next_scores[doc_id] = score + weights[i] * idf
+            else:
+                next_scores = {
+                    doc_id: scores[doc_id] + weight * idf
+                    for doc_id, weight in zip(ids, weights, strict=True)
+                    if doc_id in scores
+                }
+            scores = next_scores
+            if not scores:
+                return [], False
+
+        # 전체를 정렬하지 않고 요청한 페이지까지만 상위 항목을 뽑습니다.
+        top = heapq.nlargest(
+            offset + limit + 1, scores.items(), key=lambda item: (item[1], item[0])
+        )
+        page = top[offset : offset + limit]
+        return (
+            [(state.docs[doc_id], score) for doc_id, score in page],
+            len(top) > offset + limit,
+        )
+
+
+search_index_manager = SearchIndexManager()
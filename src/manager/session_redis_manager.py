@@ -1,33 +1,97 @@
-import json
+import os
+import time
 
+from src.utils import serializer
 from src.utils.db.redis import redis_db
 
 
 class SessionRedisManager:
+    """
+    Redis에 저장된 로그인 세션을 조회/저장/삭제합니다.
+
+    세션 만료 시간 갱신(sliding expiry) 방식은 SESSION_REFRESH_MODE 환경 변수로 선택합니다.
+    - "pipeline"(기본값): GET과 TTL을 한 번의 왕복으로 조회하고,
+      남은 TTL이 SESSION_REFRESH_THRESHOLD(초)보다 작을 때만 EXPIRE를 보냅니다.
+    - "getex": GETEX로 조회와 만료 갱신을 한 번의 왕복으로 처리합니다(매 요청 갱신).
+
+    SESSION_LOCAL_CACHE_TTL(초)을 0보다 크게 설정하면 디코딩된 세션을 프로세스 메모리에
+    잠깐 보관해, 같은 사용자의 연속된 요청이 매번 Redis에 가지 않도록 합니다.
+    """
+
     def __init__(self) -> None:
         self.redis_db = redis_db
         self.session_expire_time = 60 * 60
+        self.refresh_mode = os.getenv("SESSION_REFRESH_MODE", "pipeline")
+        self.refresh_threshold = int(
+            os.getenv("SESSION_REFRESH_THRESHOLD", str(self.session_expire_time // 2))
+        )
+        self.local_cache_ttl = float(os.getenv("SESSION_LOCAL_CACHE_TTL", "0"))
+        self.local_cache_size = int(os.getenv("SESSION_LOCAL_CACHE_SIZE", "1024"))
+        # session_id -> (만료 시각(monotonic), 세션 데이터)
+        self._local_cache: dict[str, tuple[float, dict]] = {}
 
     async def _get_redis_session(self, session_id: str) -> dict | None:
+        cached = self._get_local_session(session_id)
+        if cached is not None:
+            return cached
+
         redis_key = f"session:{session_id}"
-        session_data_byte = await self.redis_db.get_client().get(redis_key)
+        client = self.redis_db.get_client()
+
+        if self.refresh_mode == "getex":
+            session_data_byte = await client.getex(
+                redis_key, ex=self.session_expire_time
+            )
+        else:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.get(redis_key)
+                pipe.ttl(redis_key)
+                session_data_byte, ttl = await pipe.execute()
+            # 남은 시간이 충분하면 만료 시간 갱신(쓰기)을 생략합니다.
+            if session_data_byte and 0 <= ttl < self.refresh_threshold:
+                await client.expire(redis_key, self.session_expire_time)
 
         if session_data_byte:
-            await self.redis_db.get_client().expire(redis_key, self.session_expire_time)
-            data = json.loads(session_data_byte)
+            data = serializer.loads(session_data_byte)
             if isinstance(data, dict):
+                self._set_local_session(session_id, data)
                 return data
         return None
 
     async def _set_redis_session(self, session_id: str, session_data: dict) -> None:
         redis_key = f"session:{session_id}"
-        json_value = json.dumps(session_data)
-        await self.redis_db.get_client().setex(
-            name=redis_key,
-            value=json_value,
-            time=self.session_expire_time,
+        json_value = serializer.dumps(session_data)
+        await self.redis_db.get_client().set(
+            redis_key, json_value, ex=self.session_expire_time
         )
+        self._set_local_session(session_id, session_data)
 
     async def _delete_redis_session(self, session_id: str) -> None:
         redis_key = f"session:{session_id}"
+        self._local_cache.pop(session_id, None)
         await self.redis_db.get_client().delete(redis_key)
+
+    def _get_local_session(self, session_id: str) -> dict | None:
+        if self.local_cache_ttl <= 0:
+            return None
+        entry = self._local_cache.get(session_id)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at < time.monotonic():
+            self._local_cache.pop(session_id, None)
+            return None
+        # 호출한 쪽에서 세션을 수정해도 캐시가 오염되지 않도록 복사본을 반환합니다.
+        return dict(data)
+
+    def _set_local_session(self, session_id: str, session_data: dict) -> None:
+        if self.local_cache_ttl <= 0:
+            return
+        if session_id not in self._local_cache:
+            while self._local_cache and len(self._local_cache) >= self.local_cache_size:
+                # 가장 먼저 들어온 항목부터 제거합니다.
+                self._local_cache.pop(next(iter(self._local_cache)))
+        self._local_cache[session_id] = (
+            time.monotonic() + self.local_cache_ttl,
+            dict(session_data),
+        )
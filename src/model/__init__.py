@@ -5,5 +5,6 @@
 from .base import Base
 from .blog.orm import Blog
 from .comment.orm import Comment
+from .image.orm import StoredImage
 from .tag.orm import Tag
 from .user.orm import User
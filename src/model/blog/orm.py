@@ -8,7 +8,7 @@ import datetime
 # 런타임 시에는 False이므로, 실제 프로그램 실행에 영향을 주지 않으면서 타입 힌트를 위한 모듈을 가져올 수 있습니다.
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -25,6 +25,18 @@ if TYPE_CHECKING:
 class Blog(Base):
     # __tablename__은 SQLAlchemy에게 이 클래스가 어떤 테이블과 매핑되는지 알려줍니다.
     __tablename__ = "blog"
+    __table_args__ = (
+        # 목록 페이지의 커서 페이지네이션((modified_dt, id) 내림차순)을 위한 복합 인덱스입니다.
+        Index("ix_blog_modified_dt_id", "modified_dt", "id"),
+        # 제목/본문 검색용 전문(FULLTEXT) 인덱스입니다. 한국어는 띄어쓰기 단위로 찾기 어려워 ngram 파서를 사용합니다.
+        Index(
+            "ft_blog_title_content",
+            "title",
+            "content",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
+    )
 
     # 각 클래스 속성은 테이블의 컬럼에 해당합니다.
     # Mapped[] 타입 힌트는 이 속성이 데이터베이스 컬럼과 매핑됨을 나타냅니다.
@@ -32,7 +44,16 @@ class Blog(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255))
     content: Mapped[str] = mapped_column(Text)
+    # 조회할 때마다 문자열 가공을 하지 않도록 글을 저장할 때 미리 만들어 두는 값입니다.
+    # content_html은 상세 페이지용 HTML, excerpt는 목록 카드용 요약문입니다.
+    content_html: Mapped[str] = mapped_column(Text)
+    excerpt: Mapped[str] = mapped_column(String(255))
     image_loc: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # 목록 페이지에서 COUNT 집계 없이 보여주기 위한 댓글 수(비정규화 카운터)입니다.
+    # CommentService가 댓글 생성/삭제 시 같은 트랜잭션 안에서 함께 갱신합니다.
+    comment_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
 
     # ForeignKey("user.id")는 이 컬럼이 'user' 테이블의 'id' 컬럼을 참조하는 외래 키임을 나타냅니다.
     author_id: Mapped[int] = mapped_column(Integer, ForeignKey("user.id"))
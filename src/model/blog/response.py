@@ -1,19 +1,24 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel
 
 from src.model.tag.response import TagResponse
 from src.model.user.response import UserResponse
-from src.utils.text_helper import newline_to_br
 
 
-# API 응답 및 템플릿에서 사용할 기본 Blog DTO 모델
+# API 응답 및 템플릿에서 사용할 블로그 상세 DTO 모델
 class BlogResponse(BaseModel):
     id: int
     title: str
     content: str  # 원본 내용을 그대로 가짐
+    content_html: str  # 저장 시 미리 만들어 둔 본문 HTML
     modified_dt: datetime
     image_loc: str | None = None
+    # 워커가 만든 리사이즈 버전의 srcset (아직 처리되지 않았으면 None)
+    image_srcset: str | None = None
+    image_srcset_webp: str | None = None
+    comment_count: int = 0
     author: UserResponse
     tags: list[TagResponse] = []
 
@@ -22,13 +27,47 @@ class BlogResponse(BaseModel):
         from_attributes = True
 
 
-# 블로그 목록에서 각 항목을 보여줄 때 사용할 DTO 모델
-class BlogListResponse(BlogResponse):
-    # 기존 BlogResponse를 상속받고 content 필드만 오버라이드
-    @field_validator("content", mode="before")
-    @classmethod
-    def truncate_content(cls, v: str) -> str:
-        # Pydantic 모델로 변환되는 과정에서 내용을 자르는 로직을 수행
-        from src.utils.text_helper import truncate_text
+# 블로그 목록 카드 한 장에 필요한 값만 담는 가벼운 DTO입니다.
+# ORM 객체나 Pydantic 검증을 거치지 않고, 필요한 컬럼만 조회한 결과 행을 그대로 옮겨 담습니다.
+@dataclass(slots=True)
+class BlogListItem:
+    id: int
+    title: str
+    excerpt: str
+    modified_dt: datetime
+    image_loc: str | None
+    comment_count: int
+    author_name: str
+    tag_names: list[str] = field(default_factory=list)
+    # 워커가 만든 리사이즈 버전의 srcset (아직 처리되지 않았으면 None)
+    image_srcset: str | None = None
+    image_srcset_webp: str | None = None
+
+
+# 커서 기반으로 잘라낸 블로그 목록 한 페이지
+@dataclass(slots=True)
+class BlogListPage:
+    items: list[BlogListItem]
+    # 다음 페이지를 요청할 때 사용할 커서. 마지막 페이지라면 None
+    next_cursor: str | None = None
+
+
+# 검색 결과 한 건. 제목과 스니펫은 검색어를 <mark>로 강조한 HTML(Markup)입니다.
+@dataclass(slots=True)
+class BlogSearchItem:
+    id: int
+    title_html: str
+    snippet_html: str
+    modified_dt: datetime
+    comment_count: int
+    author_name: str
+    score: float
+
 
-        return truncate_text(newline_to_br(v))
+# 관련도 순으로 정렬한 검색 결과 한 페이지
+@dataclass(slots=True)
+class BlogSearchPage:
+    query: str
+    items: list[BlogSearchItem]
+    page: int = 1
+    has_next: bool = False
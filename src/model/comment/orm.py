@@ -3,7 +3,7 @@ from __future__ import annotations
 import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.model.base import Base
@@ -16,6 +16,15 @@ if TYPE_CHECKING:
 
 class Comment(Base):
     __tablename__ = "comment"
+    # 블로그별 최상위 댓글/대댓글을 작성순으로 페이지 단위 조회하기 위한 복합 인덱스입니다.
+    __table_args__ = (
+        Index(
+            "ix_comment_blog_id_parent_id_created_at",
+            "blog_id",
+            "parent_id",
+            "created_at",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
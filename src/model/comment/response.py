@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class CommentAuthorResponse(BaseModel):
+    id: int
+    name: str
+
+    class Config:
+        from_attributes = True
+
+
+# 페이지 단위로 내려주는 댓글 한 건. 대댓글은 포함하지 않고 개수만 알려줍니다.
+class CommentNodeResponse(BaseModel):
+    id: int
+    content: str
+    author: CommentAuthorResponse | None = None
+    parent_id: int | None = None
+    created_at: datetime
+    # 바로 아래 대댓글 수. 0보다 크면 클라이언트가 "답글 더보기"로 펼칠 수 있습니다.
+    reply_count: int = 0
+
+    class Config:
+        from_attributes = True
+
+
+# 블로그 전체 댓글 트리(/comments/)의 한 노드. 대댓글을 replies에 작성순으로 중첩합니다.
+class CommentTreeResponse(BaseModel):
+    id: int
+    content: str
+    author: CommentAuthorResponse | None = None
+    parent_id: int | None = None
+    created_at: datetime | None = None
+    replies: list["CommentTreeResponse"] = []
+
+
+class CommentPageResponse(BaseModel):
+    items: list[CommentNodeResponse]
+    # 다음 페이지를 요청할 때 사용할 커서. 마지막 페이지라면 None
+    next_cursor: str | None = None
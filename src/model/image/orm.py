@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.model.base import Base
+
+
+# 내용 해시로 이름 붙여 저장한(content-addressed) 업로드 이미지 파일과 참조 수를 관리합니다.
+# 같은 이미지를 여러 번 올려도 파일은 하나만 저장되고 ref_count만 늘어납니다.
+class StoredImage(Base):
+    __tablename__ = "stored_image"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    # Blog.image_loc에 저장되는 것과 같은 웹 경로입니다. (예: /src/static/images/ab/ab12...ef.png)
+    path: Mapped[str] = mapped_column(String(255), unique=True)
+    content_hash: Mapped[str] = mapped_column(String(64), index=True)
+    ref_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+    # 참조 수가 0이 된 시각. 백그라운드 정리 작업이 유예 시간이 지난 파일을 삭제합니다.
+    released_at: Mapped[datetime.datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -4,6 +4,7 @@ from pydantic import BaseModel
 class TagResponse(BaseModel):
     id: int
     name: str
+    usage_count: int = 0
 
     class Config:
         from_attributes = True
@@ -0,0 +1,30 @@
+import json
+from dataclasses import dataclass
+from typing import Any
+
+
+# 세션에 저장된 로그인 사용자 정보를 담는 가벼운 객체입니다.
+# SQLAlchemy ORM 계측(instrumentation) 없이 요청당 한 번만 만들어 모든 의존성과 템플릿이 공유합니다.
+# DB에 영속된 User가 실제로 필요한 경우에만 서비스에서 ORM 객체를 조회합니다.
+@dataclass(frozen=True, slots=True)
+class SessionUser:
+    id: int
+    name: str
+    email: str
+    is_email_verified: bool = False
+
+    @classmethod
+    def from_session(cls, session_data: dict[str, Any]) -> "SessionUser | None":
+        try:
+            return cls(
+                id=int(session_data["id"]),
+                name=str(session_data["name"]),
+                email=str(session_data["email"]),
+                is_email_verified=bool(session_data.get("is_email_verified")),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def to_json(self) -> str:
+        """템플릿의 스크립트에서 사용할 공개 정보만 JSON으로 직렬화합니다."""
+        return json.dumps({"id": self.id, "name": self.name, "email": self.email})
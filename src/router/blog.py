@@ -1,13 +1,30 @@
-from fastapi import APIRouter, Depends, File, Form, Request, UploadFile, status
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from functools import partial
+from typing import Any
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dependencies.auth import get_current_user, get_current_user_or_none
-from src.model.user.orm import User
-from src.model.user.response import UserResponse
-from src.service.blog_svc import BlogService
+from src.manager.page_cache_manager import PAGE_CACHE_HEADERS, page_cache_manager
+from src.model.user.session import SessionUser
+from src.service.blog_svc import BLOG_PAGE_SIZE, BlogService
 from src.service.comment_svc import CommentService
-from src.utils.db.db import get_db_session
+from src.service.search_svc import SearchService
+from src.utils.db.db import (
+    get_db_session,
+    get_page_read_db_session,
+    get_read_db_session,
+)
 from src.utils.jinja_template import jinja_manager
 
 router = APIRouter(prefix="/blogs", tags=["blogs"])
@@ -15,23 +32,82 @@ router = APIRouter(prefix="/blogs", tags=["blogs"])
 template = jinja_manager.templates
 
 
+def _stream_page(
+    request: Request,
+    name: str,
+    context: dict[str, Any],
+    cache_key: str | None,
+    cache_version: str,
+) -> Response:
+    """
+    페이지를 스트리밍으로 렌더링합니다. cache_key가 있으면(비로그인) 렌더링이 끝난 뒤 캐시에 저장하고,
+    캐시 응답과 같은 ETag/Last-Modified를 첫 응답에도 붙입니다.
+    """
+    headers = dict(PAGE_CACHE_HEADERS)
+    on_complete = None
+    if cache_key:
+        page = page_cache_manager.begin_page(cache_key, cache_version)
+        headers = page.headers
+        on_complete = partial(
+            page_cache_manager.set_page, cache_key, version=cache_version, page=page
+        )
+    return jinja_manager.stream_response(
+        request=request,
+        name=name,
+        context=context,
+        headers=headers,
+        on_complete=on_complete,
+    )
+
+
 # 모든 블로그 글 조회
 @router.get("/")
 async def get_all_blogs(
     request: Request,
-    current_user: User | None = Depends(get_current_user_or_none),
-    session: AsyncSession = Depends(get_db_session),
+    cursor: str | None = None,
+    limit: int = Query(BLOG_PAGE_SIZE, ge=1, le=50),
+    current_user: SessionUser | None = Depends(get_current_user_or_none),
+    session: AsyncSession = Depends(get_page_read_db_session),
+) -> Response:
+    # 비로그인 사용자는 Redis에 캐시된 렌더링 결과를 우선 사용합니다.
+    cache_key, cache_version = None, ""
+    if current_user is None:
+        cache_key = page_cache_manager.build_key(
+            "blogs:index", cursor=cursor, limit=limit
+        )
+        cached_page, cache_version = await page_cache_manager.get_page(cache_key)
+        if cached_page:
+            return cached_page.to_response(request)
+
+    blog_page = await BlogService().get_all_blogs(session, cursor, limit)
+    # 목록이 길어도 첫 바이트가 늦지 않도록 스트리밍으로 렌더링하고, 끝나면 캐시에 저장합니다.
+    return _stream_page(
+        request,
+        "index.html",
+        {
+            "all_blogs": blog_page.items,
+            "next_cursor": blog_page.next_cursor,
+            "session_user": current_user,
+        },
+        cache_key,
+        cache_version,
+    )
+
+
+# 블로그 제목/본문 검색
+@router.get("/search")
+async def search_blogs(
+    request: Request,
+    q: str = Query("", max_length=100),
+    page: int = Query(1, ge=1, le=100),
+    current_user: SessionUser | None = Depends(get_current_user_or_none),
+    session: AsyncSession = Depends(get_read_db_session),
 ) -> HTMLResponse:
-    all_blogs_dto = await BlogService().get_all_blogs(session)
+    search_page = await SearchService().search_blogs(q, session, page)
     return template.TemplateResponse(
         request=request,
-        name="index.html",
-        context={
-            "request": request,
-            "all_blogs": all_blogs_dto,
-            "session_user": current_user,
-        },
-        status_code=200,
+        name="search.html",
+        context={"search": search_page, "session_user": current_user},
     )
 
 
@@ -40,27 +116,30 @@ async def get_all_blogs(
 async def get_blog_by_id(
     request: Request,
     blog_id: int,
-    current_user: User | None = Depends(get_current_user_or_none),
-    session: AsyncSession = Depends(get_db_session),
-) -> HTMLResponse:
+    current_user: SessionUser | None = Depends(get_current_user_or_none),
+    session: AsyncSession = Depends(get_page_read_db_session),
+) -> Response:
+    cache_key, cache_version = None, ""
+    if current_user is None:
+        cache_key = page_cache_manager.build_key("blogs:show", blog_id=blog_id)
+        cached_page, cache_version = await page_cache_manager.get_page(cache_key)
+        if cached_page:
+            return cached_page.to_response(request)
+
     blog_dto = await BlogService().get_blog_by_id(blog_id, session)
     comments = await CommentService().get_comments_by_blog_id(blog_id, session)
 
-    session_user_dto = (
-        UserResponse.model_validate(current_user) if current_user else None
-    )
-
-    return template.TemplateResponse(
-        request=request,
-        name="show_blog.html",
-        context={
-            "request": request,
+    return _stream_page(
+        request,
+        "show_blog.html",
+        {
             "blog": blog_dto,
             "comments": comments,
-            "session_user": session_user_dto,
+            "session_user": current_user,
             "is_valid_auth": current_user and current_user.id == blog_dto.author.id,
         },
-        status_code=200,
+        cache_key,
+        cache_version,
     )
 
 
@@ -68,7 +147,7 @@ async def get_blog_by_id(
 @router.get("/new")
 def get_create_blog_ui(
     request: Request,
-    current_user: User = Depends(get_current_user),
+    current_user: SessionUser = Depends(get_current_user),
 ) -> HTMLResponse:
     return template.TemplateResponse(
         request=request,
@@ -79,7 +158,7 @@ def get_create_blog_ui(
 
 @router.post("/new")
 async def create_blog(
-    current_user: User = Depends(get_current_user),
+    current_user: SessionUser = Depends(get_current_user),
     title: str = Form(min_length=2, max_length=200),
     content: str = Form(min_length=2, max_length=4000),
     tags: str = Form(""),
@@ -97,8 +176,8 @@ async def create_blog(
 async def get_update_blog_ui(
     request: Request,
     blog_id: int,
-    session: AsyncSession = Depends(get_db_session),
-    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_db_session),
+    current_user: SessionUser = Depends(get_current_user),
 ) -> HTMLResponse:
     blog_orm = await BlogService()._get_blog_orm_by_id(blog_id, session)
 
@@ -117,7 +196,7 @@ async def update_blog(
     tags: str = Form(""),
     image_file: UploadFile | None = File(None),
     session: AsyncSession = Depends(get_db_session),
-    current_user: User = Depends(get_current_user),
+    current_user: SessionUser = Depends(get_current_user),
 ) -> RedirectResponse:
     await BlogService().update_blog(
         blog_id, title, content, tags, image_file, session, current_user
@@ -131,7 +210,7 @@ async def update_blog(
 async def delete_blog(
     blog_id: int,
     session: AsyncSession = Depends(get_db_session),
-    current_user: User = Depends(get_current_user),
+    current_user: SessionUser = Depends(get_current_user),
 ) -> JSONResponse:
     await BlogService().delete_blog(blog_id, session, current_user)
     return JSONResponse(
@@ -143,17 +222,25 @@ async def delete_blog(
 async def get_blogs_by_tag(
     request: Request,
     tag_name: str,
-    session: AsyncSession = Depends(get_db_session),
-    current_user: User | None = Depends(get_current_user_or_none),
-) -> HTMLResponse:
+    session: AsyncSession = Depends(get_page_read_db_session),
+    current_user: SessionUser | None = Depends(get_current_user_or_none),
+) -> Response:
+    cache_key, cache_version = None, ""
+    if current_user is None:
+        cache_key = page_cache_manager.build_key("blogs:tag", tag=tag_name)
+        cached_page, cache_version = await page_cache_manager.get_page(cache_key)
+        if cached_page:
+            return cached_page.to_response(request)
+
     blogs_dto = await BlogService().get_blogs_by_tag(tag_name, session)
-    return template.TemplateResponse(
-        request=request,
-        name="index.html",
-        context={
+    return _stream_page(
+        request,
+        "index.html",
+        {
             "all_blogs": blogs_dto,
             "session_user": current_user,
             "filter_tag": tag_name,
         },
-        status_code=200,
+        cache_key,
+        cache_version,
     )
@@ -1,25 +1,58 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dependencies.auth import get_current_user
 from src.model.comment.request import CommentRequest
-from src.model.user.orm import User
-from src.service.comment_svc import CommentService
-from src.utils.db.db import get_db_session
+from src.model.comment.response import CommentPageResponse, CommentTreeResponse
+from src.model.user.session import SessionUser
+from src.service.comment_svc import COMMENT_PAGE_SIZE, CommentService
+from src.utils.db.db import get_db_session, get_read_db_session
+from src.utils.serializer import FastJSONResponse
 
-router = APIRouter(prefix="/comments", tags=["comments"])
+router = APIRouter(
+    prefix="/comments", tags=["comments"], default_response_class=FastJSONResponse
+)
 
 
-@router.get("/")
-async def get_comments(blog_id: int, session: AsyncSession = Depends(get_db_session)):
-    return await CommentService().get_comments_by_blog_id(blog_id, session)
+# 핸들러가 FastJSONResponse를 그대로 반환하므로 response_model은 검증 없이 OpenAPI 문서에만 쓰입니다.
+@router.get("/", response_model=list[CommentTreeResponse])
+async def get_comments(
+    blog_id: int, session: AsyncSession = Depends(get_read_db_session)
+) -> Response:
+    # 댓글 트리(dict)를 jsonable_encoder 없이 한 번에 bytes로 직렬화합니다.
+    comments = await CommentService().get_comments_by_blog_id(blog_id, session)
+    return FastJSONResponse(comments)
+
+
+# 최상위 댓글을 페이지 단위로 조회합니다. 대댓글은 reply_count만 내려줍니다.
+@router.get("/page", response_model=CommentPageResponse)
+async def get_comment_page(
+    blog_id: int,
+    cursor: str | None = None,
+    limit: int = Query(COMMENT_PAGE_SIZE, ge=1, le=100),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    page = await CommentService().get_comment_page(blog_id, session, cursor, limit)
+    return FastJSONResponse(page.model_dump())
+
+
+# 특정 댓글의 대댓글을 페이지 단위로 조회합니다("답글 더보기").
+@router.get("/{parent_id}/replies", response_model=CommentPageResponse)
+async def get_reply_page(
+    parent_id: int,
+    cursor: str | None = None,
+    limit: int = Query(COMMENT_PAGE_SIZE, ge=1, le=100),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    page = await CommentService().get_reply_page(parent_id, session, cursor, limit)
+    return FastJSONResponse(page.model_dump())
 
 
 @router.post("/")
 async def create_comment(
     comment: CommentRequest,
     session: AsyncSession = Depends(get_db_session),
-    session_user: User = Depends(get_current_user),
+    session_user: SessionUser = Depends(get_current_user),
 ):
     return await CommentService().create_comment(comment, session, session_user)
 
@@ -29,7 +62,7 @@ async def update_comment(
     comment_id: int,
     comment: CommentRequest,
     session: AsyncSession = Depends(get_db_session),
-    session_user: User = Depends(get_current_user),
+    session_user: SessionUser = Depends(get_current_user),
 ):
     return await CommentService().update_comment(
         comment_id, comment, session, session_user
@@ -40,6 +73,6 @@ async def update_comment(
 async def delete_comment(
     comment_id: int,
     session: AsyncSession = Depends(get_db_session),
-    session_user: User = Depends(get_current_user),
+    session_user: SessionUser = Depends(get_current_user),
 ):
     return await CommentService().delete_comment(comment_id, session, session_user)
@@ -0,0 +1,56 @@
+import os
+import secrets
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from src.utils import metrics
+from src.utils.db.db import db
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+# X-Internal-Token 헤더가 이 값과 일치하는 요청만 허용합니다.
+# 설정하지 않으면 내부 경로는 모든 요청에 404로 응답합니다(기본 차단).
+INTERNAL_METRICS_TOKEN = os.getenv("INTERNAL_METRICS_TOKEN", "")
+
+
+def _check_internal_token(request: Request) -> None:
+    # compare_digest는 ASCII가 아닌 str을 받으면 TypeError를 내므로 bytes로 비교합니다.
+    # (헤더 값은 latin-1로 디코딩되어 있으므로 같은 인코딩으로 되돌립니다.)
+    token = request.headers.get("x-internal-token", "").encode("latin-1")
+    if not INTERNAL_METRICS_TOKEN or not secrets.compare_digest(
+        token, INTERNAL_METRICS_TOKEN.encode()
+    ):
+        # 내부용 경로가 있다는 사실도 드러내지 않도록 404로 응답합니다.
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+
+def _collect_pool_metrics() -> None:
+    for database, pool in db.pool_metrics().items():
+        if "size" not in pool:
+            continue
+        metrics.db_pool_size.set(pool["size"], database)
+        metrics.db_pool_checked_in.set(pool["checked_in"], database)
+        metrics.db_pool_checked_out.set(pool["checked_out"], database)
+        metrics.db_pool_overflow.set(pool["overflow"], database)
+        if "checkouts" not in pool:
+            continue
+        metrics.db_pool_checkouts_total.set(pool["checkouts"], database)
+        metrics.db_pool_checkout_timeouts_total.set(pool["checkout_timeouts"], database)
+        metrics.db_pool_checkout_wait_seconds_total.set(
+            pool["checkout_wait_seconds_total"], database
+        )
+        metrics.db_pool_checkout_wait_seconds_max.set(
+            pool["checkout_wait_seconds_max"], database
+        )
+
+
+metrics.metrics_registry.register_collector(_collect_pool_metrics)
+
+
+# 요청/DB/Redis/커넥션 풀 메트릭을 Prometheus 텍스트 형식으로 반환합니다.
+@router.get("/metrics")
+async def get_metrics(request: Request) -> Response:
+    _check_internal_token(request)
+    return Response(
+        content=metrics.metrics_registry.render(), media_type=metrics.CONTENT_TYPE
+    )
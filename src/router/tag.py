@@ -1,20 +1,26 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.model.tag.response import TagResponse
 from src.service.tag_svc import TagService
-from src.utils.db.db import get_db_session
+from src.utils.db.db import get_db_session, get_read_db_session
+from src.utils.serializer import FastJSONResponse
 
-router = APIRouter(prefix="/tags", tags=["tags"])
+router = APIRouter(
+    prefix="/tags", tags=["tags"], default_response_class=FastJSONResponse
+)
 
 
-@router.get("/")
+# 핸들러가 FastJSONResponse를 그대로 반환하므로 response_model은 검증 없이 OpenAPI 문서에만 쓰입니다.
+@router.get("/", response_model=list[TagResponse])
 async def get_tags(
-    blog_id: int, session: AsyncSession = Depends(get_db_session)
-) -> list[TagResponse]:
+    blog_id: int, session: AsyncSession = Depends(get_read_db_session)
+) -> Response:
     tags = await TagService().get_tags_by_blog_id(blog_id, session)
-    return [TagResponse.model_validate(tag) for tag in tags]
+    return FastJSONResponse(
+        [TagResponse.model_validate(tag).model_dump() for tag in tags]
+    )
 
 
 @router.delete("/delete/{tag_id}")
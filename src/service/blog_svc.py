@@ -1,21 +1,39 @@
+from collections.abc import Sequence
+from functools import partial
+
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import delete, select
+from sqlalchemy import Row, Select, and_, delete, or_, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from src.manager.image_manager import ImageManager
+from src.manager.page_cache_manager import page_cache_manager
+from src.manager.search_index_manager import search_index_manager
 from src.model.blog.orm import Blog
-from src.model.blog.response import BlogListResponse, BlogResponse
-from src.model.tag.orm import Tag
+from src.model.blog.response import BlogListItem, BlogListPage, BlogResponse
+from src.model.tag.orm import Tag, post_tags_table
 from src.model.user.orm import User
+from src.model.user.session import SessionUser
+from src.service.image_svc import ImageService
+from src.service.loaders import BLOG_LOADERS
+from src.service.search_svc import build_index_document
 from src.service.tag_svc import TagService
-from src.utils.text_helper import newline_to_br
+from src.utils.db.db import add_after_commit_hook
+from src.utils.pagination import decode_cursor, encode_cursor
+from src.utils.text_helper import make_excerpt, render_content_html
+from src.worker.tasks import process_image
+
+# 블로그 목록 한 페이지에 보여줄 글 수
+BLOG_PAGE_SIZE = 10
+# 목록 카드/상세 페이지에서 기본으로 사용할 이미지 폭(px)
+LIST_IMAGE_WIDTH = 640
+DETAIL_IMAGE_WIDTH = 1280
 
 
 class BlogService:
     def __init__(self) -> None:
         self.image_manager = ImageManager()
+        self.image_service = ImageService()
 
     async def _get_blog_orm_by_id(
         self, blog_id: int, session: AsyncSession
@@ -23,37 +41,47 @@ class BlogService:
         """
         내부 로직 전용: ID로 원본 Blog ORM 객체를 가져옵니다.
         """
-        stmt = (
-            select(Blog)
-            .options(joinedload(Blog.author), joinedload(Blog.tags))
-            .where(Blog.id == blog_id)
-        )
+        stmt = select(Blog).options(*BLOG_LOADERS).where(Blog.id == blog_id)
         result = await session.execute(stmt)
-        return result.unique().scalar_one_or_none()
+        return result.scalar_one_or_none()
 
-    async def get_all_blogs(self, session: AsyncSession) -> list[BlogListResponse]:
+    async def get_all_blogs(
+        self,
+        session: AsyncSession,
+        cursor: str | None = None,
+        limit: int = BLOG_PAGE_SIZE,
+    ) -> BlogListPage:
         """
-        블로그 목록 페이지를 위한 DTO 리스트를 반환합니다.
+        블로그 목록 페이지를 위한 DTO 리스트를 (modified_dt, id) 커서 기준으로 한 페이지만 반환합니다.
         """
         try:
-            stmt = (
-                select(Blog)
-                .options(joinedload(Blog.author), joinedload(Blog.tags))
-                .order_by(Blog.modified_dt.desc())
+            stmt = self._list_item_query().order_by(
+                Blog.modified_dt.desc(), Blog.id.desc()
             )
+            if cursor:
+                cursor_dt, cursor_id = decode_cursor(cursor)
+                stmt = stmt.where(
+                    or_(
+                        Blog.modified_dt < cursor_dt,
+                        and_(Blog.modified_dt == cursor_dt, Blog.id < cursor_id),
+                    )
+                )
+            # 다음 페이지 존재 여부를 알기 위해 한 건을 더 가져옵니다.
+            stmt = stmt.limit(limit + 1)
             result = await session.execute(stmt)
-            blogs_orm = result.unique().scalars().all()
+            rows = result.all()
 
-            # ORM 객체 리스트를 Pydantic DTO 리스트로 변환
-            # BlogListResponse가 자동으로 내용을 자릅니다.
-            blog_dtos = [BlogListResponse.model_validate(b) for b in blogs_orm]
+            has_next = len(rows) > limit
+            items = await self._to_list_items(rows[:limit], session)
 
-            for blog_dto in blog_dtos:
-                blog_dto.image_loc = self.image_manager.resolve_image_url(
-                    blog_dto.image_loc
-                )
-            return blog_dtos
+            next_cursor = None
+            if has_next:
+                last = items[-1]
+                next_cursor = encode_cursor(last.modified_dt, last.id)
+            return BlogListPage(items=items, next_cursor=next_cursor)
 
+        except HTTPException:
+            raise
         except Exception as e:
             # 디버깅 로그는 유지
             print(f"Error in get_all_blogs: {e}")
@@ -75,14 +103,9 @@ class BlogService:
                     detail="블로그 글을 찾을 수 없습니다.",
                 )
 
-            # ORM 객체를 BlogResponse DTO로 변환
+            # ORM 객체를 BlogResponse DTO로 변환 (본문 HTML은 저장 시 만들어 둔 값을 사용)
             blog_dto = BlogResponse.model_validate(blog_orm)
-
-            # DTO의 content를 가공 (줄바꿈 처리)
-            blog_dto.content = newline_to_br(blog_dto.content)
-            blog_dto.image_loc = self.image_manager.resolve_image_url(
-                blog_dto.image_loc
-            )
+            self._apply_image_urls(blog_dto, DETAIL_IMAGE_WIDTH)
 
             return blog_dto
         except Exception as e:
@@ -99,7 +122,7 @@ class BlogService:
         tags_str: str,
         image_file: UploadFile | None,
         session: AsyncSession,
-        session_user: User,
+        session_user: SessionUser,
     ) -> None:
         try:
             if not session_user.id:
@@ -110,25 +133,36 @@ class BlogService:
 
             image_loc = None
             if image_file and image_file.filename:
-                image_loc = await self.image_manager.save_image(
-                    session_user.email, image_file
-                )
-
-                # 태그 처리
-                tag_names = [
-                    name.strip() for name in tags_str.split(",") if name.strip()
-                ]
-                tags = await TagService().create_tags(tag_names, session)
+                saved_image = await self.image_manager.save_image(image_file)
+                try:
+                    # 참조(행 잠금)를 먼저 잡은 뒤 파일을 놓아야 정리 작업과 엇갈리지 않습니다.
+                    await self.image_service.acquire(saved_image, session)
+                    if self.image_manager.place_image(saved_image):
+                        self._enqueue_image_processing(saved_image.url)
+                finally:
+                    self.image_manager.discard_image(saved_image)
+                image_loc = saved_image.url
+
+            # 태그 처리
+            tag_names = [name.strip() for name in tags_str.split(",") if name.strip()]
+            tags = await TagService().create_tags(tag_names, session)
 
             new_blog = Blog(
                 title=title,
                 content=content,
+                content_html=render_content_html(content),
+                excerpt=make_excerpt(content),
                 author_id=session_user.id,
                 image_loc=image_loc,
                 tags=tags,
             )
             session.add(new_blog)
             await session.flush()
+            await TagService().adjust_usage_counts([t.id for t in tags], 1, session)
+            add_after_commit_hook(session, page_cache_manager.invalidate)
+            self._schedule_index_update(
+                session, new_blog, session_user.name, [t.name for t in tags]
+            )
 
         except SQLAlchemyError as e:
             print(f"SQLAlchemyError in create_blog: {e}")
@@ -138,7 +172,7 @@ class BlogService:
             ) from e
 
     async def delete_blog(
-        self, blog_id: int, session: AsyncSession, session_user: User
+        self, blog_id: int, session: AsyncSession, session_user: SessionUser
     ) -> None:
         try:
             blog_orm = await self._get_blog_orm_by_id(blog_id, session)
@@ -153,8 +187,17 @@ class BlogService:
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="권한이 없습니다.",
                 )
+            await TagService().adjust_usage_counts(
+                [t.id for t in blog_orm.tags], -1, session
+            )
+            await self.image_service.release(blog_orm.image_loc, session)
             stmt = delete(Blog).where(Blog.id == blog_id)
             await session.execute(stmt)
+            add_after_commit_hook(session, page_cache_manager.invalidate)
+            if search_index_manager.enabled:
+                add_after_commit_hook(
+                    session, partial(search_index_manager.remove, blog_id)
+                )
 
         except SQLAlchemyError as e:
             raise HTTPException(
@@ -170,7 +213,7 @@ class BlogService:
         tags_str: str,
         image_file: UploadFile | None,
         session: AsyncSession,
-        session_user: User,
+        session_user: SessionUser,
     ) -> None:
         try:
             blog_orm = await self._get_blog_orm_by_id(blog_id, session)
@@ -193,19 +236,43 @@ class BlogService:
             # 2. 블로그의 제목, 내용, 이미지 위치를 업데이트합니다.
             image_loc = blog_orm.image_loc
             if image_file and image_file.filename:
-                image_loc = await self.image_manager.save_image(
-                    session_user.email, image_file
-                )
+                saved_image = await self.image_manager.save_image(image_file)
+                try:
+                    # 새 이미지의 참조를 먼저 잡고 기존 이미지의 참조를 놓아야
+                    # 같은 이미지를 다시 올린 경우에도 참조 수가 0으로 떨어지지 않습니다.
+                    await self.image_service.acquire(saved_image, session)
+                    await self.image_service.release(blog_orm.image_loc, session)
+                    # 참조(행 잠금)를 먼저 잡은 뒤 파일을 놓아야 정리 작업과 엇갈리지 않습니다.
+                    if self.image_manager.place_image(saved_image):
+                        self._enqueue_image_processing(saved_image.url)
+                finally:
+                    self.image_manager.discard_image(saved_image)
+                image_loc = saved_image.url
 
             # 3. ORM 객체의 속성을 직접 수정한 뒤 세션에 추가합니다.
             # 이렇게 해야 SQLAlchemy가 'tags' 관계의 변경을 감지하고
             # 연관 테이블(post_tags)을 자동으로 업데이트할 수 있습니다.
             blog_orm.title = title
             blog_orm.content = content
+            blog_orm.content_html = render_content_html(content)
+            blog_orm.excerpt = make_excerpt(content)
             blog_orm.image_loc = image_loc
+            old_tag_ids = {t.id for t in blog_orm.tags}
+            new_tag_ids = {t.id for t in new_tags}
             blog_orm.tags = new_tags  # 태그 목록을 새 것으로 교체
 
+            # 추가/제거된 태그만 usage_count를 갱신합니다.
+            tag_service = TagService()
+            await tag_service.adjust_usage_counts(new_tag_ids - old_tag_ids, 1, session)
+            await tag_service.adjust_usage_counts(
+                old_tag_ids - new_tag_ids, -1, session
+            )
+
             session.add(blog_orm)
+            add_after_commit_hook(session, page_cache_manager.invalidate)
+            self._schedule_index_update(
+                session, blog_orm, blog_orm.author.name, [t.name for t in new_tags]
+            )
 
         except SQLAlchemyError as e:
             raise HTTPException(
@@ -215,36 +282,21 @@ class BlogService:
 
     async def get_blogs_by_tag(
         self, tag_name: str, session: AsyncSession
-    ) -> list[BlogListResponse]:
+    ) -> list[BlogListItem]:
         """
         특정 태그에 해당하는 블로그 목록을 가져옵니다.
         """
         try:
-            # 태그 이름으로 Tag ORM 객체를 찾고, 관련된 Blog 객체들을 함께 로드합니다.
+            # 태그 이름으로 조인해 해당 태그가 달린 블로그만 가져옵니다.
+            # 태그가 없거나 연결된 블로그가 없으면 빈 리스트가 됩니다.
             stmt = (
-                select(Tag)
-                .options(
-                    joinedload(Tag.blogs).joinedload(Blog.author),
-                    joinedload(Tag.blogs).joinedload(Blog.tags),
-                )
+                self._list_item_query()
+                .join(Blog.tags)
                 .where(Tag.name == tag_name)
+                .order_by(Blog.modified_dt.desc(), Blog.id.desc())
             )
             result = await session.execute(stmt)
-            tag_orm = result.unique().scalar_one_or_none()
-
-            if not tag_orm:
-                # 해당 태그가 없거나, 태그에 연결된 블로그가 없을 경우 빈 리스트 반환
-                return []
-
-            # ORM 객체 리스트를 Pydantic DTO 리스트로 변환
-            blog_dtos = [BlogListResponse.model_validate(b) for b in tag_orm.blogs]
-
-            # 이미지 URL 처리
-            for blog_dto in blog_dtos:
-                blog_dto.image_loc = self.image_manager.resolve_image_url(
-                    blog_dto.image_loc
-                )
-            return blog_dtos
+            return await self._to_list_items(result.all(), session)
 
         except Exception as e:
             print(f"Error in get_blogs_by_tag: {e}")
@@ -253,5 +305,83 @@ class BlogService:
                 detail=f"태그별 블로그 목록을 가져오는 중 오류 발생: {e}",
             ) from e
 
-    def _is_authorized(self, session_user: User, author_id: int) -> bool:
+    def _list_item_query(self) -> Select:
+        """
+        목록 카드에 필요한 컬럼만 조회하는 쿼리입니다.
+        본문(content, content_html)은 읽지 않고 저장 시 만들어 둔 요약문만 가져옵니다.
+        """
+        return select(
+            Blog.id,
+            Blog.title,
+            Blog.excerpt,
+            Blog.modified_dt,
+            Blog.image_loc,
+            Blog.comment_count,
+            User.name.label("author_name"),
+        ).join(Blog.author)
+
+    async def _to_list_items(
+        self, rows: Sequence[Row], session: AsyncSession
+    ) -> list[BlogListItem]:
+        """
+        조회한 행을 목록 DTO로 옮기고, 태그 이름은 블로그 id 목록으로 한 번에 조회해 채웁니다.
+        """
+        items = [
+            BlogListItem(
+                id=row.id,
+                title=row.title,
+                excerpt=row.excerpt,
+                modified_dt=row.modified_dt,
+                image_loc=row.image_loc,
+                comment_count=row.comment_count,
+                author_name=row.author_name,
+            )
+            for row in rows
+        ]
+        if not items:
+            return items
+
+        tag_names: dict[int, list[str]] = {}
+        result = await session.execute(
+            select(post_tags_table.c.blog_id, Tag.name)
+            .join(Tag, Tag.id == post_tags_table.c.tag_id)
+            .where(post_tags_table.c.blog_id.in_([item.id for item in items]))
+            .order_by(post_tags_table.c.blog_id, Tag.id)
+        )
+        for blog_id, name in result.all():
+            tag_names.setdefault(blog_id, []).append(name)
+
+        for item in items:
+            item.tag_names = tag_names.get(item.id, [])
+            self._apply_image_urls(item, LIST_IMAGE_WIDTH)
+        return items
+
+    def _apply_image_urls(
+        self, blog_dto: BlogResponse | BlogListItem, width: int
+    ) -> None:
+        """
+        DTO의 이미지 경로를 화면에 맞는 리사이즈 버전 URL과 srcset으로 바꿉니다.
+        """
+        image_loc = blog_dto.image_loc
+        blog_dto.image_loc = self.image_manager.resolve_image_url(image_loc, width)
+        blog_dto.image_srcset = self.image_manager.resolve_image_srcset(
+            image_loc, "jpg"
+        )
+        blog_dto.image_srcset_webp = self.image_manager.resolve_image_srcset(
+            image_loc, "webp"
+        )
+
+    def _schedule_index_update(
+        self, session: AsyncSession, blog: Blog, author_name: str, tag_names: list[str]
+    ) -> None:
+        # 프로세스 내 검색 인덱스는 커밋이 성공한 뒤에만 갱신합니다.
+        if search_index_manager.enabled:
+            doc = build_index_document(blog, author_name, tag_names)
+            add_after_commit_hook(session, partial(search_index_manager.upsert, doc))
+
+    def _enqueue_image_processing(self, image_loc: str) -> None:
+        # 리사이즈/인코딩은 CPU를 많이 쓰므로 웹 프로세스가 아닌 Celery 워커에서 처리합니다.
+        process_image.delay(self.image_manager.to_file_path(image_loc))
+
+    def _is_authorized(self, session_user: SessionUser, author_id: int) -> bool:
         return session_user.id == author_id
@@ -1,22 +1,32 @@
-from datetime import datetime
+from collections.abc import Sequence
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, select, update
+from sqlalchemy import Select, and_, delete, func, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
+from src.manager.page_cache_manager import page_cache_manager
+from src.model.blog.orm import Blog
 from src.model.comment.orm import Comment
 from src.model.comment.request import CommentRequest
-from src.model.user.orm import User
+from src.model.comment.response import CommentNodeResponse, CommentPageResponse
+from src.model.user.session import SessionUser
+from src.service.loaders import COMMENT_LOADERS
+from src.utils.db.db import add_after_commit_hook
+from src.utils.pagination import decode_cursor, encode_cursor
+
+# 댓글 페이지 한 번에 내려줄 댓글 수
+COMMENT_PAGE_SIZE = 20
+# 댓글 트리의 최대 중첩 깊이. 이보다 깊은 대댓글은 이 깊이의 조상 아래에 작성순으로 평평하게 붙입니다.
+# JSON 직렬화(orjson은 254단계 제한, 표준 json과 Jinja tojson은 재귀)가 깊은 스레드에서 실패하지 않도록
+# 트리를 만드는 단계에서 깊이를 제한합니다. (화면은 최상위 댓글 아래로 모든 대댓글을 한 단계로 보여줌)
+MAX_COMMENT_DEPTH = 32
 
 
 class CommentService:
     @staticmethod
-    def _serialize_comment(
-        comment: Comment, children_map: dict[int, list[Comment]]
-    ) -> dict:
-        """재귀적으로 Comment 객체를 JSON 직렬화"""
+    def _serialize_comment(comment: Comment) -> dict:
+        """Comment 객체 하나를 JSON 직렬화 가능한 dict로 변환합니다. replies는 비워 둡니다."""
         return {
             "id": comment.id,
             "content": comment.content,
@@ -27,19 +37,44 @@ class CommentService:
             "created_at": comment.created_at.isoformat()
             if comment.created_at
             else None,
-            "replies": [
-                CommentService._serialize_comment(reply, children_map)
-                for reply in sorted(
-                    children_map.get(comment.id, []),
-                    key=lambda r: r.created_at
-                    if isinstance(r.created_at, datetime)
-                    else datetime.fromisoformat(r.created_at),
-                )
-            ],
+            "replies": [],
         }
 
+    @staticmethod
+    def _build_comment_tree(comments: Sequence[Comment]) -> list[dict]:
+        """
+        작성순으로 정렬된 댓글 목록을 재귀 없이 O(n)으로 트리 구조로 조립합니다.
+        입력이 이미 정렬되어 있으므로 각 replies 리스트도 추가 정렬 없이 작성순을 유지합니다.
+        MAX_COMMENT_DEPTH보다 깊은 대댓글은 그 깊이의 조상 replies에 붙입니다(parent_id는 그대로 유지).
+        """
+        nodes = {c.id: CommentService._serialize_comment(c) for c in comments}
+        # 댓글 id -> (자식을 붙일 노드 id, 그 노드의 깊이)
+        attach_to: dict[int, tuple[int, int]] = {}
+
+        roots: list[dict] = []
+        for c in comments:
+            node = nodes[c.id]
+            if c.parent_id is None:
+                roots.append(node)
+                attach_to[c.id] = (c.id, 1)
+            elif c.parent_id in nodes:
+                # 부모가 정렬상 뒤에 있는 경우(작성 시각 역전)에는 부모 바로 아래에 붙입니다.
+                container_id, container_depth = attach_to.get(
+                    c.parent_id, (c.parent_id, MAX_COMMENT_DEPTH - 1)
+                )
+                nodes[container_id]["replies"].append(node)
+                depth = container_depth + 1
+                if depth < MAX_COMMENT_DEPTH:
+                    attach_to[c.id] = (c.id, depth)
+                else:
+                    attach_to[c.id] = (container_id, container_depth)
+        return roots
+
     async def create_comment(
-        self, comment: CommentRequest, session: AsyncSession, session_user: User
+        self,
+        comment: CommentRequest,
+        session: AsyncSession,
+        session_user: SessionUser,
     ) -> Comment:
         try:
             if not session_user.id:
@@ -56,7 +91,9 @@ class CommentService:
             )
             session.add(new_comment)
             await session.flush()
+            await self._adjust_comment_count(comment.blog_id, 1, session)
             await session.refresh(new_comment, ["author"])
+            add_after_commit_hook(session, page_cache_manager.invalidate)
 
             # 새 댓글은 children_map이 필요 없으므로 replies = [] 처리
             return new_comment
@@ -75,7 +112,7 @@ class CommentService:
             stmt = (
                 select(Comment)
                 .where(Comment.id == comment_id)
-                .options(joinedload(Comment.author))
+                .options(*COMMENT_LOADERS)
             )
             result = await session.execute(stmt)
             return result.scalar_one_or_none()
@@ -90,7 +127,7 @@ class CommentService:
         comment_id: int,
         comment: CommentRequest,
         session: AsyncSession,
-        session_user: User,
+        session_user: SessionUser,
     ) -> dict:
         try:
             comment_orm = await self.get_comment_by_comment_id(comment_id, session)
@@ -114,20 +151,10 @@ class CommentService:
             await session.execute(stmt)
             await session.flush()
             await session.refresh(comment_orm, ["author"])
+            add_after_commit_hook(session, page_cache_manager.invalidate)
 
-            return {
-                "id": comment_orm.id,
-                "content": comment_orm.content,
-                "author": {
-                    "id": comment_orm.author.id,
-                    "name": comment_orm.author.name,
-                },
-                "parent_id": comment_orm.parent_id,
-                "created_at": comment_orm.created_at.isoformat()
-                if comment_orm.created_at
-                else None,
-                "replies": [],  # 수정 시에는 replies 불필요
-            }
+            # 수정 시에는 replies 불필요
+            return self._serialize_comment(comment_orm)
 
         except SQLAlchemyError as e:
             raise HTTPException(
@@ -136,7 +163,7 @@ class CommentService:
             ) from e
 
     async def delete_comment(
-        self, comment_id: int, session: AsyncSession, session_user: User
+        self, comment_id: int, session: AsyncSession, session_user: SessionUser
     ) -> None:
         try:
             comment_orm = await self.get_comment_by_comment_id(comment_id, session)
@@ -154,6 +181,8 @@ class CommentService:
 
             stmt = delete(Comment).where(Comment.id == comment_id)
             await session.execute(stmt)
+            await self._adjust_comment_count(comment_orm.blog_id, -1, session)
+            add_after_commit_hook(session, page_cache_manager.invalidate)
 
         except SQLAlchemyError as e:
             raise HTTPException(
@@ -165,42 +194,146 @@ class CommentService:
         self, blog_id: int, session: AsyncSession
     ) -> list[dict]:
         try:
-            # 최상위 댓글 가져오기
-            stmt_top = (
+            # 블로그의 모든 댓글을 작성순으로 한 번만 가져옵니다.
+            stmt = (
                 select(Comment)
                 .where(Comment.blog_id == blog_id)
-                .where(Comment.parent_id == None)
-                .options(joinedload(Comment.author))
-                .order_by(Comment.created_at.asc())
+                .options(*COMMENT_LOADERS)
+                .order_by(Comment.created_at.asc(), Comment.id.asc())
             )
-            result_top = await session.execute(stmt_top)
-            top_comments = result_top.scalars().unique().all()
+            result = await session.execute(stmt)
+            comments = result.scalars().all()
 
-            # 모든 댓글을 한 번에 가져오기
-            stmt_all = (
-                select(Comment)
-                .where(Comment.blog_id == blog_id)
-                .options(joinedload(Comment.author))
-                .order_by(Comment.created_at.asc())
+            return self._build_comment_tree(comments)
+
+        except SQLAlchemyError as e:
+            print(f"SQLAlchemyError in get_comments_by_blog_id: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="데이터베이스 연결 실패",
+            ) from e
+
+    async def get_comment_page(
+        self,
+        blog_id: int,
+        session: AsyncSession,
+        cursor: str | None = None,
+        limit: int = COMMENT_PAGE_SIZE,
+    ) -> CommentPageResponse:
+        """
+        블로그의 최상위 댓글을 (created_at, id) 커서 기준으로 한 페이지만 반환합니다.
+        """
+        stmt = select(Comment).where(
+            Comment.blog_id == blog_id, Comment.parent_id.is_(None)
+        )
+        return await self._get_comment_page(stmt, session, cursor, limit)
+
+    async def get_reply_page(
+        self,
+        parent_id: int,
+        session: AsyncSession,
+        cursor: str | None = None,
+        limit: int = COMMENT_PAGE_SIZE,
+    ) -> CommentPageResponse:
+        """
+        특정 댓글의 바로 아래 대댓글을 (created_at, id) 커서 기준으로 한 페이지만 반환합니다.
+        """
+        try:
+            result = await session.execute(
+                select(Comment.blog_id).where(Comment.id == parent_id)
+            )
+            blog_id = result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="데이터베이스 연결 실패",
+            ) from e
+        if blog_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="댓글을 찾을 수 없습니다.",
             )
-            result_all = await session.execute(stmt_all)
-            all_comments = result_all.scalars().all()
 
-            # parent_id → children 매핑
-            children_map: dict[int, list[Comment]] = {}
-            for c in all_comments:
-                if c.parent_id:
-                    children_map.setdefault(c.parent_id, []).append(c)
+        # blog_id 조건을 함께 걸어 (blog_id, parent_id, created_at) 인덱스를 타도록 합니다.
+        stmt = select(Comment).where(
+            Comment.blog_id == blog_id, Comment.parent_id == parent_id
+        )
+        return await self._get_comment_page(stmt, session, cursor, limit)
 
-            # 직렬화
-            return [self._serialize_comment(c, children_map) for c in top_comments]
+    async def _get_comment_page(
+        self,
+        stmt: Select[tuple[Comment]],
+        session: AsyncSession,
+        cursor: str | None,
+        limit: int,
+    ) -> CommentPageResponse:
+        try:
+            if cursor:
+                cursor_dt, cursor_id = decode_cursor(cursor)
+                stmt = stmt.where(
+                    or_(
+                        Comment.created_at > cursor_dt,
+                        and_(Comment.created_at == cursor_dt, Comment.id > cursor_id),
+                    )
+                )
+            # 다음 페이지 존재 여부를 알기 위해 한 건을 더 가져옵니다.
+            stmt = (
+                stmt.options(*COMMENT_LOADERS)
+                .order_by(Comment.created_at.asc(), Comment.id.asc())
+                .limit(limit + 1)
+            )
+            result = await session.execute(stmt)
+            comments = result.scalars().all()
+
+            has_next = len(comments) > limit
+            comments = comments[:limit]
+
+            # 페이지에 포함된 댓글들의 대댓글 수를 한 번의 GROUP BY 쿼리로 가져옵니다.
+            reply_counts: dict[int, int] = {}
+            if comments:
+                count_stmt = (
+                    select(Comment.parent_id, func.count(Comment.id))
+                    .where(Comment.parent_id.in_([c.id for c in comments]))
+                    .group_by(Comment.parent_id)
+                )
+                count_result = await session.execute(count_stmt)
+                reply_counts = dict(count_result.all())
+
+            items = [
+                CommentNodeResponse(
+                    id=c.id,
+                    content=c.content,
+                    author=c.author,
+                    parent_id=c.parent_id,
+                    created_at=c.created_at,
+                    reply_count=reply_counts.get(c.id, 0),
+                )
+                for c in comments
+            ]
+
+            next_cursor = None
+            if has_next:
+                last = comments[-1]
+                next_cursor = encode_cursor(last.created_at, last.id)
+            return CommentPageResponse(items=items, next_cursor=next_cursor)
 
         except SQLAlchemyError as e:
-            print(f"SQLAlchemyError in get_comments_by_blog_id: {e}")
+            print(f"SQLAlchemyError in _get_comment_page: {e}")
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="데이터베이스 연결 실패",
             ) from e
 
-    def _is_authorized(self, session_user: User, author_id: int) -> bool:
+    async def _adjust_comment_count(
+        self, blog_id: int, delta: int, session: AsyncSession
+    ) -> None:
+        """Blog.comment_count 카운터를 댓글 변경과 같은 트랜잭션 안에서 갱신합니다."""
+        stmt = (
+            update(Blog)
+            .where(Blog.id == blog_id)
+            .values(comment_count=Blog.comment_count + delta)
+        )
+        await session.execute(stmt)
+
+    def _is_authorized(self, session_user: SessionUser, author_id: int) -> bool:
         return session_user.id == author_id
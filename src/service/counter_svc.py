@@ -0,0 +1,36 @@
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.model.blog.orm import Blog
+from src.model.comment.orm import Comment
+from src.model.tag.orm import Tag, post_tags_table
+
+
+class CounterService:
+    async def reconcile(self, session: AsyncSession) -> None:
+        """
+        비정규화 카운터(Blog.comment_count, Tag.usage_count)를 원본 테이블 기준으로 일괄 재계산합니다.
+        카운터가 어긋났을 때(수동 데이터 수정, 장애 등) 복구하는 용도로 사용합니다.
+        """
+        comment_count = (
+            select(func.count(Comment.id))
+            .where(Comment.blog_id == Blog.id)
+            .scalar_subquery()
+        )
+        await session.execute(
+            update(Blog)
+            .values(comment_count=comment_count)
+            .execution_options(synchronize_session=False)
+        )
+
+        usage_count = (
+            select(func.count())
+            .select_from(post_tags_table)
+            .where(post_tags_table.c.tag_id == Tag.id)
+            .scalar_subquery()
+        )
+        await session.execute(
+            update(Tag)
+            .values(usage_count=usage_count)
+            .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,184 @@
+import asyncio
+import os
+import re
+import time
+
+from sqlalchemy import case, delete, func, select, text, update
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.manager.image_manager import ImageManager, SavedImage
+from src.model.image.orm import StoredImage
+from src.utils.db.db import db
+
+# 참조 수가 0이 된 뒤 실제 파일을 지우기까지 기다리는 유예 시간(초)
+IMAGE_SWEEP_GRACE_SECONDS = int(os.getenv("IMAGE_SWEEP_GRACE_SECONDS", "3600"))
+# 백그라운드 정리 작업 실행 주기(초)
+IMAGE_SWEEP_INTERVAL_SECONDS = int(os.getenv("IMAGE_SWEEP_INTERVAL_SECONDS", "3600"))
+# 여러 워커 중 하나만 정리 작업을 실행하도록 잡는 MySQL 이름 잠금
+IMAGE_SWEEP_LOCK_NAME = "blog_app:orphan_image_sweep"
+
+# 내용 해시로 저장된 원본 파일 이름 (리사이즈 버전 '<hash>_w640.webp'는 제외)
+_ORIGINAL_FILENAME = re.compile(r"^[0-9a-f]{64}(\.[A-Za-z0-9]+)?$")
+
+
+class ImageService:
+    def __init__(self) -> None:
+        self.image_manager = ImageManager()
+
+    async def acquire(self, saved_image: SavedImage, session: AsyncSession) -> None:
+        """
+        블로그가 이미지를 참조하기 시작할 때 참조 수를 1 올립니다.
+        처음 보는 이미지면 행을 만들고, 동시에 같은 이미지가 올라와도 UNIQUE(path)로 한 행만 유지합니다.
+        """
+        stmt = insert(StoredImage).values(
+            path=saved_image.url,
+            content_hash=saved_image.content_hash,
+            ref_count=1,
+        )
+        stmt = stmt.on_duplicate_key_update(
+            ref_count=StoredImage.ref_count + 1, released_at=None
+        )
+        await session.execute(stmt)
+
+    async def release(self, image_url: str | None, session: AsyncSession) -> None:
+        """
+        블로그가 이미지를 더 이상 참조하지 않을 때 참조 수를 1 내립니다.
+        0이 되면 released_at을 기록해 두고, 실제 파일 삭제는 sweep_orphans가 담당합니다.
+        """
+        if not image_url:
+            return
+        # MySQL은 SET 절을 왼쪽부터 평가하므로 released_at을 ref_count보다 먼저 계산합니다.
+        stmt = (
+            update(StoredImage)
+            .where(StoredImage.path == image_url, StoredImage.ref_count > 0)
+            .ordered_values(
+                (
+                    StoredImage.released_at,
+                    case((StoredImage.ref_count <= 1, func.now()), else_=None),
+                ),
+                (StoredImage.ref_count, StoredImage.ref_count - 1),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(stmt)
+
+    async def sweep_orphans(self, session: AsyncSession) -> int:
+        """
+        더 이상 참조되지 않는 이미지 파일을 삭제하고 삭제한 원본 파일 수를 반환합니다.
+
+        - 참조 수가 0이 된 뒤 유예 시간이 지난 이미지
+        - 디스크에는 있지만 DB에 기록이 없는 이미지(저장 후 트랜잭션이 롤백된 경우 등)
+
+        대상 행(없는 경로는 그 자리)을 잠근 채로 파일을 지우고 마지막에 커밋합니다.
+        그 사이 acquire()로 같은 이미지를 다시 참조하려는 요청은 커밋까지 기다렸다가
+        새 행을 만들고 파일을 다시 놓으므로, 참조 중인 이미지의 파일이 지워지지 않습니다.
+        """
+        # released_at은 DB의 NOW()로 기록되므로 비교도 DB 시각 기준으로 합니다.
+        threshold = func.date_sub(
+            func.now(), text(f"INTERVAL {IMAGE_SWEEP_GRACE_SECONDS} SECOND")
+        )
+        # 다른 트랜잭션이 잡고 있는 행은 지금 다시 참조되는 중이므로 건너뜁니다.
+        result = await session.execute(
+            select(StoredImage.path)
+            .where(StoredImage.ref_count <= 0, StoredImage.released_at < threshold)
+            .with_for_update(skip_locked=True)
+        )
+        released_paths = list(result.scalars().all())
+        if released_paths:
+            await session.execute(
+                delete(StoredImage).where(StoredImage.path.in_(released_paths))
+            )
+
+        untracked_paths = await self._find_untracked_files(
+            session, time.time() - IMAGE_SWEEP_GRACE_SECONDS
+        )
+
+        paths = released_paths + untracked_paths
+        try:
+            if paths:
+                await asyncio.to_thread(self._remove_files, paths)
+        finally:
+            await session.commit()
+        return len(paths)
+
+    def _remove_files(self, paths: list[str]) -> None:
+        for path in paths:
+            try:
+                self.image_manager.remove_image_files(path)
+            except OSError as e:
+                # 한 파일의 오류로 나머지 정리가 멈추지 않도록 로그만 남깁니다.
+                print(f"Error removing image files {path}: {e}")
+
+    def _scan_original_files(self, older_than: float) -> list[str]:
+        upload_path = self.image_manager.image_upload_path
+        candidates: list[str] = []
+        for entry in os.scandir(upload_path):
+            # 해시 앞 두 글자로 나눈 디렉터리만 검사합니다(기존 작성자별 디렉터리는 대상이 아님).
+            if not entry.is_dir() or not re.fullmatch(r"[0-9a-f]{2}", entry.name):
+                continue
+            for file in os.scandir(entry.path):
+                try:
+                    if (
+                        file.is_file()
+                        and _ORIGINAL_FILENAME.match(file.name)
+                        and file.stat().st_mtime < older_than
+                    ):
+                        candidates.append(
+                            self.image_manager.trim_volume_path(file.path)
+                        )
+                except FileNotFoundError:
+                    continue
+        return candidates
+
+    async def _find_untracked_files(
+        self, session: AsyncSession, older_than: float
+    ) -> list[str]:
+        candidates = await asyncio.to_thread(self._scan_original_files, older_than)
+
+        untracked: list[str] = []
+        # IN 절이 너무 길어지지 않도록 나눠서 조회합니다.
+        for i in range(0, len(candidates), 500):
+            chunk = candidates[i : i + 500]
+            # 잠금 읽기는 커밋된 최신 행을 보고, 없는 경로에는 갭 잠금을 걸어
+            # 커밋 전까지 같은 경로의 INSERT(acquire)를 막습니다.
+            result = await session.execute(
+                select(StoredImage.path)
+                .where(StoredImage.path.in_(chunk))
+                .with_for_update()
+            )
+            tracked = set(result.scalars().all())
+            untracked.extend(path for path in chunk if path not in tracked)
+        return untracked
+
+
+async def sweep_orphan_images_once() -> int | None:
+    """
+    고아 이미지 정리를 한 번 실행합니다. 다른 워커가 이미 정리 중이면 None을 반환합니다.
+
+    uvicorn 워커마다 정리 작업이 떠 있으므로, MySQL 이름 잠금(GET_LOCK)을 잡은 워커 하나만 실행합니다.
+    이름 잠금은 커넥션에 묶이므로 세션을 커넥션 하나에 고정해서 사용합니다.
+    """
+    async with db.engine.connect() as conn:
+        locked = await conn.scalar(select(func.get_lock(IMAGE_SWEEP_LOCK_NAME, 0)))
+        await conn.commit()
+        if locked != 1:
+            return None
+        try:
+            async with AsyncSession(bind=conn, expire_on_commit=False) as session:
+                return await ImageService().sweep_orphans(session)
+        finally:
+            await conn.execute(select(func.release_lock(IMAGE_SWEEP_LOCK_NAME)))
+            await conn.commit()
+
+
+async def run_orphan_image_sweeper() -> None:
+    """애플리케이션이 떠 있는 동안 주기적으로 고아 이미지 파일을 정리합니다."""
+    while True:
+        await asyncio.sleep(IMAGE_SWEEP_INTERVAL_SECONDS)
+        try:
+            removed = await sweep_orphan_images_once()
+            if removed:
+                print(f"Orphan image sweep removed {removed} file(s)")
+        except Exception as e:
+            print(f"Error in orphan image sweep: {e}")
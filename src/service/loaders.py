@@ -0,0 +1,19 @@
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from src.model.blog.orm import Blog
+from src.model.comment.orm import Comment
+
+# 서비스 계층에서 공통으로 사용하는 관계 로딩 전략입니다.
+# - 다대일(many-to-one) 관계는 행 수가 늘지 않으므로 JOIN(joinedload)으로 함께 가져옵니다.
+# - 컬렉션(one-to-many, many-to-many) 관계는 JOIN 시 행이 곱해지므로(cartesian product)
+#   부모 id 목록으로 IN 쿼리를 한 번 더 보내는 배치 로딩(selectinload)을 사용합니다.
+
+# 블로그 목록/상세: 작성자는 JOIN, 태그는 IN 배치 로딩
+BLOG_LOADERS: tuple[LoaderOption, ...] = (
+    joinedload(Blog.author),
+    selectinload(Blog.tags),
+)
+
+# 댓글: 작성자만 JOIN으로 가져옵니다.
+COMMENT_LOADERS: tuple[LoaderOption, ...] = (joinedload(Comment.author),)
@@ -0,0 +1,195 @@
+import asyncio
+import os
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import Row, desc, select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.manager.search_index_manager import (
+    IndexedBlog,
+    SearchIndexManager,
+    search_index_manager,
+)
+from src.model.blog.orm import Blog
+from src.model.blog.response import BlogSearchItem, BlogSearchPage
+from src.model.tag.orm import Tag, post_tags_table
+from src.model.user.orm import User
+from src.utils.db.db import db
+from src.utils.text_helper import highlight_terms, make_snippet
+
+# 검색 결과 한 페이지에 보여줄 글 수
+SEARCH_PAGE_SIZE = 10
+# ngram 파서의 토큰 크기(기본 2)보다 짧은 검색어는 인덱스에서 찾을 수 없습니다.
+MIN_QUERY_LENGTH = 2
+# SEARCH_BACKEND=memory일 때 다른 워커의 변경을 반영하기 위해 인덱스를 다시 만드는 주기(초)
+SEARCH_INDEX_REFRESH_SECONDS = int(os.getenv("SEARCH_INDEX_REFRESH_SECONDS", "300"))
+
+
+class SearchService:
+    async def search_blogs(
+        self,
+        query: str,
+        session: AsyncSession,
+        page: int = 1,
+        limit: int = SEARCH_PAGE_SIZE,
+    ) -> BlogSearchPage:
+        """
+        blog(title, content)의 FULLTEXT(ngram) 인덱스로 검색해 관련도 순으로 한 페이지를 반환합니다.
+        LIKE '%...%'와 달리 테이블 전체를 훑지 않고 인덱스만으로 후보를 찾습니다.
+        SEARCH_BACKEND=memory이면 DB 대신 프로세스 내 역색인을 사용합니다.
+        """
+        query = " ".join(query.split())
+        if len(query) < MIN_QUERY_LENGTH:
+            return BlogSearchPage(query=query, items=[], page=page)
+        if search_index_manager.enabled:
+            return self.search_in_memory(query, page, limit)
+        return await self.search_fulltext(query, session, page, limit)
+
+    async def search_fulltext(
+        self,
+        query: str,
+        session: AsyncSession,
+        page: int = 1,
+        limit: int = SEARCH_PAGE_SIZE,
+    ) -> BlogSearchPage:
+        # match()는 ORM 속성이 아닌 컬럼을 받으므로 테이블 컬럼을 넘깁니다.
+        blog_columns = Blog.__table__.c
+        relevance = match(blog_columns.title, blog_columns.content, against=query)
+        relevance = relevance.in_natural_language_mode()
+        try:
+            stmt = (
+                select(
+                    Blog.id,
+                    Blog.title,
+                    Blog.content,
+                    Blog.modified_dt,
+                    Blog.comment_count,
+                    User.name.label("author_name"),
+                    relevance.label("score"),
+                )
+                .join(Blog.author)
+                .where(relevance)
+                .order_by(desc("score"), Blog.id.desc())
+                .offset((page - 1) * limit)
+                # 다음 페이지 존재 여부를 알기 위해 한 건을 더 가져옵니다.
+                .limit(limit + 1)
+            )
+            result = await session.execute(stmt)
+            rows = result.all()
+        except SQLAlchemyError as e:
+            print(f"SQLAlchemyError in search_blogs: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="데이터베이스 연결 실패",
+            ) from e
+
+        terms = query.split()
+        items = [
+            self._to_search_item(row, float(row.score), terms) for row in rows[:limit]
+        ]
+        return BlogSearchPage(
+            query=query, items=items, page=page, has_next=len(rows) > limit
+        )
+
+    def search_in_memory(
+        self, query: str, page: int = 1, limit: int = SEARCH_PAGE_SIZE
+    ) -> BlogSearchPage:
+        results, has_next = search_index_manager.search(
+            query, offset=(page - 1) * limit, limit=limit
+        )
+        terms = query.split()
+        items = [self._to_search_item(doc, score, terms) for doc, score in results]
+        return BlogSearchPage(query=query, items=items, page=page, has_next=has_next)
+
+    def _to_search_item(
+        self, blog: IndexedBlog | Row, score: float, terms: list[str]
+    ) -> BlogSearchItem:
+        return BlogSearchItem(
+            id=blog.id,
+            title_html=highlight_terms(blog.title, terms),
+            snippet_html=make_snippet(blog.content, terms),
+            modified_dt=blog.modified_dt,
+            comment_count=blog.comment_count,
+            author_name=blog.author_name,
+            score=score,
+        )
+
+    async def load_index_documents(self, session: AsyncSession) -> list[IndexedBlog]:
+        """프로세스 내 역색인을 만들기 위해 모든 블로그 글과 태그 이름을 읽어 옵니다."""
+        result = await session.execute(
+            select(
+                Blog.id,
+                Blog.title,
+                Blog.content,
+                Blog.modified_dt,
+                Blog.comment_count,
+                User.name.label("author_name"),
+            ).join(Blog.author)
+        )
+        docs = {
+            row.id: IndexedBlog(
+                id=row.id,
+                title=row.title,
+                content=row.content,
+                author_name=row.author_name,
+                modified_dt=row.modified_dt,
+                comment_count=row.comment_count,
+            )
+            for row in result.all()
+        }
+        tag_rows = await session.execute(
+            select(post_tags_table.c.blog_id, Tag.name).join(
+                Tag, Tag.id == post_tags_table.c.tag_id
+            )
+        )
+        for blog_id, name in tag_rows.all():
+            if blog_id in docs:
+                docs[blog_id].tag_names.append(name)
+        return list(docs.values())
+
+    async def rebuild_index(self, session: AsyncSession) -> int:
+        # 문서를 읽기 전부터 갱신을 기록해 두어야, 읽은 뒤 커밋된 글이 새 인덱스에서 빠지지 않습니다.
+        search_index_manager.begin_rebuild()
+        try:
+            docs = await self.load_index_documents(session)
+            # 토큰화는 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 새 인덱스를 만들고,
+            # 교체는 검색/갱신과 같은 이벤트 루프에서 합니다.
+            state = await asyncio.to_thread(SearchIndexManager.build_state, docs)
+        except BaseException:
+            search_index_manager.abort_rebuild()
+            raise
+        search_index_manager.finish_rebuild(state)
+        return len(docs)
+
+
+def build_index_document(
+    blog: Blog, author_name: str, tag_names: list[str]
+) -> IndexedBlog:
+    """
+    BlogService가 글을 쓰거나 고친 직후 인덱스에 올릴 문서를 만듭니다.
+    modified_dt 등 DB가 채우는 값은 flush 후 만료되어 다시 조회해야 하므로 현재 시각으로 대신합니다.
+    """
+    return IndexedBlog(
+        id=blog.id,
+        title=blog.title,
+        content=blog.content,
+        author_name=author_name,
+        modified_dt=datetime.now(),
+        comment_count=blog.comment_count or 0,
+        tag_names=tag_names,
+    )
+
+
+async def run_search_index_refresher() -> None:
+    """SEARCH_BACKEND=memory일 때 시작 시 인덱스를 만들고 이후 주기적으로 다시 만듭니다."""
+    while True:
+        try:
+            async with db.async_session_maker() as session:
+                count = await SearchService().rebuild_index(session)
+            print(f"Search index rebuilt with {count} blog(s)")
+        except Exception as e:
+            print(f"Error in search index rebuild: {e}")
+        await asyncio.sleep(SEARCH_INDEX_REFRESH_SECONDS)
@@ -1,8 +1,12 @@
-from sqlalchemy import delete, select
+from collections.abc import Iterable
+
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.manager.page_cache_manager import page_cache_manager
 from src.model.blog.orm import Blog
 from src.model.tag.orm import Tag
+from src.utils.db.db import add_after_commit_hook
 
 
 class TagService:
@@ -34,14 +38,33 @@ class TagService:
                 new_tags.append(new_tag)
             # flush를 한 번만 호출하여 모든 새 태그를 DB에 반영하고 ID를 할당받습니다.
             await session.flush()
+            add_after_commit_hook(session, page_cache_manager.invalidate)
 
         # 4. 기존 태그와 새로 생성된 태그를 합쳐서 반환합니다.
         return existing_tags + new_tags
 
+    async def adjust_usage_counts(
+        self, tag_ids: Iterable[int], delta: int, session: AsyncSession
+    ) -> None:
+        """
+        블로그에 태그가 연결/해제될 때 usage_count 카운터를 delta만큼 갱신합니다.
+        호출한 서비스와 같은 트랜잭션 안에서 실행되어야 합니다.
+        """
+        tag_ids = list(tag_ids)
+        if not tag_ids or not delta:
+            return
+        stmt = (
+            update(Tag)
+            .where(Tag.id.in_(tag_ids))
+            .values(usage_count=Tag.usage_count + delta)
+        )
+        await session.execute(stmt)
+
     async def get_tags_by_blog_id(
         self, blog_id: int, session: AsyncSession
     ) -> list[Tag]:
-        stmt = select(Tag).join(Blog).where(Blog.id == blog_id)
+        # Tag와 Blog 사이에는 직접 FK가 없으므로 연관 테이블을 거치는 관계로 조인합니다.
+        stmt = select(Tag).join(Tag.blogs).where(Blog.id == blog_id)
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
@@ -49,4 +72,5 @@ class TagService:
     async def delete_tag(self, tag_id: int, session: AsyncSession) -> None:
         stmt = delete(Tag).where(Tag.id == tag_id)  # noqa: F821
         await session.execute(stmt)
+        add_after_commit_hook(session, page_cache_manager.invalidate)
         await session.commit()
@@ -1,3 +1,4 @@
+import os
 from datetime import timedelta
 
 from fastapi import Request, status
@@ -13,7 +14,11 @@ from src.manager.verification_token_manager import EmailVerificationTokenManager
 from src.model.user.orm import User
 from src.worker.tasks import send_email
 
-password_manager = PasswordManager()
+_bcrypt_rounds = os.getenv("BCRYPT_ROUNDS")
+password_manager = PasswordManager(
+    bcrypt_rounds=int(_bcrypt_rounds) if _bcrypt_rounds else None,
+    max_concurrency=int(os.getenv("PASSWORD_HASH_CONCURRENCY", "4")),
+)
 
 
 class UserService:
@@ -29,7 +34,7 @@ class UserService:
                     detail="이미 등록된 이메일입니다.",
                 )
 
-            hashed_password = password_manager.hash(password)
+            hashed_password = await password_manager.hash_async(password)
             new_user = User(
                 name=name,
                 email=email,
@@ -72,12 +77,16 @@ class UserService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="존재하지 않는 이메일입니다.",
             )
-        if not password_manager.verify(password, user_vo.hashed_password):
+        if not await password_manager.verify_async(password, user_vo.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="비밀번호가 일치하지 않습니다.",
             )
 
+        # 해싱 정책(라운드 수 등)이 바뀌었다면 평문을 알고 있는 지금 다시 해싱해 저장합니다.
+        if password_manager.needs_rehash(user_vo.hashed_password):
+            user_vo.hashed_password = await password_manager.hash_async(password)
+
         if not user_vo.is_email_verified:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,32 +1,43 @@
+import asyncio
+import contextlib
 import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
-from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from src.router import blog, comment, tag, user
+from src.manager.search_index_manager import search_index_manager
+from src.router import blog, comment, internal, tag, user
+from src.service.image_svc import run_orphan_image_sweeper
+from src.service.search_svc import run_search_index_refresher
 from src.utils import error_handler
 from src.utils.db.db import db
+from src.utils.jinja_template import jinja_manager
+from src.utils.static_files import STATIC_DIR, STATIC_URL_PREFIX, CachedStaticFiles
+
+# 이미지 정리, 검색 인덱스 재구축 같은 주기 작업을 실행할지 여부
+BACKGROUND_TASKS_ENABLED = (
+    os.getenv("BACKGROUND_TASKS_ENABLED", "true").lower() == "true"
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     print("Starting up...")
 
-    static_dir = "src/static"
     # 'src/static' 디렉토리가 없는 경우 생성
-    if not os.path.isdir(static_dir):
-        os.makedirs(static_dir)
+    if not os.path.isdir(STATIC_DIR):
+        os.makedirs(STATIC_DIR)
 
-    app.mount("/src/static", StaticFiles(directory=static_dir), name="static")
+    app.mount(STATIC_URL_PREFIX, CachedStaticFiles(directory=STATIC_DIR), name="static")
 
     app.include_router(blog.router)
     app.include_router(user.router)
     app.include_router(comment.router)
     app.include_router(tag.router)
+    app.include_router(internal.router)
 
     app.add_exception_handler(
         HTTPException, error_handler.custom_http_exception_handler
@@ -38,6 +49,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         StarletteHTTPException, error_handler.custom_starlette_http_exception_handler
     )
 
+    # 첫 요청이 템플릿 컴파일 비용을 내지 않도록 미리 컴파일합니다.
+    await asyncio.to_thread(jinja_manager.prewarm)
+
+    background_tasks: list[asyncio.Task[None]] = []
+    # 테스트처럼 주기 작업이 필요 없는 환경에서는 BACKGROUND_TASKS_ENABLED=false로 끕니다.
+    if BACKGROUND_TASKS_ENABLED:
+        # 더 이상 참조되지 않는 업로드 이미지를 주기적으로 정리합니다.
+        background_tasks.append(asyncio.create_task(run_orphan_image_sweeper()))
+        # SEARCH_BACKEND=memory이면 프로세스 내 검색 인덱스를 만들고 주기적으로 다시 만듭니다.
+        if search_index_manager.enabled:
+            background_tasks.append(asyncio.create_task(run_search_index_refresher()))
+
     yield
     print("Shutting down...")
-    await db.engine.dispose()
+    for task in background_tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await db.dispose()
@@ -1,23 +1,31 @@
 import os
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any
 
-from fastapi import HTTPException, status
-from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException, Request, status
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.exc import InterfaceError, OperationalError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+from src.utils.db.pool import build_pool_options, get_pool_metrics
+from src.utils.db.redis import redis_db
+from src.utils.db.stats import install_db_stats
 
 # 데이터베이스 커넥션 풀(Connection Pool) 설정을 위한 옵션입니다.
 # 커넥션 풀은 데이터베이스 연결을 미리 만들어두고 재사용하여 성능을 향상시킵니다.
-DB_CONNECTION_OPTIONS: dict[str, Any] = {
-    "pool_size": 30,  # 풀에서 유지할 최소한의 커넥션 수
-    "max_overflow": 10,  # 풀 크기를 초과하여 생성할 수 있는 임시 커넥션 수
-    "pool_recycle": 300,  # 커넥션을 재사용하기 전 최대 유지 시간(초). 이 시간이 지나면 재연결합니다.
-}
+# 크기는 환경 변수와 워커 수로 정합니다. (src/utils/db/pool.py 참고)
+DB_CONNECTION_OPTIONS: dict[str, Any] = build_pool_options()
 
 DB_SESSION_OPTIONS: dict[str, Any] = {
     "expire_on_commit": False,
@@ -26,6 +34,127 @@ DB_SESSION_OPTIONS: dict[str, Any] = {
 }
 
 
+# 쓰기를 한 사용자의 읽기를 primary로 보내는 시간(초). 복제 지연보다 넉넉하게 잡습니다.
+READ_YOUR_WRITES_SECONDS = int(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+# 연결 오류가 난 복제본을 다시 시도하기까지 기다리는 시간(초)
+REPLICA_RETRY_SECONDS = int(os.getenv("REPLICA_RETRY_SECONDS", "30"))
+
+
+# 커밋이 성공한 뒤 실행할 비동기 콜백 목록을 세션(session.info)에 보관할 때 쓰는 키입니다.
+AFTER_COMMIT_HOOKS_KEY = "after_commit_hooks"
+
+
+def add_after_commit_hook(
+    session: AsyncSession, hook: Callable[[], Awaitable[None]]
+) -> None:
+    """
+    요청 처리 후 커밋이 성공했을 때 실행할 비동기 콜백을 등록합니다.
+    캐시 무효화처럼 커밋 이후에만 의미가 있는 작업에 사용하며, 같은 콜백은 한 번만 실행됩니다.
+    """
+    hooks: list[Callable[[], Awaitable[None]]] = session.info.setdefault(
+        AFTER_COMMIT_HOOKS_KEY, []
+    )
+    if hook not in hooks:
+        hooks.append(hook)
+
+
+# 세션에서 INSERT/UPDATE/DELETE가 실행되었는지 표시할 때 쓰는 session.info 키입니다.
+HAS_WRITES_KEY = "has_writes"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_writes(session: Session, flush_context: UOWTransaction) -> None:
+    # flush는 변경 사항이 있을 때만 실행되므로 여기까지 왔다면 쓰기가 있었던 것입니다.
+    session.info[HAS_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_writes(orm_execute_state: ORMExecuteState) -> None:
+    # session.execute(update(...)) 처럼 flush를 거치지 않는 쓰기 문장도 표시합니다.
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[HAS_WRITES_KEY] = True
+
+
+class ReadYourWritesTracker:
+    """
+    사용자가 글/댓글 등을 쓴 직후에는 복제 지연 때문에 복제본에 아직 반영되지 않았을 수 있습니다.
+    쓰기가 커밋되면 Redis에 사용자별 표시를 남기고, 표시가 살아 있는 동안 그 사용자의 읽기는 primary로 보냅니다.
+    """
+
+    KEY_PREFIX = "db_sticky"
+
+    def __init__(self, ttl: int) -> None:
+        self.ttl = ttl
+
+    async def mark(self, request: Request) -> None:
+        user_id = await self.session_user_id(request)
+        if user_id is None or self.ttl <= 0:
+            return
+        try:
+            await redis_db.get_client().set(
+                f"{self.KEY_PREFIX}:{user_id}", "1", ex=self.ttl
+            )
+        except RedisError as e:
+            print(f"Read-your-writes mark error: {e}")
+
+    async def is_sticky(self, request: Request) -> bool:
+        user_id = await self.session_user_id(request)
+        if user_id is None or self.ttl <= 0:
+            return False
+        try:
+            return bool(
+                await redis_db.get_client().exists(f"{self.KEY_PREFIX}:{user_id}")
+            )
+        except RedisError as e:
+            print(f"Read-your-writes check error: {e}")
+            # 판단할 수 없으면 최신 데이터를 보장하는 primary를 사용합니다.
+            return True
+
+    async def session_user_id(self, request: Request) -> Any:
+        # SessionMiddleware가 넣어 둔 세션을 사용합니다. (쿠키가 없으면 Redis를 조회하지 않음)
+        session = getattr(request.state, "session", None)
+        if session is None:
+            return None
+        await session.load()
+        return session.get("id")
+
+
+@dataclass
+class ReplicaDatabase:
+    engine: AsyncEngine
+    async_session_maker: async_sessionmaker[AsyncSession]
+    # 연결 오류가 난 복제본은 이 시각(monotonic)까지 선택하지 않습니다.
+    down_until: float = 0.0
+
+    def is_available(self) -> bool:
+        return self.down_until <= time.monotonic()
+
+
+def _is_connection_error(error: BaseException) -> bool:
+    """예외 자신이나 원인(__cause__/__context__) 중에 DB 연결 오류가 있는지 확인합니다."""
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        if isinstance(current, OperationalError | InterfaceError):
+            return True
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return False
+
+
+async def run_after_commit_hooks(session: AsyncSession) -> None:
+    for hook in session.info.pop(AFTER_COMMIT_HOOKS_KEY, []):
+        try:
+            await hook()
+        except Exception as e:
+            # 이미 커밋된 요청을 실패로 만들지 않도록 로그만 남깁니다.
+            print(f"Error in after-commit hook {hook}: {e}")
+
+
 # 데이터베이스 연결 및 세션 관리를 책임지는 클래스입니다.
 class MysqlDatabase:
     def __init__(
@@ -33,12 +162,14 @@ class MysqlDatabase:
         db_url: str,
         options: dict[str, Any] | None = None,
         session_options: dict[str, Any] | None = None,
+        replica_urls: list[str] | None = None,
     ):
         if not db_url:
             raise ValueError("DATABASE_URL is not set")
         # create_async_engine: SQLAlchemy의 비동기 엔진을 생성합니다.
         # 이 엔진은 실제 데이터베이스 연결 및 통신을 담당합니다.
         self.engine = create_async_engine(db_url, **(options or {}))
+        install_db_stats(self.engine, "primary")
 
         # async_sessionmaker: 비동기 세션(AsyncSession)을 생성하는 팩토리(공장)입니다.
         # 이 팩토리를 통해 일관된 설정의 세션을 쉽게 만들 수 있습니다.
@@ -46,6 +177,43 @@ class MysqlDatabase:
             self.engine, **(session_options or {})
         )
 
+        # 읽기 전용 복제본(replica). 없으면 읽기도 primary(self.engine)로 처리합니다.
+        self.replicas: list[ReplicaDatabase] = []
+        for index, url in enumerate(replica_urls or []):
+            engine = create_async_engine(url, **(options or {}))
+            install_db_stats(engine, f"replica{index}")
+            self.replicas.append(
+                ReplicaDatabase(
+                    engine=engine,
+                    async_session_maker=async_sessionmaker(
+                        engine, **(session_options or {})
+                    ),
+                )
+            )
+        self._next_replica = 0
+        self.read_your_writes = ReadYourWritesTracker(READ_YOUR_WRITES_SECONDS)
+
+    def pick_replica(self) -> ReplicaDatabase | None:
+        """사용 가능한 복제본을 라운드 로빈으로 고릅니다. 모두 장애 상태면 None을 반환합니다."""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next_replica % len(self.replicas)]
+            self._next_replica += 1
+            if replica.is_available():
+                return replica
+        return None
+
+    def pool_metrics(self) -> dict[str, dict[str, Any]]:
+        """메트릭 라벨(primary, replica0, ...)별 커넥션 풀 상태를 반환합니다."""
+        metrics = {"primary": get_pool_metrics(self.engine)}
+        for index, replica in enumerate(self.replicas):
+            metrics[f"replica{index}"] = get_pool_metrics(replica.engine)
+        return metrics
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
     # Raw 쿼리 실행을 위한 기존의 연결 방식입니다. ORM으로 전환하면서 더 이상 사용하지 않을 수 있습니다.
     async def get_connection(self) -> AsyncGenerator[AsyncConnection, None]:
         conn: AsyncConnection | None = None
@@ -74,13 +242,20 @@ class MysqlDatabase:
                 await conn.close()  # 작업이 끝나면 커넥션을 풀에 반환
 
     # ORM을 사용하기 위한 비동기 세션을 생성하고 제공하는 메서드입니다.
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
+    async def get_session(self, request: Request) -> AsyncGenerator[AsyncSession, None]:
         session: AsyncSession | None = None
         try:
             # 세션 팩토리를 호출하여 새로운 세션을 생성합니다.
             session = self.async_session_maker()
             yield session  # FastAPI 의존성 주입을 통해 이 세션을 서비스 계층이나 라우터에 전달
-            await session.commit()  # 요청 처리가 성공적으로 끝나면 커밋
+            # 쓰기가 있었을 때만 커밋합니다. 조회만 했다면 close()가 트랜잭션을 롤백으로 끝내고,
+            # 쿼리를 하나도 실행하지 않았다면 커넥션을 얻은 적이 없으므로 DB 왕복이 전혀 없습니다.
+            if self._has_writes(session):
+                await session.commit()  # 요청 처리가 성공적으로 끝나면 커밋
+                if self.replicas:
+                    # 복제본에 반영되기 전까지 이 사용자의 읽기는 primary로 보냅니다.
+                    await self.read_your_writes.mark(request)
+                await run_after_commit_hooks(session)
         except Exception as e:
             if session:
                 await session.rollback()  # 오류 발생 시 롤백
@@ -96,6 +271,83 @@ class MysqlDatabase:
             if session:
                 await session.close()  # 작업이 끝나면 세션을 닫음
 
+    @staticmethod
+    def _has_writes(session: AsyncSession) -> bool:
+        return bool(
+            session.info.pop(HAS_WRITES_KEY, False)
+            or session.new
+            or session.dirty
+            or session.deleted
+        )
+
+    # 조회 전용 세션을 제공하는 메서드입니다. GET 라우트에서 사용합니다.
+    async def get_read_session(
+        self, request: Request
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        복제본이 설정되어 있으면 복제본 세션을, 아니면 primary 세션을 제공합니다.
+        방금 쓰기를 한 사용자는 복제 지연 동안 primary에서 읽습니다(read-your-writes).
+        쓰기를 하지 않으므로 커밋하지 않고 세션을 닫아 트랜잭션을 끝냅니다.
+        """
+        replica = None
+        if self.replicas and not await self.read_your_writes.is_sticky(request):
+            replica = self.pick_replica()
+        async with self._read_session_scope(replica) as session:
+            yield session
+
+    # 페이지 캐시를 채우는 GET 라우트(비로그인 블로그 목록/상세)에서 사용하는 조회 전용 세션입니다.
+    async def get_page_read_session(
+        self, request: Request
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        비로그인 요청의 렌더링 결과는 페이지 캐시에 저장되므로 primary에서 읽습니다.
+        쓰기 후 캐시 버전이 올라간 직후의 캐시 미스를 복제 지연 중인 복제본으로 채우면,
+        오래된 HTML이 새 버전 키로 PAGE_CACHE_TTL 동안 남기 때문입니다.
+        (캐시가 맞으면 세션이 쿼리를 실행하지 않으므로 primary 커넥션도 쓰지 않습니다)
+        로그인 사용자의 응답은 캐시하지 않으므로 get_read_session과 같이 복제본을 사용합니다.
+        """
+        replica = None
+        if (
+            self.replicas
+            and await self.read_your_writes.session_user_id(request) is not None
+            and not await self.read_your_writes.is_sticky(request)
+        ):
+            replica = self.pick_replica()
+        async with self._read_session_scope(replica) as session:
+            yield session
+
+    @asynccontextmanager
+    async def _read_session_scope(
+        self, replica: ReplicaDatabase | None
+    ) -> AsyncIterator[AsyncSession]:
+        session_maker = (
+            replica.async_session_maker if replica else self.async_session_maker
+        )
+
+        session = session_maker()
+        try:
+            # 트랜잭션은 finally의 close()가 롤백으로 끝냅니다.
+            # (rollback() 후 close()를 하면 커넥션 반납 시 리셋 ROLLBACK이 한 번 더 나갑니다)
+            yield session
+        except Exception as e:
+            # 서비스 계층이 DB 오류를 HTTPException으로 감싸 다시 던지므로 원인 체인까지 확인합니다.
+            if replica and _is_connection_error(e):
+                # 연결 오류가 난 복제본은 잠시 후보에서 제외합니다.
+                replica.down_until = time.monotonic() + REPLICA_RETRY_SECONDS
+                print(f"Replica {replica.engine.url!r} marked down: {e}")
+
+            if isinstance(e, HTTPException):
+                raise
+            if isinstance(e, SQLAlchemyError):
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=str(e),
+                ) from e
+            else:
+                raise HTTPException(status_code=500, detail=str(e)) from e
+        finally:
+            await session.close()
+
 
 # 환경 변수에서 데이터베이스 접속 정보를 가져옵니다.
 database_url = os.getenv("DATABASE_URL")
@@ -103,8 +355,18 @@ if not database_url:
     raise ValueError("DATABASE_URL environment variable is not set")
 
 # MysqlDatabase 클래스의 인스턴스를 생성합니다. 이 인스턴스는 애플리케이션 전체에서 공유됩니다.
-db = MysqlDatabase(database_url, DB_CONNECTION_OPTIONS, DB_SESSION_OPTIONS)
+# 읽기 전용 복제본 접속 정보 (쉼표로 구분, 없으면 primary만 사용)
+replica_urls = [
+    url.strip()
+    for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+    if url.strip()
+]
+db = MysqlDatabase(
+    database_url, DB_CONNECTION_OPTIONS, DB_SESSION_OPTIONS, replica_urls
+)
 
 # FastAPI의 Depends()에서 사용하기 쉽도록 메서드를 변수로 할당합니다.
 get_connection_db = db.get_connection  # 레거시 연결 방식
 get_db_session = db.get_session  # ORM 세션 방식
+get_read_db_session = db.get_read_session  # 조회 전용 ORM 세션 (복제본 우선)
+get_page_read_db_session = db.get_page_read_session  # 페이지 캐시용 조회 세션
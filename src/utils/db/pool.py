@@ -0,0 +1,104 @@
+import os
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+# 워커 하나가 사용할 커넥션 수의 상한. 예산이 넉넉해도 비동기 워커 하나에 이보다 많이 둘 필요는 없습니다.
+MAX_POOL_SIZE_PER_WORKER = 30
+MAX_OVERFLOW_PER_WORKER = 10
+
+
+# 커넥션을 얻기까지 기다린 시간 통계입니다. 풀이 작아 요청이 줄을 서는지 판단하는 데 사용합니다.
+@dataclass
+class PoolWaitStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 대여(checkout) 대기 시간을 기록하는 풀입니다."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats.timeouts += 1
+            raise
+        finally:
+            self.wait_stats.record(time.perf_counter() - started)
+        self.wait_stats.checkouts += 1
+        return connection
+
+
+def build_pool_options() -> dict[str, Any]:
+    """
+    커넥션 풀 설정을 환경 변수와 워커 수로 정합니다.
+
+    DB_MAX_CONNECTIONS는 이 앱 전체(모든 uvicorn 워커)가 DB 서버 하나에 열 수 있는 커넥션 예산입니다.
+    WEB_CONCURRENCY(워커 수)로 나눠 워커별 pool_size/max_overflow를 정하므로,
+    워커를 늘려도 합계가 MySQL max_connections를 넘지 않습니다.
+    DB_POOL_SIZE / DB_MAX_OVERFLOW를 직접 지정하면 그 값을 그대로 사용합니다.
+    """
+    workers = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+    budget = int(os.getenv("DB_MAX_CONNECTIONS", "100"))
+    per_worker = max(2, budget // workers)
+
+    default_pool_size = max(1, min(MAX_POOL_SIZE_PER_WORKER, per_worker * 3 // 4))
+    pool_size = int(os.getenv("DB_POOL_SIZE", str(default_pool_size)))
+    default_overflow = max(0, min(MAX_OVERFLOW_PER_WORKER, per_worker - pool_size))
+    max_overflow = int(os.getenv("DB_MAX_OVERFLOW", str(default_overflow)))
+
+    return {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": pool_size,  # 풀에서 유지할 최소한의 커넥션 수
+        "max_overflow": max_overflow,  # 풀 크기를 초과하여 생성할 수 있는 임시 커넥션 수
+        # 커넥션을 재사용하기 전 최대 유지 시간(초). MySQL wait_timeout보다 짧아야 끊긴 커넥션을 쓰지 않습니다.
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "300")),
+        # 커넥션을 얻기 위해 기다리는 최대 시간(초)
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+        # 대여할 때마다 ping으로 살아 있는지 확인합니다. 왕복이 한 번 늘어나므로 기본값은 끔입니다.
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "false").lower() == "true",
+        # 최근에 쓴 커넥션부터 재사용해, 한가할 때 남는 커넥션이 서버의 wait_timeout으로 정리되게 합니다.
+        "pool_use_lifo": True,
+    }
+
+
+def get_pool_metrics(engine: AsyncEngine) -> dict[str, Any]:
+    pool = engine.pool
+    metrics: dict[str, Any] = {"status": pool.status()}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        metrics.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(0, pool.overflow()),
+        )
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        stats = pool.wait_stats
+        metrics.update(
+            checkouts=stats.checkouts,
+            checkout_timeouts=stats.timeouts,
+            checkout_wait_seconds_total=round(stats.wait_seconds_total, 6),
+            checkout_wait_seconds_max=round(stats.wait_seconds_max, 6),
+            checkout_wait_seconds_avg=round(
+                stats.wait_seconds_total / stats.checkouts, 6
+            )
+            if stats.checkouts
+            else 0.0,
+        )
+    return metrics
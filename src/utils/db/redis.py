@@ -1,7 +1,42 @@
 import os
+from time import perf_counter
 from typing import Any
 
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+from src.utils.metrics import redis_command_duration_seconds
+
+
+class InstrumentedPipeline(Pipeline):
+    """파이프라인 전체를 한 번의 왕복으로 보고 PIPELINE 명령 하나로 실행 시간을 기록합니다."""
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        started = perf_counter()
+        try:
+            return await super().execute(raise_on_error)
+        finally:
+            redis_command_duration_seconds.observe(perf_counter() - started, "PIPELINE")
+
+
+class InstrumentedRedis(Redis):
+    """명령별 실행 시간을 메트릭(redis_command_duration_seconds)으로 기록하는 클라이언트입니다."""
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        started = perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            redis_command_duration_seconds.observe(
+                perf_counter() - started, str(args[0]).upper()
+            )
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: Any | None = None
+    ) -> Pipeline:
+        return InstrumentedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
 
 
 class RedisDatabase:
@@ -14,7 +49,9 @@ class RedisDatabase:
             redis_url = os.getenv("REDIS_URL")
             if not redis_url:
                 raise ValueError("REDIS_URL is not set")
-            cls._instance.redis = Redis.from_url(redis_url, **(options or {}))
+            cls._instance.redis = InstrumentedRedis.from_url(
+                redis_url, **(options or {})
+            )
         return cls._instance
 
     def get_client(self) -> Redis:
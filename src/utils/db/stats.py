@@ -0,0 +1,227 @@
+import os
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.utils.metrics import db_query_duration_seconds, db_query_errors_total
+
+# 메트릭 라벨로 쓰는 SQL 종류. 그 밖의 문장(SET, SHOW 등)은 OTHER로 묶습니다.
+QUERY_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+_QUERY_STARTED_KEY = "query_started_at"
+
+# 쿼리 검사기: 요청마다 실행한 SQL을 정규화해 모아 두었다가, 기준을 넘은 요청을 로그로 남깁니다.
+# (느린 쿼리, 문장 수 초과, 같은 모양의 쿼리 반복 = N+1 의심) 정규화 비용이 있으므로 운영에서는 필요할 때만 켭니다.
+QUERY_INSPECTOR_ENABLED = os.getenv("DB_QUERY_INSPECTOR", "false").lower() == "true"
+# 쿼리 하나가 이 시간(초) 이상 걸리면 느린 쿼리로 기록합니다.
+SLOW_QUERY_SECONDS = float(os.getenv("DB_SLOW_QUERY_SECONDS", "0.1"))
+# 요청 하나의 DB 시간 합계(초)가 이 값 이상이면 로그를 남깁니다.
+SLOW_REQUEST_DB_SECONDS = float(os.getenv("DB_SLOW_REQUEST_DB_SECONDS", "0.3"))
+# 요청 하나가 실행한 SQL 문 수가 이 값을 넘으면 로그를 남깁니다.
+REQUEST_STATEMENT_LIMIT = int(os.getenv("DB_REQUEST_STATEMENT_LIMIT", "20"))
+# 같은 모양의 SQL이 요청 하나에서 이 횟수 이상 실행되면 N+1로 보고 로그를 남깁니다.
+REPEATED_STATEMENT_LIMIT = int(os.getenv("DB_REPEATED_STATEMENT_LIMIT", "5"))
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    SQL의 리터럴과 바인딩 자리를 ?로 바꿔 '모양'만 남깁니다.
+    IN (%s, %s, ...)처럼 개수만 다른 목록은 (...) 하나로 묶어 같은 모양으로 봅니다.
+    """
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+# 요청 하나 동안 발생한 DB 왕복(round trip) 통계입니다.
+@dataclass
+class DBStats:
+    # SQL 문 실행 횟수
+    statements: int = 0
+    # COMMIT/ROLLBACK 및 커넥션 반납 시 리셋(ROLLBACK) 횟수
+    transaction_ends: int = 0
+    # SQL 문 실행 시간 합계(초)
+    db_seconds: float = 0.0
+    # 정규화한 SQL -> 실행 횟수 (쿼리 검사기나 쿼리 예산이 켜져 있을 때만 기록)
+    shapes: Counter[str] = field(default_factory=Counter)
+    # (실행 시간, 정규화한 SQL) 느린 쿼리 목록
+    slow_queries: list[tuple[float, str]] = field(default_factory=list)
+
+    @property
+    def round_trips(self) -> int:
+        return self.statements + self.transaction_ends
+
+    def repeated_shapes(self, min_count: int) -> list[tuple[str, int]]:
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= min_count
+        ]
+
+    def describe(self, repeat_threshold: int = 2) -> str:
+        lines = [
+            f"statements={self.statements} round_trips={self.round_trips} "
+            f"db_time={self.db_seconds * 1000:.1f}ms"
+        ]
+        for seconds, shape in self.slow_queries:
+            lines.append(f"  slow {seconds * 1000:.1f}ms: {shape}")
+        for shape, count in self.repeated_shapes(repeat_threshold):
+            lines.append(f"  repeated x{count}: {shape}")
+        return "\n".join(lines)
+
+
+# 현재 요청의 통계 객체. 요청 밖(백그라운드 작업, 관리 명령)에서는 None입니다.
+# 값을 바꾸지 않고 객체를 수정하므로 스레드풀/greenlet으로 복사된 컨텍스트에서도 같은 객체에 기록됩니다.
+_current_stats: ContextVar[DBStats | None] = ContextVar("db_stats", default=None)
+
+
+def start_request_stats() -> tuple[DBStats, Token[DBStats | None]]:
+    stats = DBStats()
+    return stats, _current_stats.set(stats)
+
+
+def reset_request_stats(token: Token[DBStats | None]) -> None:
+    _current_stats.reset(token)
+
+
+def current_stats() -> DBStats | None:
+    return _current_stats.get()
+
+
+def report_request_stats(stats: DBStats, label: str) -> None:
+    """쿼리 검사기가 켜져 있으면, 기준을 넘은 요청의 DB 사용 내역을 정규화한 SQL과 함께 출력합니다."""
+    if not QUERY_INSPECTOR_ENABLED:
+        return
+    if (
+        stats.statements <= REQUEST_STATEMENT_LIMIT
+        and stats.db_seconds < SLOW_REQUEST_DB_SECONDS
+        and not stats.slow_queries
+        and not stats.repeated_shapes(REPEATED_STATEMENT_LIMIT)
+    ):
+        return
+    print(f"[db] {label} {stats.describe(REPEATED_STATEMENT_LIMIT)}")
+
+
+# 실행 중인 query_budget 블록들. 요청 통계처럼 컨텍스트 변수라서 블록을 연 태스크(와 거기서 복사된
+# 컨텍스트)에서 실행한 SQL만 셉니다. 백그라운드 작업의 쿼리는 섞이지 않습니다.
+_query_budgets: ContextVar[tuple[DBStats, ...]] = ContextVar(
+    "query_budgets", default=()
+)
+
+
+@contextmanager
+def query_budget(max_statements: int) -> Iterator[DBStats]:
+    """
+    블록 안에서 실행된 SQL 문 수가 max_statements를 넘으면 AssertionError를 냅니다.
+    테스트에서 라우트별 쿼리 예산을 검사할 때 사용합니다.
+    블록을 연 태스크의 SQL만 세므로, 앱을 같은 이벤트 루프에서 호출하는
+    httpx.AsyncClient(ASGITransport)와 함께 사용합니다. (TestClient는 다른 스레드에서 앱을 실행함)
+
+        with query_budget(4):
+            await client.get("/blogs/show/1")
+    """
+    budget = DBStats()
+    token = _query_budgets.set((*_query_budgets.get(), budget))
+    try:
+        yield budget
+    finally:
+        _query_budgets.reset(token)
+    if budget.statements > max_statements:
+        raise AssertionError(
+            f"Query budget exceeded: {budget.statements} > {max_statements}\n"
+            f"{budget.describe()}"
+        )
+
+
+def _inspect_statement(statement: str, seconds: float) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.db_seconds += seconds
+    budgets = _query_budgets.get()
+    if not QUERY_INSPECTOR_ENABLED and not budgets:
+        return
+
+    shape = normalize_sql(statement)
+    if QUERY_INSPECTOR_ENABLED:
+        if seconds >= SLOW_QUERY_SECONDS:
+            if stats is None:
+                # 요청 밖(백그라운드 작업)의 느린 쿼리는 바로 출력합니다.
+                print(f"[db] slow {seconds * 1000:.1f}ms: {shape}")
+            else:
+                stats.slow_queries.append((seconds, shape))
+        if stats is not None:
+            stats.shapes[shape] += 1
+    for budget in budgets:
+        budget.statements += 1
+        budget.db_seconds += seconds
+        budget.shapes[shape] += 1
+
+
+def _count_statement(*args: Any) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.statements += 1
+
+
+def _count_transaction_end(*args: Any) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.transaction_ends += 1
+
+
+def _query_operation(statement: str) -> str:
+    words = statement.lstrip().split(None, 1)
+    operation = words[0].upper() if words else ""
+    return operation if operation in QUERY_OPERATIONS else "OTHER"
+
+
+def install_db_stats(engine: AsyncEngine, database: str = "primary") -> None:
+    """
+    엔진에 이벤트 리스너를 달아 현재 요청의 DB 왕복 횟수와 실행 시간을 세고,
+    SQL 문 실행 시간을 메트릭(db_query_duration_seconds)으로 기록합니다.
+    쿼리 검사기/쿼리 예산이 켜져 있으면 정규화한 SQL도 모읍니다.
+    database는 메트릭 라벨입니다. (primary, replica0, ...)
+    """
+    sync_engine = engine.sync_engine
+
+    def start_query_timer(conn: Connection, *args: Any) -> None:
+        conn.info[_QUERY_STARTED_KEY] = perf_counter()
+
+    def record_query(conn: Connection, cursor: Any, statement: str, *args: Any) -> None:
+        started = conn.info.pop(_QUERY_STARTED_KEY, None)
+        if started is None:
+            return
+        seconds = perf_counter() - started
+        db_query_duration_seconds.observe(
+            seconds, database, _query_operation(statement)
+        )
+        _inspect_statement(statement, seconds)
+
+    def record_query_error(context: ExceptionContext) -> None:
+        db_query_errors_total.inc(database)
+        if context.connection is not None:
+            context.connection.info.pop(_QUERY_STARTED_KEY, None)
+
+    event.listen(sync_engine, "before_cursor_execute", start_query_timer)
+    event.listen(sync_engine, "after_cursor_execute", record_query)
+    event.listen(sync_engine, "handle_error", record_query_error)
+    event.listen(sync_engine, "before_cursor_execute", _count_statement)
+    event.listen(sync_engine, "commit", _count_transaction_end)
+    event.listen(sync_engine, "rollback", _count_transaction_end)
+    # 트랜잭션이 끝나지 않은 채 반납된 커넥션은 풀이 ROLLBACK으로 리셋합니다.
+    event.listen(sync_engine.pool, "reset", _count_transaction_end)
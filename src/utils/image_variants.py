@@ -0,0 +1,48 @@
+import json
+import os
+
+# 업로드 이미지로부터 만들어 두는 리사이즈 버전의 가로 폭(px)입니다.
+IMAGE_VARIANT_WIDTHS: tuple[int, ...] = (320, 640, 1280)
+
+# 리사이즈 버전을 저장하는 포맷과 확장자입니다. WebP를 우선 사용하고 JPEG는 호환용입니다.
+IMAGE_VARIANT_FORMATS: dict[str, str] = {"webp": "WEBP", "jpg": "JPEG"}
+
+
+def image_variant_path(image_path: str, width: int, ext: str) -> str:
+    """
+    원본 이미지 경로로부터 리사이즈 버전의 경로를 만듭니다.
+    예: 'images/a/cat.png' -> 'images/a/cat_w640.webp'
+    웹 프로세스와 Celery 워커가 같은 규칙을 사용해야 하므로 이 함수로만 경로를 만듭니다.
+    """
+    stem, _ = os.path.splitext(image_path)
+    return f"{stem}_w{width}.{ext}"
+
+
+def image_variant_manifest_path(image_path: str) -> str:
+    """
+    워커가 실제로 만든 리사이즈 버전의 폭 목록을 기록하는 파일 경로입니다.
+    예: 'images/a/cat.png' -> 'images/a/cat.variants.json'
+    """
+    stem, _ = os.path.splitext(image_path)
+    return f"{stem}.variants.json"
+
+
+def write_variant_manifest(image_path: str, widths: list[int]) -> None:
+    """
+    리사이즈 버전을 모두 만든 뒤 폭 목록을 기록합니다.
+    임시 파일에 쓴 뒤 rename하므로 웹 프로세스가 반쯤 쓰인 목록을 읽는 일은 없습니다.
+    """
+    manifest_path = image_variant_manifest_path(image_path)
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump({"widths": sorted(widths)}, file)
+    os.replace(tmp_path, manifest_path)
+
+
+def read_variant_manifest(image_path: str) -> tuple[int, ...] | None:
+    """기록된 폭 목록을 읽습니다. 워커가 아직 처리하지 않은 이미지면 None을 반환합니다."""
+    try:
+        with open(image_variant_manifest_path(image_path), encoding="utf-8") as file:
+            return tuple(json.load(file)["widths"])
+    except FileNotFoundError:
+        return None
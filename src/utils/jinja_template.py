@@ -1,11 +1,58 @@
-from typing import Optional
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from typing import Any, Optional
 
+from fastapi import Request
+from fastapi.responses import StreamingResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+TEMPLATE_DIR = "src/templates"
+# 컴파일된 템플릿 바이트코드를 저장할 디렉터리 (빈 값이면 바이트코드 캐시를 사용하지 않음)
+JINJA_BYTECODE_CACHE_DIR = os.getenv("JINJA_BYTECODE_CACHE_DIR", ".cache/jinja")
+# 운영 환경에서는 false로 두어 렌더링마다 템플릿 파일의 변경 여부를 확인하지 않도록 합니다.
+JINJA_AUTO_RELOAD = os.getenv("JINJA_AUTO_RELOAD", "true").lower() == "true"
+# 스트리밍 렌더링 시 이 크기(문자 수)만큼 모이면 클라이언트로 내보냅니다.
+STREAM_FLUSH_SIZE = 4096
+
+
+class TemplateEnvironment(Environment):
+    def join_path(self, template: str, parent: str) -> str:
+        """
+        extends/include의 '/layout/main_layout.html'과 'layout/main_layout.html'을 같은 이름으로 취급합니다.
+        이름이 다르면 같은 파일이 템플릿 캐시와 바이트코드 캐시에 따로 올라가므로 앞의 '/'를 제거합니다.
+        """
+        return template.lstrip("/")
+
+
+def create_template_environment(enable_async: bool = False) -> Environment:
+    bytecode_cache = None
+    if JINJA_BYTECODE_CACHE_DIR:
+        # 비동기 모드는 컴파일 결과가 다르므로 바이트코드 캐시 디렉터리를 분리합니다.
+        cache_dir = (
+            os.path.join(JINJA_BYTECODE_CACHE_DIR, "async")
+            if enable_async
+            else JINJA_BYTECODE_CACHE_DIR
+        )
+        os.makedirs(cache_dir, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+    env = TemplateEnvironment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=True,
+        auto_reload=JINJA_AUTO_RELOAD,
+        bytecode_cache=bytecode_cache,
+        enable_async=enable_async,
+    )
+    return env
 
 
 class JinjaSingleton:
     _instance: Optional["JinjaSingleton"] = None
     templates: Jinja2Templates
+    # 스트리밍 렌더링(generate_async)에 사용하는 비동기 모드 Environment
+    async_env: Environment
 
     def __new__(cls) -> "JinjaSingleton":
         """
@@ -14,11 +61,72 @@ class JinjaSingleton:
         """
         if cls._instance is None:
             # 아직 인스턴스가 생성되지 않았을 경우에만 실행됩니다.
-            cls._instance = super(JinjaSingleton, cls).__new__(cls)
+            cls._instance = super().__new__(cls)
             # 단 한번만 Jinja2Templates를 초기화합니다.
-            cls._instance.templates = Jinja2Templates(directory="src/templates")
+            cls._instance.templates = Jinja2Templates(env=create_template_environment())
+            cls._instance.async_env = create_template_environment(enable_async=True)
+            # url_for 등 Jinja2Templates가 등록한 전역 함수를 그대로 사용합니다.
+            cls._instance.async_env.globals.update(cls._instance.templates.env.globals)
         return cls._instance
 
+    def prewarm(self) -> int:
+        """
+        src/templates 아래의 모든 템플릿을 미리 컴파일해 첫 요청이 파싱/컴파일 비용을 내지 않게 합니다.
+        바이트코드 캐시가 있으면 다른 워커나 재시작 후에는 컴파일 대신 캐시를 읽습니다.
+        """
+        started = time.perf_counter()
+        names = self.templates.env.list_templates()
+        for env in (self.templates.env, self.async_env):
+            for name in names:
+                env.get_template(name)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"Prewarmed {len(names)} templates in {elapsed_ms:.1f}ms")
+        return len(names)
+
+    def stream_response(
+        self,
+        request: Request,
+        name: str,
+        context: dict[str, Any],
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        on_complete: Callable[[bytes], Awaitable[object]] | None = None,
+    ) -> StreamingResponse:
+        """
+        템플릿을 generate_async로 렌더링하면서 완성된 부분부터 바로 전송합니다.
+        레이아웃 head와 navbar가 먼저 나가고, 목록/댓글 반복문은 렌더링되는 대로 뒤따릅니다.
+
+        on_complete를 주면 렌더링이 끝난 뒤 전체 본문으로 호출합니다(페이지 캐시 저장 등).
+        headers는 본문보다 먼저 나가므로 캐시 검증 헤더 등은 렌더링 전에 정해 넘겨야 합니다.
+        헤더를 먼저 보내므로 렌더링 도중 발생한 오류는 에러 페이지로 바꿀 수 없습니다.
+        """
+        template = self.async_env.get_template(name)
+        context = {"request": request, **context}
+
+        async def render() -> AsyncIterator[bytes]:
+            pending: list[str] = []
+            pending_size = 0
+            rendered: list[bytes] = []
+            async for chunk in template.generate_async(context):
+                pending.append(chunk)
+                pending_size += len(chunk)
+                if pending_size >= STREAM_FLUSH_SIZE:
+                    data = "".join(pending).encode()
+                    pending.clear()
+                    pending_size = 0
+                    rendered.append(data)
+                    yield data
+            if pending:
+                data = "".join(pending).encode()
+                rendered.append(data)
+                yield data
+            if on_complete is not None:
+                await on_complete(b"".join(rendered))
+
+        return StreamingResponse(
+            render(), status_code=status_code, headers=headers, media_type="text/html"
+        )
+
 
 # 다른 모듈에서 간편하게 사용할 수 있도록 싱글톤 인스턴스를 미리 생성합니다.
 jinja_manager = JinjaSingleton()
@@ -0,0 +1,283 @@
+"""
+프로세스 내 메트릭 레지스트리입니다. /internal/metrics에서 Prometheus 텍스트 형식으로 노출합니다.
+
+값은 uvicorn 워커 프로세스마다 따로 쌓이므로, 워커가 여러 개라면 스크레이프할 때마다
+응답한 워커의 값만 보입니다. (Prometheus에서 instance 단위로 합산해 보면 됩니다.)
+"""
+
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+
+# 요청 처리 시간용 버킷(초)
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# DB 쿼리/Redis 명령처럼 짧은 작업용 버킷(초)
+FAST_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class Metric:
+    type_name = ""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: tuple[str, ...]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {labels}"
+            )
+        return labels
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        yield from self._render_samples()
+
+    def _render_samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        if not labelnames:
+            # 라벨이 없는 값은 한 번도 바뀌지 않았어도 0으로 노출합니다.
+            self._values[()] = 0.0
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set(self, value: float, *labels: str) -> None:
+        """다른 곳에서 누적하고 있는 값을 수집 시점에 옮겨 담을 때 사용합니다."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def _render_samples(self) -> Iterable[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 -> (버킷별 관측 수(누적 아님, 마지막 칸은 +Inf), 합계)
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            counts, total = entry
+            counts[index] += 1
+            total[0] += value
+
+    def _render_samples(self) -> Iterable[str]:
+        with self._lock:
+            items = [
+                (labels, list(counts), total[0])
+                for labels, (counts, total) in self._values.items()
+            ]
+        bucket_labelnames = (*self.labelnames, "le")
+        for labels, counts, total in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts, strict=True):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    bucket_labelnames, (*labels, _format_value(bound))
+                )
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            label_text = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_text} {_format_value(total)}"
+            yield f"{self.name}_count{label_text} {cumulative}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Gauge:
+        metric = Gauge(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.register(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], None]) -> None:
+        """출력 직전에 호출되어 게이지 등의 값을 최신으로 채우는 함수를 등록합니다."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            collector()
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+http_requests_total = metrics_registry.counter(
+    "http_requests_total",
+    "처리한 HTTP 요청 수",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = metrics_registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간(응답 본문 전송 완료까지)",
+    ("method", "route"),
+)
+http_requests_in_flight = metrics_registry.gauge(
+    "http_requests_in_flight",
+    "현재 처리 중인 HTTP 요청 수",
+)
+db_query_duration_seconds = metrics_registry.histogram(
+    "db_query_duration_seconds",
+    "SQL 문 실행 시간",
+    ("database", "operation"),
+    buckets=FAST_BUCKETS,
+)
+db_query_errors_total = metrics_registry.counter(
+    "db_query_errors_total",
+    "실패한 SQL 문 수",
+    ("database",),
+)
+redis_command_duration_seconds = metrics_registry.histogram(
+    "redis_command_duration_seconds",
+    "Redis 명령 실행 시간 (파이프라인은 PIPELINE 한 건으로 기록)",
+    ("command",),
+    buckets=FAST_BUCKETS,
+)
+
+# 커넥션 풀 상태. 스크레이프 시점에 수집 함수가 풀에서 값을 읽어 채웁니다. (src/router/internal.py)
+db_pool_size = metrics_registry.gauge(
+    "db_pool_size", "커넥션 풀 크기(pool_size)", ("database",)
+)
+db_pool_checked_in = metrics_registry.gauge(
+    "db_pool_checked_in", "풀에서 쉬고 있는 커넥션 수", ("database",)
+)
+db_pool_checked_out = metrics_registry.gauge(
+    "db_pool_checked_out", "대여 중인 커넥션 수", ("database",)
+)
+db_pool_overflow = metrics_registry.gauge(
+    "db_pool_overflow", "pool_size를 넘어 만든 임시 커넥션 수", ("database",)
+)
+db_pool_checkouts_total = metrics_registry.counter(
+    "db_pool_checkouts_total", "커넥션 대여 횟수", ("database",)
+)
+db_pool_checkout_timeouts_total = metrics_registry.counter(
+    "db_pool_checkout_timeouts_total",
+    "대기 시간 초과로 실패한 커넥션 대여 수",
+    ("database",),
+)
+db_pool_checkout_wait_seconds_total = metrics_registry.counter(
+    "db_pool_checkout_wait_seconds_total", "커넥션 대여 대기 시간 합계", ("database",)
+)
+db_pool_checkout_wait_seconds_max = metrics_registry.gauge(
+    "db_pool_checkout_wait_seconds_max",
+    "가장 길었던 커넥션 대여 대기 시간",
+    ("database",),
+)
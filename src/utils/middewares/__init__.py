@@ -1,8 +1,8 @@
 from fastapi import FastAPI
 
 from .cors import add_cors_middleware
-from .processTimer import ProcessTimerMiddleware
-from .redis import RedisMiddleware
+from .db_stats import DBStatsMiddleware
+from .metrics import MetricsMiddleware
 from .session import add_session_middleware
 
 
@@ -10,5 +10,5 @@ def add_middlewares(app: FastAPI) -> None:
     print("add_middlewares")
     add_cors_middleware(app)
     add_session_middleware(app)
-    app.add_middleware(RedisMiddleware)
-    app.add_middleware(ProcessTimerMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(DBStatsMiddleware)
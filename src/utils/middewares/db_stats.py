@@ -0,0 +1,41 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.db.stats import (
+    report_request_stats,
+    reset_request_stats,
+    start_request_stats,
+)
+
+from .metrics import route_template
+
+
+class DBStatsMiddleware:
+    """
+    응답 헤더(X-DB-Round-Trips)에 요청 처리 중 발생한 DB 왕복 횟수를 기록하는 순수 ASGI 미들웨어입니다.
+    응답 헤더를 보내는 시점까지의 횟수이므로, 그 뒤에 끝나는 세션 정리 작업은 포함되지 않을 수 있습니다.
+    요청이 끝나면 쿼리 검사기(DB_QUERY_INSPECTOR)에 넘겨 기준을 넘은 요청을 로그로 남깁니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_request_stats()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(
+                    "X-DB-Round-Trips", str(stats.round_trips)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            reset_request_stats(token)
+            report_request_stats(stats, f"{scope['method']} {route_template(scope)}")
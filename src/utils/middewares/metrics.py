@@ -0,0 +1,58 @@
+from time import perf_counter
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.metrics import (
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+)
+
+# 어떤 라우트와도 일치하지 않은 요청(404 등). 경로를 그대로 라벨로 쓰면 종류가 끝없이 늘어나므로 하나로 묶습니다.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    # FastAPI는 일치한 라우트를 scope["route"]에 넣어 줍니다. ('/blogs/show/{blog_id}' 같은 경로 템플릿)
+    route: Any = scope.get("route")
+    if route is not None:
+        return str(route.path)
+    # 마운트된 앱(정적 파일)은 마운트 경로로 묶습니다.
+    if scope.get("endpoint") is not None and scope.get("root_path"):
+        return str(scope["root_path"])
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    라우트 템플릿별 요청 수/처리 시간과 처리 중인 요청 수를 기록하는 순수 ASGI 미들웨어입니다.
+    처리 시간은 스트리밍 응답의 본문 전송이 끝날 때까지를 잽니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        start = perf_counter()
+        http_requests_in_flight.inc()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec()
+            route = route_template(scope)
+            http_request_duration_seconds.observe(perf_counter() - start, method, route)
+            http_requests_total.inc(method, route, str(status_code))
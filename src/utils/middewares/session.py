@@ -1,9 +1,138 @@
-import os
+import uuid
+from collections.abc import Iterator, MutableMapping
+from typing import Any
 
 from fastapi import FastAPI
-from starlette.middleware.sessions import SessionMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.manager.session_redis_manager import SessionRedisManager
+
+
+class RedisSession(MutableMapping[str, Any]):
+    """
+    요청 하나 동안 사용하는 세션 객체입니다.
+
+    - Redis 조회는 load()가 처음 호출될 때까지 미룹니다(lazy loading).
+      세션을 건드리지 않는 요청(정적 파일, 공개 API 등)은 Redis에 접근하지 않습니다.
+    - 값이 바뀌면 modified 플래그가 켜지고, 미들웨어는 이 플래그가 켜진 경우에만 Redis에 저장합니다.
+    """
+
+    __slots__ = ("session_id", "modified", "_manager", "_data", "_loaded")
+
+    def __init__(self, session_id: str | None, manager: SessionRedisManager) -> None:
+        self.session_id = session_id
+        self.modified = False
+        self._manager = manager
+        self._data: dict[str, Any] = {}
+        # 세션 쿠키가 없으면 읽어올 데이터도 없으므로 이미 로드된 것으로 취급합니다.
+        self._loaded = session_id is None
+
+    async def load(self) -> "RedisSession":
+        if not self._loaded:
+            assert self.session_id is not None
+            self._data = await self._manager._get_redis_session(self.session_id) or {}
+            self._loaded = True
+        return self
+
+    def replace(self, data: dict[str, Any]) -> None:
+        """세션 내용을 통째로 교체합니다. 기존 값을 읽을 필요가 없으므로 Redis를 조회하지 않습니다."""
+        self._data = dict(data)
+        self._loaded = True
+        self.modified = True
+
+    def clear(self) -> None:
+        self._data = {}
+        self._loaded = True
+        self.modified = True
+
+    def _ensure_loaded(self) -> dict[str, Any]:
+        if not self._loaded:
+            raise RuntimeError(
+                "세션을 사용하기 전에 await session.load()를 호출해야 합니다."
+            )
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._ensure_loaded()[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._ensure_loaded()[key] = value
+        self.modified = True
+
+    def __delitem__(self, key: str) -> None:
+        del self._ensure_loaded()[key]
+        self.modified = True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ensure_loaded())
+
+    def __len__(self) -> int:
+        return len(self._ensure_loaded())
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(self._ensure_loaded())
+
+
+class SessionMiddleware:
+    """
+    Redis 기반 세션을 관리하는 순수 ASGI 미들웨어입니다.
+
+    쿠키에는 세션 id 하나만 저장하고, 세션 내용은 Redis에 보관합니다.
+    BaseHTTPMiddleware를 거치지 않으므로 요청마다 추가 태스크/스트림이 생기지 않습니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        session_cookie_key: str = "session_id",
+        max_age: int = 60 * 60,
+    ) -> None:
+        self.app = app
+        self.session_cookie_key = session_cookie_key
+        self.max_age = max_age
+        self.session_manager = SessionRedisManager()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        session_id = HTTPConnection(scope).cookies.get(self.session_cookie_key)
+        session = RedisSession(session_id, self.session_manager)
+        # request.state.session으로 접근할 수 있도록 scope의 state에 넣어 둡니다.
+        scope.setdefault("state", {})["session"] = session
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and session.modified:
+                await self._commit_session(session, MutableHeaders(scope=message))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _commit_session(
+        self, session: RedisSession, headers: MutableHeaders
+    ) -> None:
+        if not session:
+            # 로그아웃 등으로 세션이 비워진 경우 Redis와 쿠키를 모두 정리합니다.
+            if session.session_id:
+                await self.session_manager._delete_redis_session(session.session_id)
+                headers.append(
+                    "set-cookie",
+                    f"{self.session_cookie_key}=; Max-Age=0; "
+                    "expires=Thu, 01 Jan 1970 00:00:00 GMT; Path=/; HttpOnly; SameSite=lax",
+                )
+            return
+
+        session_id = session.session_id or str(uuid.uuid4())
+        await self.session_manager._set_redis_session(session_id, session.to_dict())
+        headers.append(
+            "set-cookie",
+            f"{self.session_cookie_key}={session_id}; Max-Age={self.max_age}; "
+            "Path=/; HttpOnly; SameSite=lax",
+        )
 
 
 def add_session_middleware(app: FastAPI) -> None:
-    SECRET_KEY = os.getenv("SECRET_KEY")
-    app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY, max_age=3600)
+    app.add_middleware(SessionMiddleware)
@@ -0,0 +1,30 @@
+import base64
+import binascii
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    """
+    (정렬 기준 시각, id) 쌍을 URL에 실을 수 있는 불투명한 커서 문자열로 인코딩합니다.
+    """
+    raw = f"{sort_value.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    encode_cursor로 만든 커서를 (정렬 기준 시각, id) 쌍으로 되돌립니다.
+    클라이언트가 임의로 조작한 커서는 400 에러로 처리합니다.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        sort_value, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 페이지 커서입니다.",
+        ) from e
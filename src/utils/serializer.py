@@ -0,0 +1,55 @@
+"""
+JSON 직렬화 계층입니다.
+
+orjson이 설치되어 있으면 orjson으로, 없으면 표준 라이브러리 json으로 직렬화합니다.
+Redis 세션 값과 JSON API 응답이 이 모듈을 통해 한 번에 bytes로 직렬화됩니다.
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson이 없는 환경
+    HAS_ORJSON = False
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(
+        obj, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def dumps(obj: Any) -> bytes:
+    # orjson은 254단계보다 깊게 중첩된 값을 직렬화하지 못하므로, 깊어질 수 있는 데이터(댓글 트리 등)는
+    # 만드는 쪽에서 깊이를 제한해야 합니다. (CommentService의 MAX_COMMENT_DEPTH)
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return _stdlib_dumps(obj)
+
+
+def loads(data: bytes | str) -> Any:
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    serializer.dumps로 본문을 만드는 JSON 응답입니다.
+    dict/list 같은 기본 타입을 그대로 넘기면 jsonable_encoder를 거치지 않고 한 번에 직렬화됩니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,124 @@
+import hashlib
+import mimetypes
+import os
+import re
+from urllib.parse import parse_qs
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+STATIC_DIR = "src/static"
+STATIC_URL_PREFIX = "/src/static"
+
+# 내용이 바뀌면 URL도 바뀌는 자원에 붙이는 캐시 헤더(1년, 재검증 없음)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 지문이 없는 URL은 짧게 캐시하고 이후에는 ETag로 재검증합니다.
+DEFAULT_CACHE_CONTROL = "public, max-age=300, must-revalidate"
+
+# 미리 압축해 둔 파일의 확장자 (선호 순서)
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# 내용 해시로 이름 붙인 업로드 이미지와 리사이즈 버전 ('<sha256>.png', '<sha256>_w640.webp')
+_HASHED_FILENAME = re.compile(r"^[0-9a-f]{64}(_w\d+)?$")
+
+# 파일 경로 -> (mtime, 지문)
+_fingerprints: dict[str, tuple[float, str]] = {}
+
+
+def static_url(path: str) -> str:
+    """
+    정적 파일의 URL에 내용 해시 지문(?v=...)을 붙여 반환합니다.
+    파일 내용이 바뀌면 URL이 바뀌므로 브라우저는 이전 버전을 오래 캐시해도 안전합니다.
+    """
+    path = path.lstrip("/")
+    file_path = os.path.join(STATIC_DIR, path)
+    try:
+        mtime = os.stat(file_path).st_mtime
+    except OSError:
+        return f"{STATIC_URL_PREFIX}/{path}"
+
+    cached = _fingerprints.get(file_path)
+    if cached is None or cached[0] != mtime:
+        with open(file_path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()[:12]
+        cached = (mtime, digest)
+        _fingerprints[file_path] = cached
+    return f"{STATIC_URL_PREFIX}/{path}?v={cached[1]}"
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    캐시 헤더와 사전 압축 파일을 지원하는 StaticFiles입니다.
+
+    - 지문이 붙은 URL(?v=...)이나 내용 해시 이름의 파일은 immutable로 1년 캐시합니다.
+    - 'app.css.br', 'app.css.gz'처럼 미리 압축한 파일이 있으면 Accept-Encoding에 맞춰 그대로 보냅니다.
+      (python -m src.commands.compress_static 으로 생성)
+    - Range 요청과 파일 전송은 Starlette의 FileResponse가 처리합니다.
+      서버가 http.response.pathsend 확장을 지원하면 파일 내용을 파이썬에서 읽지 않고 넘깁니다.
+    """
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        original_path = os.fspath(full_path)
+        has_precompressed = any(
+            os.path.exists(original_path + ext) for _, ext in PRECOMPRESSED_ENCODINGS
+        )
+
+        encoding = None
+        # 부분 요청은 원본 파일 기준이어야 하므로 압축본을 쓰지 않습니다.
+        if has_precompressed and "range" not in request_headers:
+            encoding, compressed = self._find_precompressed(
+                original_path, request_headers.get("accept-encoding", "")
+            )
+            if compressed is not None:
+                full_path, stat_result = compressed
+
+        response = super().file_response(full_path, stat_result, scope, status_code)
+
+        if encoding is not None:
+            media_type, _ = mimetypes.guess_type(original_path)
+            response.headers["content-type"] = media_type or "application/octet-stream"
+            response.headers["content-encoding"] = encoding
+        if has_precompressed:
+            response.headers["vary"] = "Accept-Encoding"
+
+        response.headers["cache-control"] = (
+            IMMUTABLE_CACHE_CONTROL
+            if self._is_fingerprinted(original_path, scope)
+            else DEFAULT_CACHE_CONTROL
+        )
+        return response
+
+    @staticmethod
+    def _find_precompressed(
+        full_path: str, accept_encoding: str
+    ) -> tuple[str | None, tuple[str, os.stat_result] | None]:
+        accepted = {
+            value.split(";", 1)[0].strip().lower()
+            for value in accept_encoding.split(",")
+        }
+        for encoding, ext in PRECOMPRESSED_ENCODINGS:
+            if encoding not in accepted:
+                continue
+            try:
+                compressed_stat = os.stat(full_path + ext)
+            except OSError:
+                continue
+            return encoding, (full_path + ext, compressed_stat)
+        return None, None
+
+    @staticmethod
+    def _is_fingerprinted(full_path: str, scope: Scope) -> bool:
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        if query.get("v"):
+            return True
+        stem = os.path.splitext(os.path.basename(full_path))[0]
+        return bool(_HASHED_FILENAME.match(stem))
@@ -1,3 +1,8 @@
+import re
+
+from markupsafe import Markup, escape
+
+
 def truncate_text(text: str, max_length: int = 150) -> str:
     if len(text) > max_length:
         return text[:max_length] + "..."
@@ -6,3 +11,55 @@ def truncate_text(text: str, max_length: int = 150) -> str:
 
 def newline_to_br(text: str) -> str:
     return text.replace("\n", "<br>")
+
+
+def render_content_html(content: str) -> str:
+    """상세 페이지에 그대로 출력할 본문 HTML을 만듭니다."""
+    return newline_to_br(content)
+
+
+def make_excerpt(content: str) -> str:
+    """목록 카드에 보여줄 요약문을 만듭니다."""
+    return truncate_text(newline_to_br(content))
+
+
+def highlight_terms(text: str, terms: list[str]) -> Markup:
+    """
+    text를 HTML 이스케이프하고, terms에 해당하는 부분을 <mark>로 감싼 Markup을 반환합니다.
+    대소문자는 구분하지 않습니다.
+    """
+    pattern = _terms_pattern(terms)
+    if pattern is None:
+        return escape(text)
+
+    parts: list[str] = []
+    last = 0
+    for m in pattern.finditer(text):
+        parts.append(escape(text[last : m.start()]))
+        parts.append(Markup("<mark>%s</mark>") % m.group())
+        last = m.end()
+    parts.append(escape(text[last:]))
+    return Markup("").join(parts)
+
+
+def make_snippet(text: str, terms: list[str], width: int = 160) -> Markup:
+    """
+    검색어가 처음 나타나는 위치 주변을 width 글자만큼 잘라 검색어를 강조한 스니펫을 만듭니다.
+    검색어가 본문에 없으면 앞부분을 사용합니다.
+    """
+    pattern = _terms_pattern(terms)
+    first = pattern.search(text) if pattern else None
+    start = max(0, first.start() - width // 3) if first else 0
+    end = min(len(text), start + width)
+
+    snippet = text[start:end].replace("\n", " ")
+    prefix = "..." if start > 0 else ""
+    suffix = "..." if end < len(text) else ""
+    return Markup(prefix) + highlight_terms(snippet, terms) + Markup(suffix)
+
+
+def _terms_pattern(terms: list[str]) -> re.Pattern[str] | None:
+    terms = sorted({t for t in terms if t}, key=len, reverse=True)
+    if not terms:
+        return None
+    return re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
@@ -3,6 +3,12 @@ import smtplib
 from email.mime.text import MIMEText
 from email.utils import formatdate
 
+from src.utils.image_variants import (
+    IMAGE_VARIANT_FORMATS,
+    IMAGE_VARIANT_WIDTHS,
+    image_variant_path,
+    write_variant_manifest,
+)
 from src.worker.celery_app import celery_app
 
 
@@ -32,4 +38,38 @@ def send_email(to_email: str, subject: str, html_body: str) -> dict:
                 pass
         smtp.send_message(msg)
 
-    return {"status": "sent", "to": to_email}
\ No newline at end of file
+    return {"status": "sent", "to": to_email}
+
+
+@celery_app.task(name="process_image")
+def process_image(image_path: str) -> dict:
+    """
+    업로드된 원본 이미지로 여러 폭의 WebP/JPEG 버전을 만듭니다.
+    EXIF 등 메타데이터는 새 파일에 복사하지 않으므로 제거됩니다.
+    원본보다 큰 폭으로는 확대하지 않습니다.
+    끝나면 만든 폭 목록을 기록해 두어, 웹 프로세스가 렌더링할 때 파일을 하나씩 확인하지 않게 합니다.
+    """
+    # Pillow는 워커에서만 필요하므로 함수 안에서 임포트합니다.
+    from PIL import Image, ImageOps
+
+    created: list[str] = []
+    widths: list[int] = []
+    with Image.open(image_path) as original:
+        # 카메라 회전 정보(EXIF Orientation)를 픽셀에 반영한 뒤 메타데이터 없이 저장합니다.
+        image = ImageOps.exif_transpose(original)
+        for width in IMAGE_VARIANT_WIDTHS:
+            if width >= image.width:
+                continue
+            height = round(image.height * width / image.width)
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            for ext, pil_format in IMAGE_VARIANT_FORMATS.items():
+                target = resized
+                if pil_format == "JPEG" and target.mode not in ("RGB", "L"):
+                    target = target.convert("RGB")
+                variant_path = image_variant_path(image_path, width, ext)
+                target.save(variant_path, pil_format, quality=80, optimize=True)
+                created.append(variant_path)
+            widths.append(width)
+
+    write_variant_manifest(image_path, widths)
+    return {"status": "processed", "source": image_path, "variants": created}
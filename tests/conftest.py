@@ -0,0 +1,126 @@
+"""
+테스트 공통 설정입니다.
+
+MySQL/Redis 없이 실행할 수 있도록 src 모듈을 가져오기 전에 SQLite 파일 DB와 fakeredis로 접속 정보를 바꿉니다.
+"""
+
+import os
+import tempfile
+from typing import Any
+
+TEST_DIR = tempfile.mkdtemp(prefix="blog_app_test_")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{TEST_DIR}/primary.db")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/15")
+os.environ.setdefault("IMAGE_UPLOAD_PATH", f"{TEST_DIR}/images")
+# 이미지 정리/검색 인덱스 재구축 같은 주기 작업은 테스트의 쿼리 수를 흔들지 않도록 끕니다.
+os.environ.setdefault("BACKGROUND_TASKS_ENABLED", "false")
+
+from collections.abc import AsyncIterator  # noqa: E402
+from datetime import datetime  # noqa: E402
+
+import fakeredis  # noqa: E402
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from src.utils.db.redis import redis_db  # noqa: E402
+
+# 다른 모듈이 import 시점에 클라이언트를 잡아 두므로 가장 먼저 교체합니다.
+fake_redis_server = fakeredis.FakeServer()
+redis_db.redis = fakeredis.FakeAsyncRedis(
+    server=fake_redis_server, decode_responses=True
+)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def clean_redis() -> None:
+    fakeredis.FakeRedis(server=fake_redis_server).flushall()
+
+
+@pytest.fixture
+async def schema() -> AsyncIterator[None]:
+    from src.model import Base
+    from src.utils.db.db import db
+
+    async with db.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    # aiosqlite 커넥션은 이벤트 루프에 묶이므로 테스트마다 풀을 비웁니다.
+    await db.dispose()
+
+
+@pytest.fixture
+async def session(schema: None) -> AsyncIterator[AsyncSession]:
+    from src.utils.db.db import db
+
+    async with db.async_session_maker() as session:
+        yield session
+
+
+@pytest.fixture
+async def client(schema: None) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    src/main.py와 같은 구성의 앱을 같은 이벤트 루프에서 호출하는 클라이언트입니다.
+    (query_budget이 요청의 SQL을 셀 수 있도록 TestClient 대신 ASGITransport를 사용)
+    """
+    from src.utils.bootstrap import lifespan
+    from src.utils.middewares import add_middlewares
+
+    app = FastAPI(lifespan=lifespan)
+    add_middlewares(app)
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        ) as client:
+            yield client
+
+
+@pytest.fixture
+def make_blog(session: AsyncSession) -> Any:
+    """작성자/태그/댓글이 달린 블로그 글을 만드는 팩토리입니다."""
+    from src.model import Blog, Comment, Tag, User
+
+    users: dict[str, User] = {}
+    tags: dict[str, Tag] = {}
+
+    async def factory(
+        title: str = "제목",
+        *,
+        author: str = "author",
+        modified_dt: datetime | None = None,
+        tag_names: tuple[str, ...] = (),
+        comments: int = 0,
+    ) -> Blog:
+        if author not in users:
+            users[author] = User(
+                name=author, email=f"{author}@example.com", hashed_password="x"
+            )
+        for name in tag_names:
+            tags.setdefault(name, Tag(name=name))
+        blog = Blog(
+            title=title,
+            content=f"{title} 본문",
+            content_html=f"<p>{title} 본문</p>",
+            excerpt=f"{title} 본문",
+            author=users[author],
+            tags=[tags[name] for name in tag_names],
+            comment_count=comments,
+        )
+        if modified_dt is not None:
+            blog.modified_dt = modified_dt
+        blog.comments = [
+            Comment(content=f"댓글 {i}", author=users[author]) for i in range(comments)
+        ]
+        session.add(blog)
+        await session.commit()
+        return blog
+
+    return factory
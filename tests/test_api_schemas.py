@@ -0,0 +1,35 @@
+"""
+FastJSONResponse를 직접 반환하는 JSON API도 OpenAPI 문서에 응답 스키마가 남아 있는지 확인합니다.
+"""
+
+import httpx
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+EXPECTED_SCHEMAS = {
+    "/comments/": {"type": "array", "items": "CommentTreeResponse"},
+    "/comments/page": {"$ref": "CommentPageResponse"},
+    "/comments/{parent_id}/replies": {"$ref": "CommentPageResponse"},
+    "/tags/": {"type": "array", "items": "TagResponse"},
+}
+
+
+def schema_names(schema: dict) -> dict:
+    if schema.get("type") == "array":
+        return {"type": "array", "items": schema["items"]["$ref"].rsplit("/", 1)[-1]}
+    return {"$ref": schema["$ref"].rsplit("/", 1)[-1]}
+
+
+async def test_json_api_responses_are_documented(client: httpx.AsyncClient) -> None:
+    openapi = (await client.get("/openapi.json")).json()
+
+    for path, expected in EXPECTED_SCHEMAS.items():
+        response = openapi["paths"][path]["get"]["responses"]["200"]
+        schema = response["content"]["application/json"]["schema"]
+        assert schema_names(schema) == expected, path
+
+    tree = openapi["components"]["schemas"]["CommentTreeResponse"]
+    assert tree["properties"]["replies"]["items"]["$ref"].endswith(
+        "/CommentTreeResponse"
+    )
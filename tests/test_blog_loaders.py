@@ -0,0 +1,102 @@
+"""
+블로그 목록/상세/태그별 조회가 글 수와 상관없이 정해진 수의 SQL로 끝나는지,
+태그 JOIN으로 행이 곱해지지 않는지(글 하나당 한 행), 배치 로딩한 태그가 올바른 글에 붙는지 확인합니다.
+"""
+
+from typing import Any
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.model.blog.orm import Blog
+from src.model.tag.orm import Tag
+from src.service.blog_svc import BlogService
+from src.service.loaders import BLOG_LOADERS
+from src.utils.db.db import db
+from src.utils.db.stats import query_budget
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def blogs(make_blog: Any) -> None:
+    for i in range(25):
+        await make_blog(
+            f"글 {i}",
+            author=f"author{i % 4}",
+            tag_names=("python", f"tag{i % 3}"),
+            comments=2,
+        )
+
+
+@pytest.fixture
+async def fresh_session(blogs: None) -> Any:
+    # 팩토리가 쓴 세션의 identity map에 걸리지 않도록 새 세션으로 조회합니다.
+    async with db.async_session_maker() as session:
+        yield session
+
+
+async def test_list_page_loads_tags_in_one_batch(fresh_session: AsyncSession) -> None:
+    with query_budget(2) as stats:
+        page = await BlogService().get_all_blogs(fresh_session, None, 10)
+
+    # 목록 한 페이지 + 태그 이름 IN 조회
+    assert stats.statements == 2
+    assert len(page.items) == 10
+    assert len({item.id for item in page.items}) == 10
+    for item in page.items:
+        index = int(item.title.split()[-1])
+        assert item.author_name == f"author{index % 4}"
+        assert item.tag_names == ["python", f"tag{index % 3}"]
+
+
+async def test_detail_loads_author_and_tags_without_row_fanout(
+    fresh_session: AsyncSession,
+) -> None:
+    with query_budget(2) as stats:
+        blog = await BlogService().get_blog_by_id(7, fresh_session)
+
+    # 글 + 작성자 JOIN, 태그 IN 배치 로딩
+    assert stats.statements == 2
+    assert blog.author.name == "author2"
+    assert [tag.name for tag in blog.tags] == ["python", "tag0"]
+
+    # 같은 로딩 전략의 첫 문장은 태그 수와 상관없이 글 한 행만 읽습니다.
+    result = await fresh_session.execute(
+        select(Blog).options(*BLOG_LOADERS).where(Blog.id == 7)
+    )
+    assert len(result.all()) == 1
+
+
+async def test_tag_listing_returns_only_tagged_blogs(
+    fresh_session: AsyncSession,
+) -> None:
+    with query_budget(2) as stats:
+        items = await BlogService().get_blogs_by_tag("tag1", fresh_session)
+
+    assert stats.statements == 2
+    assert sorted(int(item.title.split()[-1]) for item in items) == list(
+        range(1, 25, 3)
+    )
+    assert len({item.id for item in items}) == len(items)
+    for item in items:
+        index = int(item.title.split()[-1])
+        assert item.tag_names == ["python", f"tag{index % 3}"]
+
+
+async def test_list_statements_return_one_row_per_blog(
+    fresh_session: AsyncSession,
+) -> None:
+    service = BlogService()
+    blog_count = await fresh_session.scalar(select(func.count()).select_from(Blog))
+    assert blog_count == 25
+
+    # 글마다 태그가 2개씩 있어도 목록 문장은 글 수만큼의 행만 읽습니다.
+    result = await fresh_session.execute(service._list_item_query())
+    assert len(result.all()) == blog_count
+
+    result = await fresh_session.execute(
+        service._list_item_query().join(Blog.tags).where(Tag.name == "python")
+    )
+    assert len(result.all()) == blog_count
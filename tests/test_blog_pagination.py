@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.service.blog_svc import BlogService
+from src.utils.pagination import decode_cursor, encode_cursor
+
+pytestmark = pytest.mark.anyio
+
+
+async def collect_pages(session: AsyncSession, limit: int) -> list[list[int]]:
+    pages: list[list[int]] = []
+    cursor = None
+    while True:
+        page = await BlogService().get_all_blogs(session, cursor, limit)
+        pages.append([item.id for item in page.items])
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+async def test_pages_split_ties_on_modified_dt_by_id(
+    session: AsyncSession, make_blog: Any
+) -> None:
+    same_time = datetime(2024, 5, 1, 12, 0, 0)
+    # 1~3번은 수정 시각이 같아서 id로만 순서가 정해집니다. 4번이 가장 최근 글입니다.
+    for i in range(3):
+        await make_blog(f"같은 시각 {i}", modified_dt=same_time)
+    await make_blog("최신", modified_dt=same_time + timedelta(minutes=1))
+    await make_blog("가장 오래됨", modified_dt=same_time - timedelta(days=1))
+
+    # 페이지 경계가 같은 시각 묶음 한가운데에 걸려도 빠지거나 겹치는 글이 없어야 합니다.
+    assert await collect_pages(session, limit=2) == [[4, 3], [2, 1], [5]]
+    assert await collect_pages(session, limit=5) == [[4, 3, 2, 1, 5]]
+
+
+async def test_exact_page_size_has_no_next_cursor(
+    session: AsyncSession, make_blog: Any
+) -> None:
+    for i in range(3):
+        await make_blog(f"글 {i}", modified_dt=datetime(2024, 1, 1 + i))
+
+    page = await BlogService().get_all_blogs(session, None, 3)
+    assert [item.id for item in page.items] == [3, 2, 1]
+    assert page.next_cursor is None
+
+
+async def test_empty_table_returns_empty_page(session: AsyncSession) -> None:
+    page = await BlogService().get_all_blogs(session, None, 10)
+    assert page.items == []
+    assert page.next_cursor is None
+
+
+def test_cursor_round_trip() -> None:
+    value = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    assert decode_cursor(encode_cursor(value, 42)) == (value, 42)
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not-a-cursor", "!!!", encode_cursor(datetime(2024, 1, 1), 1)[:-3]]
+)
+def test_tampered_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,161 @@
+"""
+댓글 트리 조립 테스트입니다. 조립은 재귀 없이 한 번의 순회로 끝나야 합니다.
+"""
+
+import datetime
+import json
+import sys
+from typing import Any
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.model import Comment, User
+from src.service.comment_svc import MAX_COMMENT_DEPTH, CommentService
+from src.utils import serializer
+from src.utils.db.stats import query_budget
+
+pytestmark = pytest.mark.anyio
+
+STARTED_AT = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+
+def make_comment(comment_id: int, parent_id: int | None = None) -> Comment:
+    author = User(id=1, name="author", email="author@example.com", hashed_password="x")
+    return Comment(
+        id=comment_id,
+        content=f"댓글 {comment_id}",
+        blog_id=1,
+        author=author,
+        parent_id=parent_id,
+        created_at=STARTED_AT + datetime.timedelta(seconds=comment_id),
+    )
+
+
+def test_replies_keep_creation_order() -> None:
+    comments = [
+        make_comment(1),
+        make_comment(2),
+        make_comment(3, parent_id=1),
+        make_comment(4, parent_id=2),
+        make_comment(5, parent_id=1),
+        make_comment(6, parent_id=3),
+    ]
+
+    tree = CommentService._build_comment_tree(comments)
+
+    assert [node["id"] for node in tree] == [1, 2]
+    assert [node["id"] for node in tree[0]["replies"]] == [3, 5]
+    assert [node["id"] for node in tree[0]["replies"][0]["replies"]] == [6]
+    assert [node["id"] for node in tree[1]["replies"]] == [4]
+    assert tree[0]["created_at"] == comments[0].created_at.isoformat()
+
+
+def tree_depth(nodes: list[dict]) -> int:
+    depth, level = 0, nodes
+    while level:
+        depth += 1
+        level = [reply for node in level for reply in node["replies"]]
+    return depth
+
+
+def count_nodes(nodes: list[dict]) -> int:
+    total, level = 0, nodes
+    while level:
+        total += len(level)
+        level = [reply for node in level for reply in node["replies"]]
+    return total
+
+
+def test_deep_thread_is_capped_at_max_depth() -> None:
+    depth = sys.getrecursionlimit() * 3
+    comments = [make_comment(1)] + [
+        make_comment(i, parent_id=i - 1) for i in range(2, depth + 1)
+    ]
+
+    tree = CommentService._build_comment_tree(comments)
+
+    assert tree_depth(tree) == MAX_COMMENT_DEPTH
+    assert count_nodes(tree) == depth
+    node = tree[0]
+    for expected_id in range(2, MAX_COMMENT_DEPTH):
+        (node,) = node["replies"]
+        assert node["id"] == expected_id
+    # 제한 깊이부터는 같은 조상 아래에 작성순으로 붙고, 원래 부모는 parent_id로 남습니다.
+    flattened = node["replies"]
+    assert [reply["id"] for reply in flattened] == list(
+        range(MAX_COMMENT_DEPTH, depth + 1)
+    )
+    assert all(reply["parent_id"] == reply["id"] - 1 for reply in flattened)
+    assert all(reply["replies"] == [] for reply in flattened)
+    # 표준 json으로도 (재귀 한도 안에서) 직렬화할 수 있어야 합니다.
+    assert json.loads(serializer.dumps(tree)) == json.loads(
+        serializer._stdlib_dumps(tree)
+    )
+
+
+def test_reply_to_missing_parent_is_dropped() -> None:
+    tree = CommentService._build_comment_tree(
+        [make_comment(1), make_comment(2, parent_id=99)]
+    )
+    assert [node["id"] for node in tree] == [1]
+    assert tree[0]["replies"] == []
+
+
+async def test_blog_comments_load_in_one_query(
+    session: AsyncSession, make_blog: Any
+) -> None:
+    blog = await make_blog(comments=3)
+    root_id = blog.comments[0].id
+    session.add_all(
+        Comment(
+            content=f"답글 {i}",
+            blog_id=blog.id,
+            author_id=blog.author_id,
+            parent_id=root_id,
+        )
+        for i in range(5)
+    )
+    await session.commit()
+    session.expunge_all()
+
+    with query_budget(1):
+        tree = await CommentService().get_comments_by_blog_id(blog.id, session)
+
+    assert len(tree) == 3
+    assert len(tree[0]["replies"]) == 5
+
+
+async def test_thousand_level_thread_is_served(
+    client: httpx.AsyncClient, session: AsyncSession, make_blog: Any
+) -> None:
+    blog = await make_blog(comments=1)
+    root_id = blog.comments[0].id
+    depth = 1500
+    session.add_all(
+        Comment(
+            id=root_id + i,
+            content=f"reply {i}",
+            blog_id=blog.id,
+            author_id=blog.author_id,
+            parent_id=root_id + i - 1,
+        )
+        for i in range(1, depth)
+    )
+    await session.commit()
+
+    response = await client.get(f"/comments/?blog_id={blog.id}")
+    assert response.status_code == 200
+    tree = response.json()
+    assert tree_depth(tree) == MAX_COMMENT_DEPTH
+    assert count_nodes(tree) == depth
+
+    response = await client.get(f"/blogs/show/{blog.id}")
+    assert response.status_code == 200
+    # 가장 깊은 답글까지 INITIAL_COMMENTS(tojson)에 들어가야 합니다.
+    assert f'"reply {depth - 1}"' in response.text
+
+    response = await client.get(f"/comments/page?blog_id={blog.id}")
+    assert response.status_code == 200
+    assert response.json()["items"][0]["reply_count"] == 1
@@ -0,0 +1,91 @@
+"""
+리사이즈 버전 목록 테스트입니다. 워커가 처리를 끝내며 목록 파일을 남기고,
+웹 프로세스는 렌더링할 때마다 파일을 확인하지 않고 그 목록을 한 번만 읽어야 합니다.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from src.manager.image_manager import ImageManager
+from src.utils.image_variants import image_variant_manifest_path, write_variant_manifest
+from src.worker.tasks import process_image
+
+
+@pytest.fixture
+def image_path(tmp_path: Path) -> str:
+    path = str(tmp_path / "photo.png")
+    Image.new("RGB", (1000, 500), "white").save(path)
+    return path
+
+
+def test_worker_records_the_widths_it_created(image_path: str) -> None:
+    result = process_image(image_path)
+
+    # 원본(1000px)보다 넓은 1280px 버전은 만들지 않습니다.
+    assert len(result["variants"]) == 4
+    manager = ImageManager()
+    assert manager.variant_widths(image_path) == (320, 640)
+    assert manager.resolve_image_url(image_path, 640).endswith("photo_w640.jpg")
+    assert manager.resolve_image_url(image_path, 1280) == image_path
+    assert manager.resolve_image_srcset(image_path, "webp") == (
+        f"{image_path[:-4]}_w320.webp 320w, {image_path[:-4]}_w640.webp 640w"
+    )
+
+
+def test_rendering_reads_the_manifest_once(
+    image_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    process_image(image_path)
+    manager = ImageManager()
+    manager.resolve_image_srcset(image_path, "jpg")
+
+    def fail(*args: object) -> None:
+        raise AssertionError("렌더링 중에 파일 시스템에 접근했습니다.")
+
+    monkeypatch.setattr(os.path, "exists", fail)
+    monkeypatch.setattr("builtins.open", fail)
+
+    for _ in range(3):
+        assert manager.resolve_image_srcset(image_path, "jpg")
+        assert manager.resolve_image_url(image_path, 320).endswith("photo_w320.jpg")
+
+
+def test_unprocessed_image_is_rechecked_until_the_worker_finishes(
+    image_path: str,
+) -> None:
+    manager = ImageManager()
+    assert manager.resolve_image_url(image_path, 640) == image_path
+    assert manager.resolve_image_srcset(image_path, "jpg") is None
+
+    write_variant_manifest(image_path, [320])
+
+    assert manager.resolve_image_url(image_path, 320).endswith("photo_w320.jpg")
+
+
+def test_removing_files_drops_the_manifest(image_path: str) -> None:
+    process_image(image_path)
+    manager = ImageManager()
+    assert manager.variant_widths(image_path) == (320, 640)
+
+    manager.remove_image_files(image_path)
+
+    assert not os.path.exists(image_variant_manifest_path(image_path))
+    assert manager.variant_widths(image_path) == ()
+
+
+def test_default_image_url_carries_a_fingerprint(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("src/static/images")
+    Image.new("RGB", (10, 10), "white").save("src/static/images/blog_default.png")
+    manager = ImageManager()
+    manager.default_image_path = "src/static/images/blog_default.png"
+
+    url = manager.resolve_image_url(None)
+
+    # 지문이 붙은 URL은 CachedStaticFiles가 immutable로 캐시합니다.
+    assert url.startswith("/src/static/images/blog_default.png?v=")
@@ -0,0 +1,94 @@
+"""
+/internal/metrics 접근 제어 테스트입니다. 토큰을 설정하지 않으면 누구에게도 열리지 않아야 합니다.
+요청 메트릭이 실제 경로가 아닌 라우트 템플릿으로 라벨링되는지도 확인합니다.
+"""
+
+from typing import Any
+
+import httpx
+import pytest
+
+from src.router import internal
+
+pytestmark = pytest.mark.anyio
+
+TOKEN = "scrape-token"
+
+
+async def test_metrics_are_hidden_without_a_configured_token(
+    client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(internal, "INTERNAL_METRICS_TOKEN", "")
+
+    assert (await client.get("/internal/metrics")).status_code == 404
+    response = await client.get("/internal/metrics", headers={"x-internal-token": ""})
+    assert response.status_code == 404
+
+
+async def test_metrics_require_the_matching_token(
+    client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(internal, "INTERNAL_METRICS_TOKEN", TOKEN)
+
+    assert (await client.get("/internal/metrics")).status_code == 404
+    response = await client.get(
+        "/internal/metrics", headers={"x-internal-token": "wrong"}
+    )
+    assert response.status_code == 404
+
+    response = await client.get(
+        "/internal/metrics", headers={"x-internal-token": TOKEN}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE http_requests_total counter" in response.text
+
+
+async def test_non_ascii_token_is_rejected_without_error(
+    client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(internal, "INTERNAL_METRICS_TOKEN", TOKEN)
+
+    response = await client.get(
+        "/internal/metrics", headers={"x-internal-token": "토큰".encode()}
+    )
+    assert response.status_code == 404
+    response = await client.get(
+        "/internal/metrics",
+        headers={"x-internal-token": "tökén".encode("latin-1")},
+    )
+    assert response.status_code == 404
+
+
+async def test_request_metrics_are_labelled_by_route_template(
+    client: httpx.AsyncClient, make_blog: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(internal, "INTERNAL_METRICS_TOKEN", TOKEN)
+    blog = await make_blog("메트릭 글")
+
+    # 상세 페이지는 스트리밍 응답이므로 본문을 다 받은 뒤에 처리 중 요청 수가 줄어야 합니다.
+    assert (await client.get(f"/blogs/show/{blog.id}")).status_code == 200
+    assert (await client.get("/nope/123")).status_code == 404
+
+    response = await client.get(
+        "/internal/metrics", headers={"x-internal-token": TOKEN}
+    )
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+
+    assert any(
+        line.startswith("http_requests_total{")
+        and 'route="/blogs/show/{blog_id}"' in line
+        and 'status="200"' in line
+        for line in lines
+    )
+    assert f'route="/blogs/show/{blog.id}"' not in response.text
+    assert any(
+        line.startswith("http_requests_total{")
+        and 'route="<unmatched>"' in line
+        and 'status="404"' in line
+        for line in lines
+    )
+    assert "/nope/123" not in response.text
+    # 지금 처리 중인 요청은 이 /internal/metrics 요청 하나뿐입니다.
+    assert "http_requests_in_flight 1.0" in lines
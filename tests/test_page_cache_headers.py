@@ -0,0 +1,69 @@
+"""
+페이지 캐시를 쓰는 세 라우트의 응답 헤더 테스트입니다.
+캐시 미스(스트리밍 렌더링)와 캐시 히트가 같은 캐시 관련 헤더를 보내야 합니다.
+"""
+
+from typing import Any
+
+import httpx
+import pytest
+
+from src.manager.session_redis_manager import SessionRedisManager
+
+pytestmark = pytest.mark.anyio
+
+CACHED_ROUTES = ["/blogs/", "/blogs/show/1", "/blogs/tags/python"]
+CACHE_HEADERS = ("etag", "last-modified", "cache-control", "vary")
+
+
+@pytest.fixture
+async def blog(make_blog: Any) -> None:
+    await make_blog("글", tag_names=("python",), comments=2)
+
+
+def cache_headers(response: httpx.Response) -> dict[str, str | None]:
+    return {name: response.headers.get(name) for name in CACHE_HEADERS}
+
+
+def vary_values(response: httpx.Response) -> set[str]:
+    # CORS 미들웨어가 Origin을 덧붙이므로 값 목록으로 비교합니다.
+    return {value.strip() for value in response.headers["vary"].split(",")}
+
+
+@pytest.mark.parametrize("url", CACHED_ROUTES)
+async def test_miss_and_hit_send_the_same_cache_headers(
+    client: httpx.AsyncClient, blog: None, url: str
+) -> None:
+    miss = await client.get(url)
+    hit = await client.get(url)
+
+    assert miss.status_code == hit.status_code == 200
+    assert miss.text == hit.text
+    assert cache_headers(miss) == cache_headers(hit)
+    assert miss.headers["cache-control"] == "private, no-cache"
+    assert "Cookie" in vary_values(miss)
+    assert miss.headers["etag"]
+    assert miss.headers["last-modified"]
+
+    # 첫 응답의 ETag로 재검증하면 캐시된 페이지에 대해 304가 나와야 합니다.
+    revalidated = await client.get(url, headers={"if-none-match": miss.headers["etag"]})
+    assert revalidated.status_code == 304
+
+
+@pytest.mark.parametrize("url", CACHED_ROUTES)
+async def test_logged_in_pages_are_private(
+    client: httpx.AsyncClient, blog: None, url: str
+) -> None:
+    session_id = "logged-in-session"
+    await SessionRedisManager()._set_redis_session(
+        session_id,
+        {"id": 1, "name": "author", "email": "author@example.com"},
+    )
+
+    client.cookies.set("session_id", session_id)
+    response = await client.get(url)
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert "Cookie" in vary_values(response)
+    assert "etag" not in response.headers
@@ -0,0 +1,105 @@
+"""
+로그인 시 재해싱 테스트입니다. 해싱 정책(bcrypt 라운드 수)이 올라가면
+로그인에 성공한 순간 새 정책으로 다시 해싱해 저장해야 합니다.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.manager.password_manager import PasswordManager
+from src.manager.session_redis_manager import SessionRedisManager
+from src.model import User
+from src.service import user_svc
+from src.service.user_svc import UserService
+from src.utils.middewares.session import RedisSession
+
+pytestmark = pytest.mark.anyio
+
+PASSWORD = "correct horse battery staple"
+# 테스트가 느려지지 않도록 bcrypt 최소 라운드(4)부터 사용합니다.
+LEGACY_ROUNDS = 4
+CURRENT_ROUNDS = 5
+
+
+def make_request() -> SimpleNamespace:
+    session = RedisSession(None, SessionRedisManager())
+    return SimpleNamespace(state=SimpleNamespace(session=session, session_user=None))
+
+
+def rounds_of(hashed_password: str) -> int:
+    return int(hashed_password.split("$")[2])
+
+
+@pytest.fixture
+def current_policy(monkeypatch: pytest.MonkeyPatch) -> PasswordManager:
+    manager = PasswordManager(bcrypt_rounds=CURRENT_ROUNDS)
+    monkeypatch.setattr(user_svc, "password_manager", manager)
+    return manager
+
+
+async def add_user(session: AsyncSession, hashed_password: str) -> None:
+    session.add(
+        User(
+            name="author",
+            email="author@example.com",
+            hashed_password=hashed_password,
+            is_email_verified=True,
+        )
+    )
+    await session.commit()
+
+
+async def stored_hash(session: AsyncSession) -> str:
+    session.expunge_all()
+    result = await session.execute(select(User.hashed_password))
+    return result.scalar_one()
+
+
+async def test_login_rehashes_outdated_hash(
+    session: AsyncSession, current_policy: PasswordManager
+) -> None:
+    legacy_hash = PasswordManager(bcrypt_rounds=LEGACY_ROUNDS).hash(PASSWORD)
+    await add_user(session, legacy_hash)
+
+    request = make_request()
+    await UserService().sign_in(request, "author@example.com", PASSWORD, session)
+    await session.commit()
+
+    new_hash = await stored_hash(session)
+    assert new_hash != legacy_hash
+    assert rounds_of(new_hash) == CURRENT_ROUNDS
+    assert current_policy.verify(PASSWORD, new_hash)
+    assert not current_policy.needs_rehash(new_hash)
+    assert request.state.session_user.email == "author@example.com"
+
+
+async def test_login_keeps_hash_that_matches_policy(
+    session: AsyncSession, current_policy: PasswordManager
+) -> None:
+    current_hash = current_policy.hash(PASSWORD)
+    await add_user(session, current_hash)
+
+    await UserService().sign_in(make_request(), "author@example.com", PASSWORD, session)
+    await session.commit()
+
+    assert await stored_hash(session) == current_hash
+
+
+async def test_wrong_password_does_not_rehash(
+    session: AsyncSession, current_policy: PasswordManager
+) -> None:
+    legacy_hash = PasswordManager(bcrypt_rounds=LEGACY_ROUNDS).hash(PASSWORD)
+    await add_user(session, legacy_hash)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await UserService().sign_in(
+            make_request(), "author@example.com", "wrong", session
+        )
+    await session.commit()
+
+    assert exc_info.value.status_code == 400
+    assert await stored_hash(session) == legacy_hash
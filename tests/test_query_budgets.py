@@ -0,0 +1,95 @@
+"""
+라우트별 쿼리 예산 테스트입니다. 예산을 넘으면 반복된 SQL 모양과 함께 실패하므로 N+1 회귀를 잡을 수 있습니다.
+"""
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from sqlalchemy import text
+
+from src.utils.db.db import db
+from src.utils.db.stats import normalize_sql, query_budget
+
+pytestmark = pytest.mark.anyio
+
+# (URL, 허용하는 SQL 문 수). 글이 늘어나도 쿼리 수가 변하지 않아야 합니다.
+ROUTE_BUDGETS = [
+    # 목록 한 페이지 + 태그 이름 일괄 조회
+    ("/blogs/", 2),
+    ("/blogs/tags/python", 2),
+    # 글(작성자 JOIN) + 태그 IN 배치 로딩 + 댓글 한 번
+    ("/blogs/show/1", 3),
+    ("/comments/?blog_id=1", 1),
+    # 최상위 댓글 한 페이지 + 대댓글 수
+    ("/comments/page?blog_id=1", 2),
+    ("/comments/1/replies", 2),
+    ("/tags/?blog_id=1", 1),
+]
+
+
+@pytest.fixture
+async def blogs(make_blog: Any) -> None:
+    for i in range(15):
+        await make_blog(f"글 {i}", tag_names=("python", f"tag{i % 3}"), comments=3)
+
+
+@pytest.mark.parametrize(("url", "budget"), ROUTE_BUDGETS)
+async def test_route_query_budget(
+    client: httpx.AsyncClient, blogs: None, url: str, budget: int
+) -> None:
+    with query_budget(budget) as stats:
+        response = await client.get(url)
+    assert response.status_code == 200
+    assert stats.statements > 0
+
+
+async def test_cached_page_runs_no_query(
+    client: httpx.AsyncClient, blogs: None
+) -> None:
+    await client.get("/blogs/")
+    with query_budget(0):
+        response = await client.get("/blogs/")
+    assert response.status_code == 200
+
+
+async def test_budget_failure_lists_repeated_statements(schema: None) -> None:
+    with pytest.raises(AssertionError) as exc_info:
+        with query_budget(2):
+            async with db.async_session_maker() as session:
+                for blog_id in range(3):
+                    await session.execute(
+                        text("SELECT id FROM blog WHERE id = :id"), {"id": blog_id}
+                    )
+    message = str(exc_info.value)
+    assert "Query budget exceeded: 3 > 2" in message
+    assert "repeated x3: SELECT id FROM blog WHERE id = ?" in message
+
+
+async def test_budget_ignores_queries_from_other_tasks(schema: None) -> None:
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def background_job() -> None:
+        # 예산 블록 밖에서 시작된 작업(주기 작업 등)의 쿼리는 세지 않습니다.
+        started.set()
+        await release.wait()
+        async with db.async_session_maker() as session:
+            await session.execute(text("SELECT 1"))
+
+    task = asyncio.create_task(background_job())
+    await started.wait()
+    with query_budget(1) as stats:
+        release.set()
+        await task
+        async with db.async_session_maker() as session:
+            await session.execute(text("SELECT 2"))
+    assert stats.statements == 1
+
+
+def test_normalize_sql_collapses_literals_and_in_lists() -> None:
+    assert (
+        normalize_sql("SELECT *  FROM tag\n WHERE id IN (?, ?, ?) AND name = 'a''b'")
+        == "SELECT * FROM tag WHERE id IN (...) AND name = ?"
+    )
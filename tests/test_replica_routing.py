@@ -0,0 +1,135 @@
+import time
+from typing import Any
+
+import pytest
+from fastapi import HTTPException, Request
+from sqlalchemy import text
+
+from src.utils.db.db import MysqlDatabase
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeSession:
+    """SessionMiddleware가 request.state.session에 넣어 두는 세션을 흉내 냅니다."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+
+    async def load(self) -> "FakeSession":
+        return self
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+
+def make_request(user_id: int | None = None) -> Request:
+    request = Request({"type": "http", "method": "GET", "headers": []})
+    if user_id is not None:
+        request.state.session = FakeSession({"id": user_id})
+    return request
+
+
+@pytest.fixture
+async def database(tmp_path: Any) -> Any:
+    database = MysqlDatabase(
+        f"sqlite+aiosqlite:///{tmp_path}/primary.db",
+        replica_urls=[f"sqlite+aiosqlite:///{tmp_path}/replica.db"],
+    )
+    yield database
+    await database.dispose()
+
+
+async def open_session(dependency: Any) -> tuple[Any, Any]:
+    generator = dependency
+    session = await generator.__anext__()
+    return generator, session
+
+
+async def close_session(generator: Any) -> None:
+    with pytest.raises(StopAsyncIteration):
+        await generator.__anext__()
+
+
+async def test_anonymous_read_uses_replica(database: MysqlDatabase) -> None:
+    generator, session = await open_session(database.get_read_session(make_request()))
+    assert session.bind is database.replicas[0].engine
+    await close_session(generator)
+
+
+async def test_page_read_uses_primary_for_anonymous(database: MysqlDatabase) -> None:
+    request = make_request()
+    generator, session = await open_session(database.get_page_read_session(request))
+    assert session.bind is database.engine
+    await close_session(generator)
+
+    generator, session = await open_session(
+        database.get_page_read_session(make_request(user_id=1))
+    )
+    assert session.bind is database.replicas[0].engine
+    await close_session(generator)
+
+
+async def test_sticky_user_reads_from_primary(database: MysqlDatabase) -> None:
+    request = make_request(user_id=7)
+    await database.read_your_writes.mark(request)
+
+    generator, session = await open_session(database.get_read_session(request))
+    assert session.bind is database.engine
+    await close_session(generator)
+
+    # 다른 사용자는 영향을 받지 않습니다.
+    generator, session = await open_session(
+        database.get_read_session(make_request(user_id=8))
+    )
+    assert session.bind is database.replicas[0].engine
+    await close_session(generator)
+
+
+async def test_write_marks_user_sticky(database: MysqlDatabase) -> None:
+    request = make_request(user_id=3)
+    generator = database.get_session(request)
+    session = await generator.__anext__()
+    await session.execute(text("CREATE TABLE IF NOT EXISTS t (id INTEGER)"))
+    await session.execute(text("INSERT INTO t (id) VALUES (1)"))
+    # text() 쓰기는 ORM이 감지하지 못하므로 서비스처럼 표시해 둡니다.
+    session.info["has_writes"] = True
+    await close_session(generator)
+
+    assert await database.read_your_writes.is_sticky(request)
+
+
+async def test_failing_replica_is_marked_down(tmp_path: Any) -> None:
+    database = MysqlDatabase(
+        f"sqlite+aiosqlite:///{tmp_path}/primary.db",
+        # 존재하지 않는 디렉터리라 연결할 때 OperationalError가 납니다.
+        replica_urls=[f"sqlite+aiosqlite:///{tmp_path}/missing/replica.db"],
+    )
+    replica = database.replicas[0]
+    try:
+        generator, session = await open_session(
+            database.get_read_session(make_request())
+        )
+        assert session.bind is replica.engine
+        # 서비스 계층처럼 DB 오류를 HTTPException으로 감싸서 던집니다.
+        try:
+            try:
+                await session.execute(text("SELECT 1"))
+            except Exception as e:
+                raise HTTPException(status_code=500, detail="error") from e
+        except HTTPException as wrapped:
+            with pytest.raises(HTTPException):
+                await generator.athrow(wrapped)
+
+        assert replica.down_until > time.monotonic()
+        assert database.pick_replica() is None
+
+        # 복제본이 빠진 동안에는 primary로 읽습니다.
+        generator, session = await open_session(
+            database.get_read_session(make_request())
+        )
+        assert session.bind is database.engine
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
+        await close_session(generator)
+    finally:
+        await database.dispose()
@@ -0,0 +1,62 @@
+from datetime import datetime
+
+import pytest
+
+from src.manager.search_index_manager import (
+    IndexedBlog,
+    SearchIndexManager,
+    tokenize,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def make_doc(blog_id: int, title: str, content: str = "") -> IndexedBlog:
+    return IndexedBlog(
+        id=blog_id,
+        title=title,
+        content=content,
+        author_name="author",
+        modified_dt=datetime(2024, 1, 1),
+    )
+
+
+def test_tokenize_makes_bigrams() -> None:
+    assert tokenize("프로그래밍 a") == ["프로", "로그", "그래", "래밍", "a"]
+
+
+def test_search_ranks_title_matches_first() -> None:
+    index = SearchIndexManager()
+    index.replace_all(
+        [
+            make_doc(1, "일기", "파이썬 이야기"),
+            make_doc(2, "파이썬 입문"),
+            make_doc(3, "자바 입문"),
+        ]
+    )
+    results, has_next = index.search("파이썬")
+    assert [doc.id for doc, _ in results] == [2, 1]
+    assert not has_next
+
+
+async def test_changes_during_rebuild_are_replayed() -> None:
+    index = SearchIndexManager()
+    index.replace_all([make_doc(1, "파이썬"), make_doc(2, "파이썬 자바")])
+
+    index.begin_rebuild()
+    # 재구축용 문서를 읽은 시점의 스냅샷 (아직 3번 글이 없고 2번 글이 남아 있음)
+    snapshot = [make_doc(1, "파이썬"), make_doc(2, "파이썬 자바")]
+    await index.upsert(make_doc(3, "파이썬 장고"))
+    await index.remove(2)
+    state = SearchIndexManager.build_state(snapshot)
+    # 교체 전까지는 기존 인덱스에도 갱신이 반영되어 있습니다.
+    assert {doc.id for doc, _ in index.search("파이썬")[0]} == {1, 3}
+
+    index.finish_rebuild(state)
+    assert {doc.id for doc, _ in index.search("파이썬")[0]} == {1, 3}
+    assert len(index) == 2
+
+    # 재구축이 끝난 뒤의 갱신은 더 이상 기록하지 않습니다.
+    await index.remove(3)
+    assert index._pending is None
+    assert {doc.id for doc, _ in index.search("파이썬")[0]} == {1}
@@ -0,0 +1,157 @@
+"""
+세션 미들웨어 테스트입니다. 세션을 건드리지 않는 요청은 Redis에 가지 않고,
+바뀐 세션만 저장하며 Set-Cookie는 한 번만 붙어야 합니다.
+"""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from src.manager.session_redis_manager import SessionRedisManager
+from src.utils.db.redis import redis_db
+from src.utils.middewares.session import SessionMiddleware
+
+pytestmark = pytest.mark.anyio
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware)
+
+    @app.get("/public")
+    async def public() -> dict:
+        return {}
+
+    @app.get("/whoami")
+    async def whoami(request: Request) -> dict:
+        session = await request.state.session.load()
+        return session.to_dict()
+
+    @app.get("/unloaded")
+    async def unloaded(request: Request) -> dict:
+        return {"name": request.state.session.get("name")}
+
+    @app.post("/login")
+    async def login(request: Request) -> dict:
+        request.state.session.replace({"user_id": 1, "name": "author"})
+        return {}
+
+    @app.post("/rename")
+    async def rename(request: Request) -> dict:
+        session = await request.state.session.load()
+        session["name"] = "renamed"
+        return {}
+
+    @app.post("/logout")
+    async def logout(request: Request) -> dict:
+        request.state.session.clear()
+        return {}
+
+    return app
+
+
+@pytest.fixture
+def redis_reads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    reads: list[str] = []
+    original = SessionRedisManager._get_redis_session
+
+    async def counting(self: SessionRedisManager, session_id: str) -> Any:
+        reads.append(session_id)
+        return await original(self, session_id)
+
+    monkeypatch.setattr(SessionRedisManager, "_get_redis_session", counting)
+    return reads
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as client:
+        yield client
+
+
+async def login(client: httpx.AsyncClient) -> str:
+    response = await client.post("/login")
+    return response.cookies["session_id"]
+
+
+async def test_untouched_session_skips_redis_and_cookie(
+    client: httpx.AsyncClient, redis_reads: list[str]
+) -> None:
+    await login(client)
+
+    response = await client.get("/public")
+
+    assert response.status_code == 200
+    assert redis_reads == []
+    assert "set-cookie" not in response.headers
+
+
+async def test_login_writes_once_without_reading(
+    client: httpx.AsyncClient, redis_reads: list[str]
+) -> None:
+    response = await client.post("/login")
+
+    assert redis_reads == []
+    assert len(response.headers.get_list("set-cookie")) == 1
+    session_id = response.cookies["session_id"]
+    assert await redis_db.get_client().exists(f"session:{session_id}")
+
+
+async def test_read_only_request_loads_once_and_sets_no_cookie(
+    client: httpx.AsyncClient, redis_reads: list[str]
+) -> None:
+    session_id = await login(client)
+
+    response = await client.get("/whoami")
+
+    assert response.json() == {"user_id": 1, "name": "author"}
+    assert redis_reads == [session_id]
+    assert "set-cookie" not in response.headers
+
+
+async def test_modified_session_is_saved_with_a_single_cookie(
+    client: httpx.AsyncClient, redis_reads: list[str]
+) -> None:
+    session_id = await login(client)
+
+    response = await client.post("/rename")
+
+    assert redis_reads == [session_id]
+    assert len(response.headers.get_list("set-cookie")) == 1
+    assert response.cookies["session_id"] == session_id
+    assert (await client.get("/whoami")).json()["name"] == "renamed"
+
+
+async def test_logout_deletes_session_and_expires_cookie(
+    client: httpx.AsyncClient,
+) -> None:
+    session_id = await login(client)
+
+    response = await client.post("/logout")
+
+    (cookie,) = response.headers.get_list("set-cookie")
+    assert cookie.startswith("session_id=;")
+    assert "Max-Age=0" in cookie
+    assert not await redis_db.get_client().exists(f"session:{session_id}")
+
+
+async def test_reading_before_load_is_an_error(client: httpx.AsyncClient) -> None:
+    await login(client)
+
+    with pytest.raises(RuntimeError):
+        await client.get("/unloaded")
+
+
+async def test_request_without_cookie_needs_no_load(
+    client: httpx.AsyncClient, redis_reads: list[str]
+) -> None:
+    response = await client.get("/unloaded")
+
+    assert response.json() == {"name": None}
+    assert redis_reads == []